@@ -10,12 +10,13 @@ import param
 
 from ..dimension import redim
 from ..util import dimension_range, unique_iterator
-from .interface import Interface, iloc, ndloc
+from .interface import Interface, ColumnBuffers, ColumnStatistics, iloc, ndloc
 from .array import ArrayInterface
 from .dictionary import DictInterface
 from .grid import GridInterface
 from .multipath import MultiInterface         # noqa (API import)
 from .image import ImageInterface             # noqa (API import)
+from .columnstore import ColumnStore, ColumnStoreInterface # noqa (API import)
 
 datatypes = ['dictionary', 'grid']
 
@@ -53,8 +54,15 @@ try:
 except ImportError:
     pass
 
+try:
+    from .arrow import ArrowInterface   # noqa (Conditional API import)
+    datatypes.append('arrow')
+except ImportError:
+    pass
+
 if 'array' not in datatypes:
     datatypes.append('array')
+datatypes.append('columnstore')
 
 from ..dimension import Dimension, process_dimensions
 from ..element import Element
@@ -200,6 +208,8 @@ class Dataset(Element):
         self.interface.validate(self, validate_vdims)
 
         self.redim = redim(self, mode='dataset')
+        self._stats = None
+        self._buffers = None
 
 
     def closest(self, coords=[], **kwargs):
@@ -252,7 +262,7 @@ class Dataset(Element):
         elif all(v is not None and np.isfinite(v) for v in dim.range):
             return dim.range
         elif dim in self.dimensions() and data_range and len(self):
-            lower, upper = self.interface.range(self, dim)
+            lower, upper = self.stats.range(dim)
         else:
             lower, upper = (np.NaN, np.NaN)
         return dimension_range(lower, upper, dim)
@@ -289,6 +299,30 @@ class Dataset(Element):
         return self.clone(data, **dimensions)
 
 
+    def append(self, data):
+        """
+        Appends the supplied rows to the Dataset in place. The rows
+        may be supplied in any format the Dataset constructor accepts
+        (e.g. a dictionary of columns, a tuple of arrays, a DataFrame
+        or another Dataset) and must declare the same dimensions.
+
+        The dictionary interface and DataFrames holding only the
+        dimension columns with a default index accumulate the columns
+        in growable buffers, so that the cost of appending is
+        proportional to the number of appended rows rather than the
+        total length of the Dataset. Other DataFrames are copied when
+        appending. Cached ranges, NaN counts and sortedness are
+        updated from the appended rows.
+        """
+        rows = self.clone(data, datatype=['dictionary'])
+        if getattr(self, '_buffers', None) is None:
+            self._buffers = ColumnBuffers()
+        appended = self.interface.append(self, rows, self._buffers)
+        stats = self.stats
+        self.data = self._buffers.data = appended
+        self._stats = stats.extend(rows)
+
+
     def select(self, selection_specs=None, **selection):
         """
         Allows selecting data by the slices, sets and scalar values
@@ -501,7 +535,7 @@ class Dataset(Element):
 
 
     def groupby(self, dimensions=[], container_type=HoloMap, group_type=None,
-                dynamic=False, **kwargs):
+                dynamic=False, lazy=False, **kwargs):
         """Return the results of a groupby operation over the specified
         dimensions as an object of type container_type (expected to be
         dictionary-like).
@@ -514,6 +548,14 @@ class Dataset(Element):
         a DynamicMap, allowing dynamic exploration of large
         datasets. If the data does not represent a full cartesian grid
         of the requested dimensions some Elements will be empty.
+
+        If lazy is requested the rows are partitioned into groups once
+        up front but the group Elements are only constructed when they
+        are accessed. Like the dynamic mode a DynamicMap is returned,
+        which keeps at most cache_size of the materialized groups.
+        A DynamicMap subclass may be supplied as the container_type,
+        while other containers which cannot defer loading their items
+        (e.g. an NdLayout) are populated eagerly.
         """
         if not isinstance(dimensions, list): dimensions = [dimensions]
         if not len(dimensions): dimensions = self.dimensions('key', True)
@@ -522,15 +564,33 @@ class Dataset(Element):
         dimensions = [self.get_dimension(d, strict=True) for d in dimensions]
         dim_names = [d.name for d in dimensions]
 
-        if dynamic:
+        if lazy and not issubclass(container_type, HoloMap):
+            # Containers which cannot defer loading are populated eagerly
+            lazy = False
+
+        if dynamic or lazy:
             group_dims = [d.name for d in self.kdims if d not in dimensions]
             kdims = [self.get_dimension(d) for d in group_dims]
             group_kwargs = dict(util.get_param_values(self), kdims=kdims)
             group_kwargs.update(kwargs)
             drop_dim = len(kdims) != len(group_kwargs['kdims'])
+
+            # Compute the row partitions for each group once
+            partitions = None
+            if lazy and not (self.interface.gridded or self.interface.multi):
+                keys, order, slices = util.group_partitions([self.dimension_values(d)
+                                                             for d in dimensions])
+                partitions = {util.group_key(key): order[slc]
+                              for key, slc in zip(keys, slices)}
+
             def load_subset(*args):
-                constraint = dict(zip(dim_names, args))
-                group = self.select(**constraint)
+                rows = None if partitions is None else partitions.get(util.group_key(args))
+                if rows is None:
+                    # Keys without a partition may still match via select
+                    constraint = dict(zip(dim_names, args))
+                    group = self.select(**constraint)
+                else:
+                    group = self.iloc[rows]
                 if np.isscalar(group):
                     return group_type(([group],), group=self.group,
                                       label=self.label, vdims=self.vdims)
@@ -540,7 +600,8 @@ class Dataset(Element):
                 return group_type(data, **group_kwargs)
             dynamic_dims = [d(values=list(self.interface.values(self, d.name, False)))
                             for d in dimensions]
-            return DynamicMap(load_subset, kdims=dynamic_dims)
+            dmap_type = container_type if issubclass(container_type, DynamicMap) else DynamicMap
+            return dmap_type(load_subset, kdims=dynamic_dims)
 
         return self.interface.groupby(self, dim_names, container_type,
                                       group_type, **kwargs)
@@ -623,7 +684,36 @@ class Dataset(Element):
         if 'datatype' not in overrides:
             datatypes = [self.interface.datatype] + self.datatype
             overrides['datatype'] = list(unique_iterator(datatypes))
-        return super(Dataset, self).clone(data, shared_data, new_type, *args, **overrides)
+        shared = data is None and shared_data
+        cloned = super(Dataset, self).clone(data, shared_data, new_type, *args, **overrides)
+        if shared and isinstance(cloned, Dataset) and cloned.data is self.data:
+            cloned._stats = ColumnStatistics(cloned, self.stats._columns)
+        return cloned
+
+
+    @property
+    def stats(self):
+        """
+        Returns a ColumnStatistics object caching the range, number of
+        unique values, number of NaNs and sortedness of each column.
+        The statistics are computed lazily, shared with clones of the
+        Dataset which share the same data and discarded when a column
+        or the data object is replaced.
+
+        Examples:
+
+        * Get the cached range of a column:
+
+            dataset.stats.range('x')
+
+        * Check whether a column is sorted:
+
+            dataset.stats.is_sorted('x')
+        """
+        stats = getattr(self, '_stats', None)
+        if stats is None or stats.dataset is not self or stats.data is not self.data:
+            stats = self._stats = ColumnStatistics(self)
+        return stats
 
 
     @property
@@ -155,15 +155,9 @@ class ArrayInterface(Interface):
                  if kdim not in dimensions]
         vdims = dataset.vdims
 
-        # Find unique entries along supplied dimensions
-        # by creating a view that treats the selected
-        # groupby keys as a single object.
-        indices = data[:, dim_idxs].copy()
-        group_shape = indices.dtype.itemsize * indices.shape[1]
-        view = indices.view(np.dtype((np.void, group_shape)))
-        _, idx = np.unique(view, return_index=True)
-        idx.sort()
-        unique_indices = indices[idx]
+        # Partition the rows into contiguous groups along the
+        # supplied dimensions
+        keys, order, slices = util.group_partitions([data[:, i] for i in dim_idxs])
 
         # Get group
         group_kwargs = {}
@@ -172,22 +166,21 @@ class ArrayInterface(Interface):
             group_kwargs['kdims'] = kdims
         group_kwargs.update(kwargs)
 
-        # Iterate over the unique entries building masks
-        # to apply the group selection
+        # Reorder the data once and slice out the contiguous run of
+        # rows for each group
         grouped_data = []
         col_idxs = [dataset.get_dimension_index(d) for d in dataset.dimensions()
                     if d not in dimensions]
-        for group in unique_indices:
-            mask = np.logical_and.reduce([data[:, d_idx] == group[i]
-                                          for i, d_idx in enumerate(dim_idxs)])
-            group_data = data[mask][:, col_idxs]
+        sorted_data = data[order][:, col_idxs]
+        for group, slc in zip(keys, slices):
+            group_data = sorted_data[slc]
             if not group_type == 'raw':
                 if issubclass(group_type, dict):
                     group_data = {d.name: group_data[:, i] for i, d in
                                   enumerate(kdims+vdims)}
                 else:
                     group_data = group_type(group_data, **group_kwargs)
-            grouped_data.append((tuple(group), group_data))
+            grouped_data.append((group, group_data))
 
         if issubclass(container_type, NdMapping):
             with item_check(False):
@@ -199,7 +192,10 @@ class ArrayInterface(Interface):
     @classmethod
     def select(cls, dataset, selection_mask=None, **selection):
         if selection_mask is None:
-            selection_mask = cls.select_mask(dataset, selection)
+            # Sorted key dimensions may be selected as a contiguous slice
+            selection_mask = cls.select_slice(dataset, selection)
+        if selection_mask is None:
+            selection_mask = cls.select_mask(dataset, selection, sorted_slice=False)
         indexed = cls.indexed(dataset, selection)
         data = np.atleast_2d(dataset.data[selection_mask, :])
         if len(data) == 1 and indexed and len(dataset.vdims) == 1:
@@ -209,16 +205,7 @@ class ArrayInterface(Interface):
 
     @classmethod
     def sample(cls, dataset, samples=[]):
-        data = dataset.data
-        mask = False
-        for sample in samples:
-            sample_mask = True
-            if np.isscalar(sample): sample = [sample]
-            for i, v in enumerate(sample):
-                sample_mask &= data[:, i]==v
-            mask |= sample_mask
-
-        return data[mask]
+        return dataset.data[cls.sample_indices(dataset, samples)]
 
 
     @classmethod
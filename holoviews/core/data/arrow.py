@@ -0,0 +1,340 @@
+from __future__ import absolute_import
+
+try:
+    import itertools.izip as zip
+except ImportError:
+    pass
+
+import numpy as np
+import pyarrow as pa
+
+try:
+    import pyarrow.compute as pc
+except ImportError:
+    pc = None
+
+from .interface import Interface, DataError
+from .dictionary import DictInterface
+from ..dimension import Dimension
+from ..element import Element
+from ..ndmapping import NdMapping, item_check, OrderedDict
+from .. import util
+
+
+class ArrowInterface(Interface):
+    """
+    The ArrowInterface allows a Dataset object to wrap a pyarrow
+    Table. Columns are kept in the Arrow memory format and wherever
+    the column types allow it, the values are exposed as zero-copy
+    NumPy views onto the Arrow buffers, which avoids the cost of
+    converting Arrow or Parquet sourced tables to pandas.
+
+    Selections, sorting, grouping and row indexing are applied
+    directly to the Table using Arrow filter, take and zero-copy
+    slice operations.
+    """
+
+    types = (pa.Table,)
+
+    datatype = 'arrow'
+
+    @classmethod
+    def dimension_type(cls, dataset, dim):
+        return cls.values(dataset, dim).dtype.type
+
+
+    @classmethod
+    def init(cls, eltype, data, kdims, vdims):
+        element_params = eltype.params()
+        kdim_param = element_params['kdims']
+        vdim_param = element_params['vdims']
+
+        if util.pd and isinstance(data, util.pd.DataFrame):
+            data = pa.Table.from_pandas(data, preserve_index=False)
+        elif not isinstance(data, pa.Table):
+            data, dims, _ = DictInterface.init(eltype, data, kdims, vdims)
+            kdims, vdims = dims['kdims'], dims['vdims']
+            return cls._from_columns(data), {'kdims': kdims, 'vdims': vdims}, {}
+
+        columns = data.column_names
+        if isinstance(kdim_param.bounds[1], int):
+            ndim = min([kdim_param.bounds[1], len(kdim_param.default)])
+        else:
+            ndim = None
+        nvdim = vdim_param.bounds[1] if isinstance(vdim_param.bounds[1], int) else None
+        if kdims and vdims is None:
+            vdims = [c for c in columns if c not in kdims]
+        elif vdims and kdims is None:
+            kdims = [c for c in columns if c not in vdims][:ndim]
+        elif kdims is None:
+            kdims = list(columns[:ndim])
+            if vdims is None:
+                vdims = [d for d in columns[ndim:((ndim+nvdim) if nvdim else None)]
+                         if d not in kdims]
+        elif kdims == [] and vdims is None:
+            vdims = list(columns[:nvdim if nvdim else None])
+        return data, {'kdims': kdims, 'vdims': vdims}, {}
+
+
+    @classmethod
+    def validate(cls, dataset, vdims=True):
+        dim_types = 'all' if vdims else 'key'
+        dimensions = dataset.dimensions(dim_types, label='name')
+        not_found = [d for d in dimensions if d not in dataset.data.column_names]
+        if not_found:
+            raise DataError("Supplied data does not contain specified "
+                            "dimensions, the following dimensions were "
+                            "not found: %s" % repr(not_found), cls)
+
+
+    @classmethod
+    def _from_columns(cls, columns):
+        """
+        Constructs a pyarrow Table from a dictionary of columns,
+        expanding any scalar columns.
+        """
+        length = max([len(v) for v in columns.values() if not np.isscalar(v)] or [1])
+        arrays = [pa.array(np.full(length, v) if np.isscalar(v) else np.asarray(v))
+                  for v in columns.values()]
+        return pa.Table.from_arrays(arrays, names=[str(c) for c in columns])
+
+
+    @classmethod
+    def _to_numpy(cls, column):
+        """
+        Converts a pyarrow ChunkedArray to a NumPy array, returning a
+        zero-copy view onto the Arrow buffer where the type allows it.
+        """
+        if column.num_chunks == 1:
+            try:
+                return column.chunk(0).to_numpy(zero_copy_only=True)
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError, NotImplementedError):
+                pass
+        return column.to_numpy()
+
+
+    @classmethod
+    def _select_columns(cls, table, names):
+        return pa.Table.from_arrays([table.column(n) for n in names], names=names)
+
+
+    @classmethod
+    def isscalar(cls, dataset, dim):
+        return len(cls.values(dataset, dim, expanded=False)) == 1
+
+
+    @classmethod
+    def shape(cls, dataset):
+        return (dataset.data.num_rows, dataset.data.num_columns)
+
+
+    @classmethod
+    def length(cls, dataset):
+        return dataset.data.num_rows
+
+
+    @classmethod
+    def values(cls, dataset, dim, expanded=True, flat=True):
+        dim = dataset.get_dimension(dim, strict=True)
+        values = cls._to_numpy(dataset.data.column(dim.name))
+        if not expanded:
+            return util.unique_array(values)
+        return values
+
+
+    @classmethod
+    def range(cls, dataset, dimension):
+        dim = dataset.get_dimension(dimension, strict=True)
+        column = dataset.data.column(dim.name)
+        if pc is not None and (pa.types.is_integer(column.type) or
+                               pa.types.is_floating(column.type)):
+            if column.null_count == len(column):
+                return np.NaN, np.NaN
+            minmax = pc.min_max(column)
+            return minmax['min'].as_py(), minmax['max'].as_py()
+        return super(ArrowInterface, cls).range(dataset, dimension)
+
+
+    @classmethod
+    def array(cls, dataset, dimensions):
+        if not dimensions:
+            dimensions = dataset.dimensions(label='name')
+        else:
+            dimensions = [dataset.get_dimension(d, strict=True).name for d in dimensions]
+        return np.column_stack([cls.values(dataset, d) for d in dimensions])
+
+
+    @classmethod
+    def dframe(cls, dataset, dimensions):
+        table = dataset.data
+        if dimensions:
+            table = cls._select_columns(table, dimensions)
+        return table.to_pandas()
+
+
+    @classmethod
+    def add_dimension(cls, dataset, dimension, dim_pos, values, vdim):
+        dim = dimension.name if isinstance(dimension, Dimension) else dimension
+        if dim in dataset.data.column_names:
+            return dataset.data
+        if np.isscalar(values):
+            values = np.full(len(dataset), values)
+        return dataset.data.add_column(dim_pos, dim, pa.array(np.asarray(values)))
+
+
+    @classmethod
+    def redim(cls, dataset, dimensions):
+        names = [dimensions[n].name if n in dimensions else n
+                 for n in dataset.data.column_names]
+        return pa.Table.from_arrays(dataset.data.columns, names=names)
+
+
+    @classmethod
+    def reindex(cls, dataset, kdims=None, vdims=None):
+        names = [dataset.get_dimension(d, strict=True).name for d in kdims+vdims]
+        return cls._select_columns(dataset.data, names)
+
+
+    @classmethod
+    def concat(cls, dataset_objs):
+        cast_objs = cls.cast(dataset_objs)
+        return pa.concat_tables([obj.data for obj in cast_objs])
+
+
+    @classmethod
+    def sort(cls, dataset, by=[], reverse=False):
+        by = [dataset.get_dimension(d, strict=True).name for d in by]
+        if len(by) == 1:
+            sorting = cls.values(dataset, by[0]).argsort(kind='mergesort')
+        else:
+            sorting = util.arglexsort([cls.values(dataset, d) for d in by])
+        if reverse:
+            sorting = sorting[::-1]
+        return dataset.data.take(pa.array(sorting))
+
+
+    @classmethod
+    def select(cls, dataset, selection_mask=None, **selection):
+        table = dataset.data
+        if selection_mask is None:
+            # Sorted key dimensions may be selected as a zero-copy slice
+            selection_mask = cls.select_slice(dataset, selection)
+        if selection_mask is None:
+            selection_mask = cls.select_mask(dataset, selection, sorted_slice=False)
+        indexed = cls.indexed(dataset, selection)
+        if isinstance(selection_mask, slice):
+            start, stop, _ = selection_mask.indices(table.num_rows)
+            table = table.slice(start, max(stop-start, 0))
+        else:
+            table = table.filter(pa.array(np.asarray(selection_mask, dtype=bool)))
+        if indexed and table.num_rows == 1 and len(dataset.vdims) == 1:
+            return cls._to_numpy(table.column(dataset.vdims[0].name))[0]
+        return table
+
+
+    @classmethod
+    def groupby(cls, dataset, dimensions, container_type, group_type, **kwargs):
+        # Get dimensions information
+        dimensions = [dataset.get_dimension(d, strict=True) for d in dimensions]
+        kdims = [kdim for kdim in dataset.kdims if kdim not in dimensions]
+        vdims = dataset.vdims
+
+        # Update the kwargs appropriately for Element group types
+        group_kwargs = {}
+        group_type = dict if group_type == 'raw' else group_type
+        if issubclass(group_type, Element):
+            group_kwargs.update(util.get_param_values(dataset))
+            group_kwargs['kdims'] = kdims
+        group_kwargs.update(kwargs)
+
+        # Reorder the table once so each group is a contiguous run of
+        # rows which can be sliced out without copying
+        keys, order, slices = util.group_partitions([cls.values(dataset, d)
+                                                     for d in dimensions])
+        table = cls._select_columns(dataset.data, [d.name for d in kdims+vdims])
+        if not isinstance(order, slice):
+            table = table.take(pa.array(order))
+
+        grouped_data = []
+        for unique_key, slc in zip(keys, slices):
+            start, stop, _ = slc.indices(table.num_rows)
+            group_data = table.slice(start, stop-start)
+            if issubclass(group_type, dict):
+                group_data = OrderedDict((n, cls._to_numpy(group_data.column(n)))
+                                         for n in group_data.column_names)
+            group_data = group_type(group_data, **group_kwargs)
+            grouped_data.append((unique_key, group_data))
+
+        if issubclass(container_type, NdMapping):
+            with item_check(False):
+                return container_type(grouped_data, kdims=dimensions)
+        else:
+            return container_type(grouped_data)
+
+
+    @classmethod
+    def aggregate(cls, dataset, kdims, function, **kwargs):
+        kdims = [dataset.get_dimension(d, strict=True).name for d in kdims]
+        vdims = dataset.dimensions('value', label='name')
+        keys, order, slices = util.group_partitions([cls.values(dataset, d)
+                                                     for d in kdims])
+        aggregated = OrderedDict([(k, [v[i] for v in keys]) for i, k in enumerate(kdims)])
+        for vdim in vdims:
+            values = cls.values(dataset, vdim)[order]
+            reduced = []
+            for slc in slices:
+                if isinstance(function, np.ufunc):
+                    reduced.append(function.reduce(values[slc], **kwargs))
+                else:
+                    reduced.append(function(values[slc], **kwargs))
+            aggregated[vdim] = reduced
+        return cls._from_columns(aggregated)
+
+
+    @classmethod
+    def sample(cls, dataset, samples=[]):
+        return dataset.data.take(pa.array(cls.sample_indices(dataset, samples)))
+
+
+    @classmethod
+    def unpack_scalar(cls, dataset, data):
+        """
+        Given a dataset object and data in the appropriate format for
+        the interface, return a simple scalar.
+        """
+        if data.num_columns != 1 or data.num_rows != 1:
+            return data
+        return cls._to_numpy(data.column(0))[0]
+
+
+    @classmethod
+    def iloc(cls, dataset, index):
+        rows, cols = index
+        scalar = False
+        if isinstance(cols, slice):
+            cols = [d.name for d in dataset.dimensions()][cols]
+        elif np.isscalar(cols):
+            scalar = np.isscalar(rows)
+            cols = [dataset.get_dimension(cols, strict=True).name]
+        else:
+            cols = [dataset.get_dimension(d, strict=True).name for d in cols]
+
+        table = cls._select_columns(dataset.data, cols)
+        if scalar:
+            return cls._to_numpy(table.column(0).slice(int(rows), 1))[0]
+        elif np.isscalar(rows):
+            rows = [rows]
+
+        if isinstance(rows, slice):
+            start, stop, step = rows.indices(table.num_rows)
+            if step == 1:
+                return table.slice(start, max(stop-start, 0))
+            rows = np.arange(start, stop, step)
+        rows = np.asarray(rows)
+        if rows.dtype.kind == 'b':
+            return table.filter(pa.array(rows))
+        rows = np.where(rows < 0, rows+table.num_rows, rows)
+        return table.take(pa.array(rows))
+
+
+Interface.register(ArrowInterface)
@@ -0,0 +1,204 @@
+import os
+import json
+
+try:
+    import itertools.izip as zip
+except ImportError:
+    pass
+
+import numpy as np
+
+from .interface import Interface, DataError, DataTypeError
+from .dictionary import DictInterface
+from ..element import Element
+from ..ndmapping import NdMapping, item_check, OrderedDict
+from .. import util
+
+
+class ColumnStore(object):
+    """
+    ColumnStore is a read-only mapping between column names and
+    memory-mapped arrays backed by a directory of .npy files, one per
+    column. Alongside the columns a JSON metadata file records the
+    column order, the key and value dimensions and the range of each
+    column, so that ranges are available without scanning the data.
+
+    A ColumnStore for any Dataset may be written to disk using the
+    ColumnStore.write classmethod and loaded by supplying the
+    directory path to the constructor, e.g.:
+
+        store = ColumnStore.write(dataset, '/data/telemetry')
+        ds = Dataset(ColumnStore('/data/telemetry'))
+    """
+
+    metadata_file = 'columns.json'
+
+    def __init__(self, path, mmap_mode='r'):
+        self.path = path
+        with open(os.path.join(path, self.metadata_file)) as f:
+            self.metadata = json.load(f)
+        self._columns = OrderedDict()
+        for name, spec in zip(self.metadata['columns'], self.metadata['files']):
+            self._columns[name] = np.load(os.path.join(path, spec), mmap_mode=mmap_mode)
+
+    @classmethod
+    def _encode(cls, value):
+        if isinstance(value, util.datetime_types+util.timedelta_types) or isinstance(value, util.basestring):
+            return str(value)
+        elif isinstance(value, np.generic):
+            value = value.item()
+        return None if util.is_nan(value) else value
+
+    @classmethod
+    def write(cls, dataset, path):
+        """
+        Writes the columns of the supplied Dataset to the directory
+        at the supplied path, storing each column as an individual
+        .npy file alongside the metadata, returning a ColumnStore
+        wrapping the written data. Object columns are stored as
+        fixed width strings since they cannot be memory-mapped.
+        """
+        if not os.path.isdir(path):
+            os.makedirs(path)
+        names, files, ranges = [], [], {}
+        for i, dim in enumerate(dataset.dimensions()):
+            values = dataset.dimension_values(dim)
+            if values.dtype.kind == 'O':
+                values = values.astype('U')
+            filename = 'column_%d.npy' % i
+            np.save(os.path.join(path, filename), values)
+            names.append(dim.name)
+            files.append(filename)
+            try:
+                lower, upper = dataset.interface.range(dataset, dim)
+            except Exception:
+                continue
+            ranges[dim.name] = [cls._encode(lower), cls._encode(upper)]
+        metadata = dict(columns=names, files=files, ranges=ranges,
+                        kdims=[d.name for d in dataset.kdims],
+                        vdims=[d.name for d in dataset.vdims])
+        with open(os.path.join(path, cls.metadata_file), 'w') as f:
+            json.dump(metadata, f)
+        return cls(path)
+
+    def range(self, name):
+        """
+        Returns the stored range of the named column, decoded to the
+        column dtype, or None if no range was stored.
+        """
+        if name not in self.metadata['ranges']:
+            return None
+        dtype = self._columns[name].dtype
+        lower, upper = self.metadata['ranges'][name]
+        if lower is None or upper is None:
+            return np.NaN, np.NaN
+        elif dtype.kind in 'SUMm':
+            return tuple(np.array([lower, upper]).astype(dtype))
+        return lower, upper
+
+    def __getitem__(self, key):
+        return self._columns[key]
+
+    def __contains__(self, key):
+        return key in self._columns
+
+    def __iter__(self):
+        return iter(self._columns)
+
+    def __len__(self):
+        return len(self._columns)
+
+    def get(self, key, default=None):
+        return self._columns.get(key, default)
+
+    def keys(self):
+        return self._columns.keys()
+
+    def values(self):
+        return self._columns.values()
+
+    def items(self):
+        return self._columns.items()
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, self.path)
+
+
+
+class ColumnStoreInterface(DictInterface):
+    """
+    Interface for on-disk datasets stored in a ColumnStore, which
+    memory-maps each column so that datasets larger than memory can
+    be explored. Selections, sampling and groupby operations index
+    directly into the memory-mapped buffers and only load the selected
+    rows into memory, returning in-memory (dictionary) data. Ranges
+    are read from the metadata stored alongside the columns.
+    """
+
+    types = (ColumnStore,)
+
+    datatype = 'columnstore'
+
+    @classmethod
+    def init(cls, eltype, data, kdims, vdims):
+        if not isinstance(data, ColumnStore):
+            raise DataTypeError('ColumnStoreInterface only supports ColumnStore data.')
+        if kdims is None:
+            kdims = data.metadata.get('kdims', eltype.kdims)
+        if vdims is None:
+            vdims = data.metadata.get('vdims', eltype.vdims)
+        return data, {'kdims': kdims, 'vdims': vdims}, {}
+
+
+    @classmethod
+    def range(cls, dataset, dimension):
+        name = dataset.get_dimension(dimension, strict=True).name
+        stored = dataset.data.range(name)
+        if stored is not None:
+            return stored
+        return super(ColumnStoreInterface, cls).range(dataset, dimension)
+
+
+    @classmethod
+    def append(cls, dataset, rows, buffers):
+        raise DataError('ColumnStore data is read-only, cast the '
+                        'Dataset to an in-memory datatype to '
+                        'append rows.')
+
+
+    @classmethod
+    def groupby(cls, dataset, dimensions, container_type, group_type, **kwargs):
+        # Get dimensions information
+        dimensions = [dataset.get_dimension(d, strict=True) for d in dimensions]
+        kdims = [kdim for kdim in dataset.kdims if kdim not in dimensions]
+        vdims = dataset.vdims
+
+        # Update the kwargs appropriately for Element group types
+        group_kwargs = {}
+        group_type = dict if group_type == 'raw' else group_type
+        if issubclass(group_type, Element):
+            group_kwargs.update(util.get_param_values(dataset))
+            group_kwargs['kdims'] = kdims
+        group_kwargs.update(kwargs)
+
+        # Only the key columns are loaded to partition the rows, the
+        # rows of each group are then gathered from the mapped columns
+        keys, order, slices = util.group_partitions([cls.values(dataset, d)
+                                                     for d in dimensions])
+        grouped_data = []
+        for unique_key, slc in zip(keys, slices):
+            # Rows within a group retain their original (ascending) order
+            rows = slc if isinstance(order, slice) else order[slc]
+            group_data = OrderedDict((d.name, dataset.data[d.name][rows])
+                                     for d in kdims+vdims)
+            group_data = group_type(group_data, **group_kwargs)
+            grouped_data.append((unique_key, group_data))
+
+        if issubclass(container_type, NdMapping):
+            with item_check(False):
+                return container_type(grouped_data, kdims=dimensions)
+        else:
+            return container_type(grouped_data)
+
+
+Interface.register(ColumnStoreInterface)
@@ -53,6 +53,11 @@ class DaskInterface(PandasInterface):
     def shape(cls, dataset):
         return (len(dataset.data), len(dataset.data.columns))
 
+    @classmethod
+    def column_key(cls, dataset, dim):
+        # Avoid computing the length of the lazy DataFrame
+        return dataset.data, None
+
     @classmethod
     def range(cls, columns, dimension):
         column = columns.data[columns.get_dimension(dimension).name]
@@ -96,14 +101,7 @@ class DaskInterface(PandasInterface):
                 if k.stop is not None:
                     masks.append(series < k.stop)
             elif isinstance(k, (set, list)):
-                iter_slc = None
-                for ik in k:
-                    mask = series == ik
-                    if iter_slc is None:
-                        iter_slc = mask
-                    else:
-                        iter_slc |= mask
-                masks.append(iter_slc)
+                masks.append(series.isin(list(k)))
             elif callable(k):
                 masks.append(k(series))
             else:
@@ -152,6 +152,10 @@ class DictInterface(Interface):
         lengths = [len(vals) for vals in dataset.data.values() if not np.isscalar(vals)]
         return max(lengths) if lengths else 1
 
+    @classmethod
+    def column_key(cls, dataset, dim):
+        return dataset.data.get(dim.name, dataset.data), cls.length(dataset)
+
     @classmethod
     def array(cls, dataset, dimensions):
         if not dimensions:
@@ -194,6 +198,11 @@ class DictInterface(Interface):
         return concatenated
 
 
+    @classmethod
+    def append(cls, dataset, rows, buffers):
+        return buffers.extend(dataset, rows)
+
+
     @classmethod
     def sort(cls, dataset, by=[], reverse=False):
         by = [dataset.get_dimension(d).name for d in by]
@@ -243,18 +252,19 @@ class DictInterface(Interface):
             group_kwargs['kdims'] = kdims
         group_kwargs.update(kwargs)
 
-        # Find all the keys along supplied dimensions
-        keys = (tuple(dataset.data[d.name] if np.isscalar(dataset.data[d.name])
-                      else dataset.data[d.name][i] for d in dimensions)
-                for i in range(len(dataset)))
+        # Partition the rows into contiguous groups along the supplied
+        # dimensions and reorder each column once
+        keys, order, slices = util.group_partitions([cls.values(dataset, d)
+                                                     for d in dimensions])
+        columns = OrderedDict((d.name, dataset.data[d.name] if np.isscalar(dataset.data[d.name])
+                               else np.asarray(dataset.data[d.name])[order])
+                              for d in kdims+vdims)
 
-        # Iterate over the unique entries applying selection masks
+        # Slice out the contiguous run of rows for each group
         grouped_data = []
-        for unique_key in util.unique_iterator(keys):
-            mask = cls.select_mask(dataset, dict(zip(dimensions, unique_key)))
-            group_data = OrderedDict(((d.name, dataset.data[d.name] if np.isscalar(dataset.data[d.name])
-                                       else dataset.data[d.name][mask])
-                                      for d in kdims+vdims))
+        for unique_key, slc in zip(keys, slices):
+            group_data = OrderedDict((name, values if np.isscalar(values) else values[slc])
+                                     for name, values in columns.items())
             group_data = group_type(group_data, **group_kwargs)
             grouped_data.append((unique_key, group_data))
 
@@ -268,7 +278,10 @@ class DictInterface(Interface):
     @classmethod
     def select(cls, dataset, selection_mask=None, **selection):
         if selection_mask is None:
-            selection_mask = cls.select_mask(dataset, selection)
+            # Sorted key dimensions may be selected as a contiguous slice
+            selection_mask = cls.select_slice(dataset, selection)
+        if selection_mask is None:
+            selection_mask = cls.select_mask(dataset, selection, sorted_slice=False)
         indexed = cls.indexed(dataset, selection)
         data = OrderedDict((k, v if np.isscalar(v) else v[selection_mask])
                            for k, v in dataset.data.items())
@@ -280,16 +293,9 @@ class DictInterface(Interface):
 
     @classmethod
     def sample(cls, dataset, samples=[]):
-        mask = False
-        for sample in samples:
-            sample_mask = True
-            if np.isscalar(sample): sample = [sample]
-            for i, v in enumerate(sample):
-                name = dataset.get_dimension(i).name
-                sample_mask &= (dataset.data[name]==v)
-            mask |= sample_mask
-        return {k: col if np.isscalar(col) else np.array(col)[mask]
-                for k, col in dataset.data.items()}
+        rows = cls.sample_indices(dataset, samples)
+        return OrderedDict((k, col if np.isscalar(col) else np.asarray(col)[rows])
+                           for k, col in dataset.data.items())
 
 
     @classmethod
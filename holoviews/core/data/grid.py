@@ -19,7 +19,7 @@ except ImportError:
 
 
 from .dictionary import DictInterface
-from .interface import Interface, DataError
+from .interface import Interface, DataError, DataTypeError
 from ..dimension import Dimension
 from ..element import Element
 from ..dimension import OrderedDict as cyODict
@@ -82,8 +82,8 @@ class GridInterface(DictInterface):
             data = {d: np.array([]) for d in dimensions[:ndims]}
             data.update({d: np.empty((0,) * ndims) for d in dimensions[ndims:]})
         elif not isinstance(data, dict):
-            raise TypeError('GridInterface must be instantiated as a '
-                            'dictionary or tuple')
+            raise DataTypeError('GridInterface must be instantiated as a '
+                                'dictionary or tuple')
 
         for dim in kdims+vdims:
             name = dim.name if isinstance(dim, Dimension) else dim
@@ -390,10 +390,7 @@ class GridInterface(DictInterface):
             if mask is True:
                 mask = np.ones(values.shape, dtype=np.bool)
         elif isinstance(ind, (set, list)):
-            iter_slcs = []
-            for ik in ind:
-                iter_slcs.append(values == ik)
-            mask = np.logical_or.reduce(iter_slcs)
+            mask = util.isin(values, ind)
         elif callable(ind):
             mask = ind(values)
         elif ind is None:
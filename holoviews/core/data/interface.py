@@ -15,6 +15,13 @@ class DataError(ValueError):
         super(DataError, self).__init__(msg)
 
 
+class DataTypeError(TypeError):
+    """
+    DataTypeError is raised by an Interface which cannot interpret the
+    type of the supplied data, irrespective of its contents.
+    """
+
+
 class iloc(object):
     """
     iloc is small wrapper object that allows row, column based
@@ -89,6 +96,172 @@ class ndloc(object):
         return self.dataset.clone(selected, datatype=[ds.interface.datatype]+ds.datatype, **params)
 
 
+class ColumnStatistics(object):
+    """
+    ColumnStatistics is a small cache of per-column statistics bound
+    to a Dataset, accessible via the ``.stats`` property. The range,
+    number of unique values, number of NaNs and whether a column is
+    sorted are computed lazily on first access and reused on
+    subsequent calls. The cached values of a column are keyed on the
+    identity of the column object and the length of the Dataset (as
+    returned by Interface.column_key), so that
+    replacing a column or modifying a DataFrame in place discards
+    them. Modifying the values of an array in place cannot be
+    detected. Clones which share the same data also share the cache.
+    """
+
+    def __init__(self, dataset, columns=None):
+        self.dataset = dataset
+        self.data = dataset.data
+        self._columns = {} if columns is None else columns
+
+    def _entry(self, dim):
+        dataset = self.dataset
+        key = (dim.name, dataset.get_dimension_index(dim))
+        column, length = dataset.interface.column_key(dataset, dim)
+        entry = self._columns.get(key)
+        if entry is None or entry[0] is not column or entry[1] != length:
+            entry = self._columns[key] = (column, length, {})
+        return entry[2]
+
+    def _lookup(self, dim, stat, fn):
+        dataset = self.dataset
+        dim = dataset.get_dimension(dim, strict=True)
+        if dataset.interface.gridded:
+            # Gridded ranges may depend on bounds and binning
+            return fn(dim)
+        column = self._entry(dim)
+        if stat not in column:
+            column[stat] = fn(dim)
+        return column[stat]
+
+    def range(self, dim):
+        "Returns the (min, max) range of the column excluding NaNs."
+        dataset = self.dataset
+        return self._lookup(dim, 'range', lambda d: dataset.interface.range(dataset, d))
+
+    def nunique(self, dim):
+        "Returns the number of unique values in the column."
+        dataset = self.dataset
+        return self._lookup(dim, 'nunique',
+                            lambda d: len(dataset.interface.values(dataset, d, False)))
+
+    def nan_count(self, dim):
+        "Returns the number of NaN (or null) values in the column."
+        dataset = self.dataset
+        def count(d):
+            values = dataset.interface.values(dataset, d)
+            if values.dtype.kind in 'fc':
+                return int(np.isnan(values).sum())
+            elif values.dtype.kind in 'Mm':
+                # NaT is represented by the minimum int64 value
+                return int((values.view('i8') == np.iinfo(np.int64).min).sum())
+            elif values.dtype.kind == 'O':
+                return sum(1 for v in values if v is None or util.is_nan(v))
+            return 0
+        return self._lookup(dim, 'nan_count', count)
+
+    def is_sorted(self, dim):
+        "Returns whether the column is sorted in ascending order."
+        dataset = self.dataset
+        def monotonic(d):
+            values = dataset.interface.values(dataset, d)
+            if len(values) < 2:
+                return True
+            try:
+                return bool(np.all(values[1:] >= values[:-1]))
+            except TypeError:
+                return False
+        return self._lookup(dim, 'sorted', monotonic)
+
+    def extend(self, rows):
+        """
+        Returns a new ColumnStatistics object for the bound Dataset
+        after the rows Dataset has been appended to it. Statistics
+        which may be combined without rescanning the existing data
+        (ranges, NaN counts and sortedness) are updated from the
+        appended rows, all others are discarded.
+        """
+        dataset = self.dataset
+        stats = ColumnStatistics(dataset)
+        offset = len(dataset)-len(rows)
+        for (name, idx), (_, _, column) in self._columns.items():
+            dim = dataset.get_dimension(name)
+            if dim is None or dataset.get_dimension_index(dim) != idx:
+                continue
+            updated = stats._entry(dim)
+            if 'range' in column:
+                updated['range'] = util.max_range([column['range'],
+                                                   rows.interface.range(rows, name)])
+            if 'nan_count' in column:
+                updated['nan_count'] = column['nan_count'] + rows.stats.nan_count(name)
+            if 'sorted' in column:
+                if not column['sorted'] or not len(rows) or not offset:
+                    updated['sorted'] = column['sorted'] and rows.stats.is_sorted(name)
+                elif rows.stats.is_sorted(name):
+                    values = dataset.interface.values(dataset, name)
+                    try:
+                        updated['sorted'] = bool(values[offset-1] <= values[offset])
+                    except TypeError:
+                        updated['sorted'] = False
+                else:
+                    updated['sorted'] = False
+        return stats
+
+
+
+class ColumnBuffers(object):
+    """
+    ColumnBuffers holds growable buffers for the columns of a Dataset
+    which is appended to incrementally. The buffers are overallocated
+    geometrically so that appending rows has an amortized cost
+    proportional to the number of appended rows and the columns are
+    exposed as views onto the filled portion of each buffer. Like
+    ColumnStatistics the buffers are tied to the data object they
+    produced and are only valid as long as the Dataset holds it.
+    """
+
+    # Minimum number of rows to allocate
+    min_capacity = 16
+
+    def __init__(self):
+        self.data = None
+        self.length = 0
+        self._buffers = OrderedDict()
+
+    def _allocate(self, values, dtype, capacity):
+        buf = np.empty(max(capacity, self.min_capacity), dtype=dtype)
+        buf[:len(values)] = values
+        return buf
+
+    def extend(self, dataset, rows):
+        """
+        Appends the rows of the supplied Dataset to the buffers,
+        initializing them from the dataset if they do not hold its
+        current data, and returns an OrderedDict of column views.
+        """
+        dims = dataset.dimensions(label='name')
+        if self.data is None or self.data is not dataset.data:
+            self.length = len(dataset)
+            self._buffers = OrderedDict(
+                (d, self._allocate(values, values.dtype, 2*self.length))
+                for d, values in ((d, dataset.dimension_values(d)) for d in dims))
+        new_length = self.length+len(rows)
+        columns = OrderedDict()
+        for d in dims:
+            buf, values = self._buffers[d], rows.dimension_values(d)
+            dtype = np.promote_types(buf.dtype, values.dtype)
+            if dtype != buf.dtype or new_length > len(buf):
+                buf = self._allocate(buf[:self.length], dtype,
+                                     max(2*len(buf), new_length))
+                self._buffers[d] = buf
+            buf[self.length:new_length] = values
+            columns[d] = buf[:new_length]
+        self.length = new_length
+        return columns
+
+
+
 class Interface(param.Parameterized):
 
     interfaces = {}
@@ -101,6 +274,14 @@ class Interface(param.Parameterized):
     # Denotes whether the interface expects ragged data
     multi = False
 
+    # Maps from (data type, element type, datatypes) to the set of
+    # interfaces which raised a DataTypeError for that data type
+    _dispatch_cache = {}
+
+    # Counts dispatch cache hits and misses and how often the first
+    # interface that was tried failed to initialize the data
+    dispatch_stats = {'hits': 0, 'misses': 0, 'fallbacks': 0}
+
     @classmethod
     def register(cls, interface):
         cls.interfaces[interface.datatype] = interface
@@ -189,15 +370,31 @@ class Interface(param.Parameterized):
             # Prioritize interfaces which have matching types
             prioritized = head + [el for el in prioritized if el != head[0]]
 
+        # Skip interfaces which previously rejected the type of the data,
+        # whether any other interface accepts it depends on the contents
+        dispatch_key = (type(data), eltype, tuple(datatype))
+        rejected = cls._dispatch_cache.get(dispatch_key)
+        if rejected is None:
+            rejected = cls._dispatch_cache[dispatch_key] = set()
+            cls.dispatch_stats['misses'] += 1
+        else:
+            cls.dispatch_stats['hits'] += 1
+
         # Iterate over interfaces until one can interpret the input
         priority_errors = []
+        tried = 0
         for interface in prioritized:
+            if interface in rejected:
+                continue
+            tried += 1
             try:
                 (data, dims, extra_kws) = interface.init(eltype, data, kdims, vdims)
                 break
             except DataError:
                 raise
             except Exception as e:
+                if isinstance(e, DataTypeError):
+                    rejected.add(interface)
                 if interface in head:
                     priority_errors.append((interface, e))
         else:
@@ -210,6 +407,8 @@ class Interface(param.Parameterized):
                 error = ' '.join([error, priority_error])
             raise DataError(error)
 
+        if tried > 1:
+            cls.dispatch_stats['fallbacks'] += 1
         return data, interface, dims, extra_kws
 
 
@@ -235,13 +434,22 @@ class Interface(param.Parameterized):
 
 
     @classmethod
-    def select_mask(cls, dataset, selection):
+    def select_mask(cls, dataset, selection, sorted_slice=None):
         """
         Given a Dataset object and a dictionary with dimension keys and
         selection keys (i.e tuple ranges, slices, sets, lists or literals)
         return a boolean mask over the rows in the Dataset object that
-        have been selected.
+        have been selected. The result of select_slice may be supplied
+        as sorted_slice if it has already been computed, where False
+        indicates the selection cannot be expressed as a slice.
         """
+        if sorted_slice is None:
+            sorted_slice = cls.select_slice(dataset, selection)
+        if isinstance(sorted_slice, slice):
+            mask = np.zeros(len(dataset), dtype=np.bool)
+            mask[sorted_slice] = True
+            return mask
+
         mask = np.ones(len(dataset), dtype=np.bool)
         for dim, k in selection.items():
             if isinstance(k, tuple):
@@ -253,10 +461,7 @@ class Interface(param.Parameterized):
                 if k.stop is not None:
                     mask &= arr < k.stop
             elif isinstance(k, (set, list)):
-                iter_slcs = []
-                for ik in k:
-                    iter_slcs.append(arr == ik)
-                mask &= np.logical_or.reduce(iter_slcs)
+                mask &= util.isin(arr, k)
             elif callable(k):
                 mask &= k(arr)
             else:
@@ -270,6 +475,59 @@ class Interface(param.Parameterized):
         return mask
 
 
+    @classmethod
+    def select_slice(cls, dataset, selection):
+        """
+        Given a Dataset object and a dictionary with dimension keys and
+        selection keys (i.e tuple ranges, slices or literals) attempts
+        to express the selection as a single contiguous slice over the
+        rows by bisecting the values of sorted key dimensions. Returns
+        None if the selection cannot be expressed as a slice, e.g.
+        because a dimension is not sorted or the selection is a set,
+        list or callable.
+        """
+        if not selection or cls.gridded or not hasattr(dataset, 'stats'):
+            return None
+        start, stop = 0, len(dataset)
+        for dim, k in selection.items():
+            dim = dataset.get_dimension(dim)
+            if isinstance(k, tuple):
+                k = slice(*k)
+            if (dim not in dataset.kdims or isinstance(k, (set, list)) or callable(k)
+                or not dataset.stats.is_sorted(dim)):
+                return None
+            arr = cls.values(dataset, dim)
+            try:
+                if isinstance(k, slice):
+                    lower = 0 if k.start is None else np.searchsorted(arr, k.start, 'left')
+                    upper = len(arr) if k.stop is None else np.searchsorted(arr, k.stop, 'left')
+                else:
+                    lower = np.searchsorted(arr, k, 'left')
+                    upper = np.searchsorted(arr, k, 'right')
+                    if lower == upper and dataset.ndims == 1:
+                        # Defer snapping to the closest value to select_mask
+                        return None
+            except (TypeError, ValueError):
+                return None
+            start, stop = max(start, lower), min(stop, upper)
+        return slice(int(start), int(max(start, stop)))
+
+
+    @classmethod
+    def sample_indices(cls, dataset, samples):
+        """
+        Given a Dataset object and a list of samples (i.e. tuples of
+        coordinates along the leading dimensions) returns the indices
+        of the rows matching the samples, in the order of the samples.
+        """
+        samples = [tuple(s) if isinstance(s, (list, tuple)) else (s,)
+                   for s in samples]
+        if not samples:
+            return np.array([], dtype=np.int64)
+        arrays = [cls.values(dataset, d) for d in dataset.dimensions()[:len(samples[0])]]
+        return util.sample_indices(arrays, samples)
+
+
     @classmethod
     def indexed(cls, dataset, selection):
         """
@@ -321,6 +579,28 @@ class Interface(param.Parameterized):
         concat_data = interface.concat(dataset)
         return dataset[0].clone(concat_data)
 
+    @classmethod
+    def append(cls, dataset, rows, buffers):
+        """
+        Given a Dataset object, a Dataset of rows with matching
+        dimensions and a ColumnBuffers object returns the data with
+        the rows appended. By default the rows are cast to the
+        interface of the Dataset and the data is concatenated,
+        interfaces which support incremental appends should store
+        the columns in the supplied buffers.
+        """
+        if cls.gridded:
+            raise DataError('%s does not support appending rows.'
+                            % cls.__name__)
+        try:
+            rows = rows.clone(rows.columns(), datatype=[cls.datatype])
+        except DataError:
+            raise DataError('The appended rows could not be cast to the %s '
+                            'format, cast the Dataset to a dictionary or '
+                            'dataframe datatype to append them.'
+                            % cls.__name__)
+        return cls.concat([dataset, rows])
+
     @classmethod
     def reduce(cls, dataset, reduce_dims, function, **kwargs):
         kdims = [kdim for kdim in dataset.kdims if kdim not in reduce_dims]
@@ -346,6 +626,16 @@ class Interface(param.Parameterized):
     def length(cls, dataset):
         return len(dataset.data)
 
+    @classmethod
+    def column_key(cls, dataset, dim):
+        """
+        Returns a tuple of an object whose identity changes whenever
+        the values of the supplied dimension are replaced and the
+        length of the column, used to invalidate the cached
+        ColumnStatistics. Defaults to the data object.
+        """
+        return dataset.data, cls.length(dataset)
+
     @classmethod
     def nonzero(cls, dataset):
         return bool(cls.length(dataset))
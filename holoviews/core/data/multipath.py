@@ -1,7 +1,7 @@
 import numpy as np
 
 from ..util import max_range
-from .interface import Interface, DataError
+from .interface import Interface, DataError, DataTypeError
 
 
 class MultiInterface(Interface):
@@ -34,7 +34,7 @@ class MultiInterface(Interface):
         if vdims is not None:
             dims['vdims'] = vdims
         if not isinstance(data, list):
-            raise ValueError('MultiInterface data must be a list tabular data types.')
+            raise DataTypeError('MultiInterface data must be a list tabular data types.')
         prev_interface, prev_dims = None, None
         for d in data:
             d, interface, dims, _ = Interface.initialize(eltype, d, kdims, vdims,
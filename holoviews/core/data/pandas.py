@@ -14,7 +14,7 @@ from .interface import Interface, DataError
 from ..dimension import Dimension
 from ..element import Element
 from ..dimension import OrderedDict as cyODict
-from ..ndmapping import NdMapping, item_check
+from ..ndmapping import NdMapping, item_check, OrderedDict
 from .. import util
 
 
@@ -150,6 +150,12 @@ class PandasInterface(Interface):
                             "not found: %s" % repr(not_found), cls)
 
 
+    @classmethod
+    def column_key(cls, dataset, dim):
+        # Series are cached by the DataFrame until a column is modified
+        return dataset.data[dim.name], len(dataset.data)
+
+
     @classmethod
     def range(cls, columns, dimension):
         column = columns.data[columns.get_dimension(dimension, strict=True).name]
@@ -173,6 +179,43 @@ class PandasInterface(Interface):
         return pd.concat([col.data for col in cast_objs])
 
 
+    @classmethod
+    def append(cls, columns, rows, buffers):
+        """
+        DataFrames which hold just the dimension columns with a default
+        index are backed by the growable buffers, constructing a block
+        per column so that pandas does not copy the buffers into a
+        consolidated block. Otherwise the rows are concatenated,
+        copying the DataFrame but preserving the index and any
+        additional columns (which are NaN for the appended rows).
+        """
+        df = columns.data
+        dims = columns.dimensions(label='name')
+        default_index = df.index.equals(pd.RangeIndex(len(df)))
+        if (default_index and list(df.columns) == dims and
+            all(isinstance(dtype, np.dtype) for dtype in df.dtypes)):
+            try:
+                return cls._unconsolidated(buffers.extend(columns, rows))
+            except (ImportError, TypeError, ValueError):
+                pass
+        new = pd.DataFrame(OrderedDict((d, rows.dimension_values(d)) for d in dims))
+        return pd.concat([df, new.reindex(columns=df.columns)], ignore_index=default_index)
+
+
+    @classmethod
+    def _unconsolidated(cls, columns):
+        """
+        Constructs a DataFrame from an OrderedDict of arrays, which
+        holds a block per column referencing the arrays without copying.
+        """
+        from pandas.core.internals import BlockManager, make_block
+        arrays = list(columns.values())
+        blocks = [make_block(arr[np.newaxis], placement=[i])
+                  for i, arr in enumerate(arrays)]
+        index = pd.RangeIndex(len(arrays[0]) if arrays else 0)
+        return pd.DataFrame(BlockManager(blocks, [pd.Index(list(columns)), index]))
+
+
     @classmethod
     def groupby(cls, columns, dimensions, container_type, group_type, **kwargs):
         index_dims = [columns.get_dimension(d, strict=True) for d in dimensions]
@@ -254,7 +297,10 @@ class PandasInterface(Interface):
     def select(cls, columns, selection_mask=None, **selection):
         df = columns.data
         if selection_mask is None:
-            selection_mask = cls.select_mask(columns, selection)
+            # Sorted key dimensions may be selected as a contiguous slice
+            selection_mask = cls.select_slice(columns, selection)
+        if selection_mask is None:
+            selection_mask = cls.select_mask(columns, selection, sorted_slice=False)
         indexed = cls.indexed(columns, selection)
         df = df.iloc[selection_mask]
         if indexed and len(df) == 1 and len(columns.vdims) == 1:
@@ -273,15 +319,7 @@ class PandasInterface(Interface):
 
     @classmethod
     def sample(cls, columns, samples=[]):
-        data = columns.data
-        mask = False
-        for sample in samples:
-            sample_mask = True
-            if np.isscalar(sample): sample = [sample]
-            for i, v in enumerate(sample):
-                sample_mask = np.logical_and(sample_mask, data.iloc[:, i]==v)
-            mask |= sample_mask
-        return data[mask]
+        return columns.data.iloc[cls.sample_indices(columns, samples)]
 
 
     @classmethod
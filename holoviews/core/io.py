@@ -14,12 +14,15 @@ Archives: A collection of HoloViews objects that are first collected
 """
 from __future__ import absolute_import
 
-import re, os, time, string, zipfile, tarfile, shutil, itertools, pickle
+import re, os, time, string, zipfile, tarfile, shutil, itertools, pickle, types, json
+import datetime as dt
 from collections import defaultdict
+from functools import partial
 
 from io import BytesIO
 from hashlib import sha256
 
+import numpy as np
 import param
 from param.parameterized import bothmethod
 
@@ -28,7 +31,8 @@ from .element import Collator, Element
 from .overlay import Overlay, Layout
 from .ndmapping import OrderedDict, NdMapping, UniformNdMapping
 from .options import Store
-from .util import unique_iterator, group_sanitizer, label_sanitizer
+from .util import (unique_iterator, group_sanitizer, label_sanitizer,
+                   basestring, callable_name, pd)
 
 
 def sanitizer(name, replacements=[(':','_'), ('/','_'), ('\\','_')]):
@@ -467,6 +471,245 @@ class Unpickler(Importer):
 
 
 
+def _code_identity(code):
+    "Returns the contents of a code object (and nested code objects)."
+    consts = tuple(_code_identity(c) if isinstance(c, types.CodeType) else c
+                   for c in code.co_consts)
+    return (code.co_code, consts, code.co_names)
+
+
+def _stable_contents(obj):
+    """
+    Converts an object to a JSON serializable representation which is
+    stable across Python sessions. Unlike HashableJSON, which falls
+    back to the hashes of sets and the ids of unsupported objects,
+    dictionaries and sets are sorted by their serialized contents and
+    arrays are represented by a digest of their buffers. Other objects
+    are represented by a digest of their pickled state.
+    """
+    if obj is None or isinstance(obj, (bool, int, float, basestring)):
+        return obj
+    elif isinstance(obj, bytes):
+        return ['bytes', sha256(obj).hexdigest()]
+    elif isinstance(obj, np.generic):
+        return _stable_contents(obj.item())
+    elif isinstance(obj, (list, tuple)):
+        return [_stable_contents(o) for o in obj]
+    elif isinstance(obj, dict):
+        items = [[_stable_contents(k), _stable_contents(v)] for k, v in obj.items()]
+        return ['dict', sorted(items, key=json.dumps)]
+    elif isinstance(obj, (set, frozenset)):
+        return ['set', sorted([_stable_contents(o) for o in obj], key=json.dumps)]
+    elif isinstance(obj, np.ndarray):
+        if obj.dtype.kind == 'O':
+            return ['array', obj.shape, _stable_contents(obj.tolist())]
+        digest = sha256(np.ascontiguousarray(obj).view(np.uint8)).hexdigest()
+        return ['array', obj.dtype.str, obj.shape, digest]
+    elif pd and isinstance(obj, (pd.Series, pd.DataFrame)):
+        return [type(obj).__name__, obj.to_csv()]
+    elif isinstance(obj, (dt.datetime, dt.date, dt.time, dt.timedelta)):
+        return [type(obj).__name__, str(obj)]
+    elif isinstance(obj, type) or isinstance(obj, types.FunctionType):
+        return ['type', obj.__module__, getattr(obj, '__qualname__', obj.__name__)]
+    return ['pickle', sha256(pickle.dumps(obj, protocol=2)).hexdigest()]
+
+
+def _stable_digest(obj):
+    "Returns a digest of an object which is stable across Python sessions."
+    serialized = json.dumps(_stable_contents(obj), separators=(',', ':'))
+    return sha256(serialized.encode('utf-8')).hexdigest()
+
+
+def _callable_identity(callable_obj):
+    """
+    Returns an identity for a callable which is stable across Python
+    sessions, consisting of its module, name and the contents of its
+    code object and closure. Partials include their arguments, methods
+    the type of the instance they are bound to and Parameterized
+    callable objects their parameter values.
+    """
+    if isinstance(callable_obj, partial):
+        return (_callable_identity(callable_obj.func), callable_obj.args,
+                sorted(callable_obj.keywords.items()))
+    function = getattr(callable_obj, '__func__', callable_obj)
+    owner = getattr(callable_obj, '__self__', None)
+    owner = None if owner is None else type(owner).__name__
+    if not hasattr(function, '__code__'):
+        # Callable objects are identified by their __call__ method
+        if isinstance(callable_obj, param.Parameterized):
+            owner = [(k, v) for k, v in callable_obj.get_param_values() if k != 'name']
+        function = getattr(type(callable_obj), '__call__')
+        function = getattr(function, '__func__', function)
+    code = getattr(function, '__code__', None)
+    closure = tuple(cell.cell_contents for cell in
+                    getattr(function, '__closure__', None) or ())
+    name = getattr(function, '__qualname__', getattr(function, '__name__', None))
+    return (getattr(function, '__module__', None), name, owner,
+            None if code is None else _code_identity(code), closure)
+
+
+
+class FileCache(param.Parameterized):
+    """
+    A persistent cache for HoloViews objects which allows the return
+    values of a Callable (and therefore the frames of a DynamicMap)
+    to be reused across Python sessions, e.g. after restarting a
+    notebook kernel or between bokeh server sessions.
+
+    Each entry is stored as a .hvz file in the cache directory using
+    the Pickler and loaded using the Unpickler. The entries are keyed
+    by a digest of the identity of the callable and the key supplied
+    to the cache, i.e. the arguments and the state of the streams.
+    The identity of a callable includes the contents of its closure
+    and is computed once by the Callable using the cache.
+    Once the number of entries or the total size of the files exceed
+    the limits, the least recently used entries are evicted.
+    """
+
+    directory = param.String(default='.holoviews_cache', doc="""
+        The directory the cached entries are stored in.""")
+
+    max_entries = param.Integer(default=1000, allow_None=True, bounds=(1, None), doc="""
+        The maximum number of entries to hold in the cache.""")
+
+    max_bytes = param.Integer(default=None, allow_None=True, bounds=(0, None), doc="""
+        The maximum total size of the cached files in bytes.""")
+
+    file_ext = 'hvz'
+
+    def __init__(self, directory='.holoviews_cache', **params):
+        super(FileCache, self).__init__(directory=directory, **params)
+        self.hits, self.misses = 0, 0
+
+
+    def identity(self, callable_obj):
+        """
+        Returns a digest of the identity of the callable which is
+        stable across Python sessions, or None with a warning if the
+        identity (e.g. the closure) cannot be serialized, in which
+        case the return values of the callable cannot be cached.
+        """
+        try:
+            return _stable_digest(_callable_identity(callable_obj))
+        except Exception as e:
+            self.warning('Persistent caching disabled for callable %r, '
+                         'its identity could not be serialized: %s' %
+                         (callable_name(callable_obj), e))
+            return None
+
+
+    def hashkey(self, identity, key):
+        """
+        Returns the digest the return value of the callable with the
+        supplied identity is stored under for the supplied key, or
+        None if the key cannot be serialized.
+        """
+        try:
+            return _stable_digest([identity, key])
+        except Exception:
+            return None
+
+
+    def _path(self, hashkey):
+        return os.path.join(self.directory, '%s.%s' % (hashkey, self.file_ext))
+
+
+    def __contains__(self, hashkey):
+        return os.path.isfile(self._path(hashkey))
+
+
+    def __len__(self):
+        return len(self._entries())
+
+
+    def get(self, hashkey):
+        """
+        Loads the object stored under the supplied digest, marking the
+        entry as the most recently used. Raises a KeyError if there is
+        no readable entry.
+        """
+        path = self._path(hashkey)
+        try:
+            obj = Unpickler.load(path)
+        except Exception:
+            self.misses += 1
+            if os.path.isfile(path):
+                os.remove(path)
+            raise KeyError(hashkey)
+        os.utime(path, None)
+        self.hits += 1
+        return obj
+
+
+    def set(self, hashkey, obj):
+        """
+        Stores the supplied HoloViews object under the supplied digest,
+        evicting the least recently used entries if the limits are
+        exceeded. Objects that cannot be pickled are not stored.
+        """
+        if not isinstance(obj, LabelledData):
+            return
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+        path = self._path(hashkey)
+        # Write to a temporary file first so that concurrent readers
+        # never load an incomplete entry
+        tmp_path = '%s.%s.tmp' % (path, os.getpid())
+        try:
+            with open(tmp_path, 'wb') as f:
+                Pickler.save(obj, f)
+            os.rename(tmp_path, path)
+        except Exception as e:
+            if os.path.isfile(tmp_path):
+                os.remove(tmp_path)
+            self.warning('Could not store %s object in the cache: %s' %
+                         (type(obj).__name__, e))
+            return
+        self._evict()
+
+
+    def clear(self):
+        "Removes all entries from the cache."
+        for path, _ in self._entries():
+            os.remove(path)
+
+
+    def _entries(self):
+        """
+        Returns the paths and stat results of the cached entries
+        ordered from least to most recently used.
+        """
+        if not os.path.isdir(self.directory):
+            return []
+        paths = [os.path.join(self.directory, f) for f in os.listdir(self.directory)
+                 if f.endswith('.'+self.file_ext)]
+        entries = []
+        for path in paths:
+            try:
+                entries.append((path, os.stat(path)))
+            except OSError:
+                pass
+        return sorted(entries, key=lambda e: e[1].st_mtime)
+
+
+    def _evict(self):
+        """
+        Removes the least recently used entries until the number of
+        entries and the total size are within the limits.
+        """
+        entries = self._entries()
+        nbytes = sum(stat.st_size for _, stat in entries)
+        while entries and ((self.max_entries is not None and len(entries) > self.max_entries) or
+                           (self.max_bytes is not None and nbytes > self.max_bytes)):
+            path, stat = entries.pop(0)
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            nbytes -= stat.st_size
+
+
+
 class Archive(param.Parameterized):
     """
     An Archive is a means to collect and store a collection of
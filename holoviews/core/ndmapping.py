@@ -4,6 +4,7 @@ map types. The former class only allows indexing whereas the latter
 also enables slicing over multiple dimension ranges.
 """
 
+from bisect import bisect_left, bisect_right
 from itertools import cycle
 from operator import itemgetter
 import numpy as np
@@ -96,6 +97,7 @@ class MultiDimensionalMapping(Dimensioned):
     _check_items = True
 
     def __init__(self, initial_items=None, kdims=None, **params):
+        self._unordered = False
         if isinstance(initial_items, MultiDimensionalMapping):
             params = dict(util.get_param_values(initial_items),
                           **dict({'sort': self.sort}, **params))
@@ -109,6 +111,8 @@ class MultiDimensionalMapping(Dimensioned):
 
         self._next_ind = 0
         self._check_key_type = True
+        self._sorted_keys = None
+        self._key_index = None
 
         if initial_items is None: initial_items = []
         if isinstance(initial_items, tuple):
@@ -126,6 +130,37 @@ class MultiDimensionalMapping(Dimensioned):
             self.update(OrderedDict(initial_items))
 
 
+    @property
+    def data(self):
+        """
+        The OrderedDict of items, which is reordered if keys were
+        inserted out of order since it was last accessed.
+        """
+        if self._unordered:
+            self._reorder()
+        return self._data
+
+    @data.setter
+    def data(self, data):
+        self._data = data
+        self._unordered = False
+
+
+    def __getstate__(self):
+        self.data # Apply any pending reordering before pickling
+        return super(MultiDimensionalMapping, self).__getstate__()
+
+
+    def __setstate__(self, d):
+        """
+        Loads pickles which stored the data as an instance attribute.
+        """
+        if 'data' in d:
+            d['_data'] = d.pop('data')
+        d.setdefault('_unordered', False)
+        super(MultiDimensionalMapping, self).__setstate__(d)
+
+
     def _item_check(self, dim_vals, data):
         """
         Applies optional checks to individual data elements before
@@ -170,14 +205,21 @@ class MultiDimensionalMapping(Dimensioned):
                                ' specified dimension values.' % (dim, repr(val)))
 
         # Updates nested data structures rather than simply overriding them.
-        if (update and (dim_vals in self.data)
-            and isinstance(self.data[dim_vals], (MultiDimensionalMapping, OrderedDict))):
-            self.data[dim_vals].update(data)
+        new = dim_vals not in self._data
+        if (update and not new
+            and isinstance(self._data[dim_vals], (MultiDimensionalMapping, OrderedDict))):
+            self._data[dim_vals].update(data)
         else:
-            self.data[dim_vals] = data
+            self._data[dim_vals] = data
 
-        if sort:
+        if new:
+            self._key_index = None
+        if sort and new:
+            self._insert_sorted(dim_vals)
+        elif sort and not self._sort_index_valid():
             self._resort()
+        elif new:
+            self._sorted_keys = None
 
 
     def _apply_key_type(self, keys):
@@ -244,9 +286,116 @@ class MultiDimensionalMapping(Dimensioned):
         return data
 
 
+    def _sort_values(self):
+        """
+        Returns the list of values for each categorical key dimension
+        used to compute sort keys or None if no dimension declares
+        values and keys therefore sort in their natural order.
+        """
+        if not any(d.values for d in self.kdims):
+            return None
+        return [[None]+list(d.values) if d.values else None for d in self.kdims]
+
+
+    @classmethod
+    def _sort_key(cls, key, values):
+        "Computes the sort key of a key tuple, matching dimension_sort."
+        if values is None:
+            return key
+        return tuple(vals.index(k) if vals else k for vals, k in zip(values, key))
+
+
+    def _sort_index_valid(self, inserted=0):
+        """
+        Whether the sorted keys are in sync with the data, ignoring
+        the specified number of items that were just inserted.
+        """
+        sorted_keys = getattr(self, '_sorted_keys', None)
+        if sorted_keys is None or sorted_keys[0] is not self._data:
+            return False
+        _, skeys, _, _, pending = sorted_keys
+        return len(skeys)+len(pending) == len(self._data)-inserted
+
+
+    @classmethod
+    def _sort_order(cls, skeys):
+        """
+        Returns the indices which sort the supplied sort keys, raising
+        a TypeError if the keys are not mutually comparable.
+        """
+        order = sorted(range(len(skeys)), key=skeys.__getitem__)
+        for i, j in zip(order[:-1], order[1:]):
+            if not skeys[i] <= skeys[j]:
+                raise TypeError('Keys not comparable')
+        return order
+
+
     def _resort(self):
-        self.data = OrderedDict(dimension_sort(self.data, self.kdims, self.vdims,
-                                               range(self.ndims)))
+        """
+        Sorts the data computing the sort key of each item only once
+        and maintains the sorted keys to allow inserting and removing
+        items without resorting. Keys which are not mutually comparable are sorted
+        using dimension_sort instead.
+        """
+        items = list(self._data.items())
+        values = self._sort_values()
+        try:
+            skeys = [self._sort_key(k, values) for k, _ in items]
+            order = self._sort_order(skeys)
+        except (TypeError, ValueError):
+            items = list(dimension_sort(self._data, self.kdims, self.vdims,
+                                        range(self.ndims)))
+            self.data = OrderedDict(items)
+            self._sorted_keys = None
+            return
+        items = [items[i] for i in order]
+        self.data = OrderedDict(items)
+        self._sorted_keys = (self._data, [skeys[i] for i in order],
+                             [k for k, _ in items], values, [])
+
+
+    def _reorder(self):
+        """
+        Merges the keys inserted out of order into the sorted keys and
+        reorders the data to match.
+        """
+        data, skeys, keys, values, pending = self._sorted_keys
+        if pending:
+            skeys = skeys + [skey for skey, _ in pending]
+            keys = keys + [key for _, key in pending]
+            try:
+                order = self._sort_order(skeys)
+            except TypeError:
+                return self._resort()
+            skeys = [skeys[i] for i in order]
+            keys = [keys[i] for i in order]
+        self.data = OrderedDict((k, data[k]) for k in keys)
+        self._sorted_keys = (self._data, skeys, keys, values, [])
+
+
+    def _insert_sorted(self, key):
+        """
+        Inserts a newly added key into the sorted keys. Keys added in
+        order are appended, while keys inserted out of order are
+        merged into the sorted keys and the data is reordered once when
+        it is next accessed, so that a batch of out of order insertions
+        is sorted only once.
+        """
+        if not self._sort_index_valid(inserted=1):
+            return self._resort()
+        _, skeys, keys, values, pending = self._sorted_keys
+        try:
+            skey = self._sort_key(key, values)
+            if not skeys or skeys[-1] <= skey:
+                skeys.append(skey)
+                keys.append(key)
+                return
+            elif not skey <= skeys[-1]:
+                raise TypeError('Key not comparable')
+        except (TypeError, ValueError):
+            return self._resort()
+        pending.append((skey, key))
+        self._unordered = True
 
 
     def clone(self, data=None, shared_data=True, *args, **overrides):
@@ -504,7 +653,21 @@ class MultiDimensionalMapping(Dimensioned):
     def pop(self, key, default=None):
         "Standard pop semantics for all mapping types"
         if not isinstance(key, tuple): key = (key,)
-        return self.data.pop(key, default)
+        self.data # Merge any keys inserted out of order
+        if key in self._data and self._sort_index_valid():
+            _, skeys, keys, values, _ = self._sorted_keys
+            try:
+                skey = self._sort_key(key, values)
+                pos = bisect_left(skeys, skey)
+                while pos < len(keys) and skeys[pos] == skey and keys[pos] != key:
+                    pos += 1
+                if pos == len(keys) or keys[pos] != key:
+                    raise ValueError('Key not found')
+                del skeys[pos], keys[pos]
+            except (TypeError, ValueError):
+                self._sorted_keys = None
+        self._key_index = None
+        return self._data.pop(key, default)
 
 
     def __getitem__(self, key):
@@ -584,12 +747,7 @@ class NdMapping(MultiDimensionalMapping):
             return self._dataslice(self.data[map_slice], data_slice)
         else:
             conditions = self._generate_conditions(map_slice)
-            items = self.data.items()
-            for cidx, (condition, dim) in enumerate(zip(conditions, self.kdims)):
-                values = dim.values
-                items = [(k, v) for k, v in items
-                         if condition(values.index(k[cidx])
-                                      if values else k[cidx])]
+            items = self._select_items(map_slice, conditions)
             sliced_items = []
             for k, v in items:
                 val_slice = self._dataslice(v, data_slice)
@@ -601,6 +759,92 @@ class NdMapping(MultiDimensionalMapping):
                 return self.clone(sliced_items)
 
 
+    def _select_items(self, map_slice, conditions):
+        """
+        Returns the items with keys matching the supplied slice in
+        their original order. Slices, value sets and values are looked
+        up by bisection on the per-dimension key index, intersecting
+        the matching positions across dimensions. The conditions are
+        only evaluated on the remaining candidate keys for callables
+        and dimensions with keys that cannot be sorted.
+        """
+        keys, index = self._get_key_index()
+        candidates, remaining = None, []
+        for cidx, (dim, dim_slice, condition) in enumerate(zip(self.kdims, map_slice, conditions)):
+            if dim_slice is Ellipsis or (isinstance(dim_slice, slice) and
+                                         dim_slice == slice(None)):
+                continue
+            positions = None
+            if not callable(dim_slice):
+                try:
+                    positions = self._lookup_positions(index, cidx, dim, dim_slice)
+                except (TypeError, ValueError):
+                    pass
+            if positions is None:
+                remaining.append((cidx, dim.values, condition))
+            elif candidates is None:
+                candidates = positions
+            else:
+                candidates &= positions
+        rows = range(len(keys)) if candidates is None else sorted(candidates)
+        items = [(keys[i], self.data[keys[i]]) for i in rows]
+        for cidx, values, condition in remaining:
+            items = [(k, v) for k, v in items
+                     if condition(values.index(k[cidx]) if values else k[cidx])]
+        return items
+
+
+    def _get_key_index(self):
+        """
+        Returns the list of keys and the per-dimension key index,
+        which is built lazily and discarded whenever items are added
+        or removed.
+        """
+        key_index = getattr(self, '_key_index', None)
+        if (key_index is None or key_index[0] is not self.data or
+            len(key_index[1]) != len(self.data)):
+            key_index = (self.data, list(self.data.keys()), {})
+            self._key_index = key_index
+        return key_index[1:]
+
+
+    def _lookup_positions(self, index, cidx, dim, dim_slice):
+        """
+        Looks up the set of positions of the keys matching the slice,
+        set, list or value along the specified dimension by bisection
+        on the sorted values of that dimension, building the sorted
+        values on first use. Returns None if the keys along the
+        dimension cannot be sorted.
+        """
+        if cidx not in index:
+            keys = self._key_index[1]
+            values = [dim.values.index(k[cidx]) if dim.values else k[cidx]
+                      for k in keys]
+            try:
+                if any(v != v for v in values):
+                    raise TypeError('NaN keys cannot be bisected')
+                order = sorted(range(len(values)), key=values.__getitem__)
+                index[cidx] = ([values[i] for i in order], order)
+            except TypeError:
+                index[cidx] = None
+        if index[cidx] is None:
+            return None
+
+        values, order = index[cidx]
+        lookup = dim.values.index if dim.values else lambda v: v
+        if isinstance(dim_slice, slice):
+            start, stop = dim_slice.start, dim_slice.stop
+            ranges = [(0 if start is None else bisect_left(values, lookup(start)),
+                       len(values) if stop is None else bisect_left(values, lookup(stop)))]
+        elif isinstance(dim_slice, (set, list)):
+            ranges = [(bisect_left(values, v), bisect_right(values, v))
+                      for v in map(lookup, dim_slice)]
+        else:
+            value = lookup(dim_slice)
+            ranges = [(bisect_left(values, value), bisect_right(values, value))]
+        return set(i for start, stop in ranges for i in order[start:stop])
+
+
     def _expand_slice(self, indices):
         """
         Expands slices containing steps into a list.
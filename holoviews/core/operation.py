@@ -2,6 +2,10 @@
 Operations manipulate Elements, HoloMaps and Layouts, typically for
 the purposes of analysis or visualization.
 """
+import pickle
+from functools import partial
+from multiprocessing import cpu_count
+
 import param
 from .dimension import ViewableElement
 from .element import Element, HoloMap, GridSpace, NdLayout
@@ -10,6 +14,18 @@ from .overlay import NdOverlay, Overlay
 from .spaces import DynamicMap, Callable
 
 
+def _apply_frame(operation, values, params, element, key):
+    """
+    Applies an operation to a single frame in a worker process. The
+    operation is supplied as a type along with its parameter values
+    and the call parameters since instances with parameter overrides
+    cannot be pickled.
+    """
+    operation = operation.instance(**values)
+    operation.p = param.ParamOverrides(operation, params)
+    return operation._apply(element, key)
+
+
 class Operation(param.ParameterizedFunction):
     """
     An Operation process an Element or HoloMap at the level of
@@ -61,6 +77,25 @@ class Operation(param.ParameterizedFunction):
         List of streams that are applied if dynamic=True, allowing
         for dynamic interaction with the plot.""")
 
+    executor = param.Parameter(default='serial', doc="""
+        The executor used to apply the operation to the frames of a
+        HoloMap (or the sampled frames of a DynamicMap), which may be
+        'serial', 'thread' or 'process' to apply the operation using
+        a pool of threads or processes, or a concurrent.futures
+        Executor instance. Processed frames retain the original order
+        of the keys. The frames of a DynamicMap are sampled serially,
+        only the operation is applied using the executor.
+
+        Worker processes require the operation parameters to be
+        picklable. Otherwise 'process' falls back to a pool of
+        threads, while a supplied ProcessPoolExecutor raises an
+        error. If a frame fails, the exception raised has a key
+        attribute holding the key of the failing frame.""")
+
+    max_workers = param.Integer(default=None, allow_None=True, bounds=(1, None), doc="""
+        The maximum number of workers used when the executor is
+        'thread' or 'process', defaulting to the number of CPUs.""")
+
     # Hooks to allow external libraries to extend existing operations.
     # Preprocessor hooks should accept the operation and input element
     # and return a dictionary of data which will be made available to
@@ -166,17 +201,98 @@ class Operation(param.ParameterizedFunction):
                 raise ValueError('Applying a non-dynamic operation requires '
                                  'all DynamicMap key dimensions to define '
                                  'the sampling by specifying values.')
+            # Sampling evaluates the DynamicMap callback serially, the
+            # sampled frames are then processed using the executor
             samples = tuple(d.values for d in element.kdims)
             processed = self(element[samples], **params)
         elif isinstance(element, HoloMap):
-            mapped_items = [(k, self._apply(el, key=k))
-                            for k, el in element.items()]
+            mapped_items = self._apply_frames(list(element.items()), params)
             processed = element.clone(mapped_items)
         else:
             raise ValueError("Cannot process type %r" % type(element).__name__)
         return processed
 
 
+    def _apply_frames(self, items, params):
+        """
+        Applies the operation to a list of (key, element) frames using
+        the executor, returning the processed frames in the order they
+        were supplied. If processing a frame fails, the key of the
+        frame is attached to the exception before it is reraised.
+        """
+        executor = self.p.executor
+        if executor == 'serial' or len(items) < 2:
+            results = [partial(self._apply, el, k) for k, el in items]
+            return self._collect_frames(items, results, lambda r: r())
+
+        from concurrent import futures
+        if executor in ['thread', 'process']:
+            pool_type = futures.ThreadPoolExecutor
+            if executor == 'process':
+                if self._frame_params(params) is not None:
+                    pool_type = futures.ProcessPoolExecutor
+                else:
+                    self.warning("The parameters of operation '%s' cannot "
+                                 "be pickled, applying it using threads "
+                                 "instead of processes." % type(self).__name__)
+            max_workers = self.p.max_workers or cpu_count()
+            with pool_type(max_workers) as pool:
+                return self._submit_frames(pool, items, params)
+        elif isinstance(executor, futures.Executor):
+            return self._submit_frames(executor, items, params)
+        raise ValueError("Operation executor must be one of 'serial', "
+                         "'thread', 'process' or a concurrent.futures "
+                         "Executor, not %r." % executor)
+
+
+    def _submit_frames(self, pool, items, params):
+        """
+        Submits each frame to the supplied executor and collects the
+        results in the order the frames were supplied.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        if isinstance(pool, ProcessPoolExecutor):
+            frame_params = self._frame_params(params)
+            if frame_params is None:
+                raise ValueError("Operation '%s' cannot be applied using a "
+                                 "ProcessPoolExecutor since its parameters "
+                                 "cannot be pickled." % type(self).__name__)
+            results = [pool.submit(_apply_frame, type(self), *(frame_params+(el, k)))
+                       for k, el in items]
+        else:
+            results = [pool.submit(self._apply, el, k) for k, el in items]
+        return self._collect_frames(items, results, lambda r: r.result())
+
+
+    def _frame_params(self, params):
+        """
+        Returns the parameter values and call parameters used to
+        rebuild the operation in a worker process, or None if the
+        operation or its parameters cannot be pickled.
+        """
+        excluded = ['name', 'executor']
+        values = {k: v for k, v in self.get_param_values(onlychanged=True)
+                  if k not in excluded}
+        params = {k: v for k, v in params.items() if k not in excluded}
+        try:
+            pickle.dumps((type(self), values, params))
+        except Exception:
+            return None
+        return values, params
+
+
+    def _collect_frames(self, items, results, get_result):
+        processed = []
+        for (key, _), result in zip(items, results):
+            try:
+                processed.append((key, get_result(result)))
+            except Exception as e:
+                e.key = key
+                raise
+        return processed
+
+
+
 class ElementOperation(Operation):
 
     def __init__(self, *args, **kwargs):
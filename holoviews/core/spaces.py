@@ -1,17 +1,21 @@
+import atexit
 import itertools
+import threading
 import types
+import weakref
 from numbers import Number
 from itertools import groupby
 from functools import partial
 from collections import defaultdict
 from contextlib import contextmanager
 from inspect import ArgSpec
+from multiprocessing import cpu_count
 
 import numpy as np
 import param
 
 from . import traversal, util
-from .dimension import OrderedDict, Dimension, ViewableElement, redim
+from .dimension import OrderedDict, Dimension, Dimensioned, ViewableElement, redim
 from .layout import Layout, AdjointLayout, NdLayout, Empty
 from .ndmapping import UniformNdMapping, NdMapping, item_check
 from .overlay import Overlay, CompositeOverlay, NdOverlay, Overlayable
@@ -453,8 +457,8 @@ class Callable(param.Parameterized):
     to a DynamicMap.
 
     Additionally, if the memoize attribute is True, a Callable will
-    memoize the last returned value based on the arguments to the
-    function and the state of all streams on its inputs, to avoid
+    memoize the last memoize_size returned values based on the arguments
+    to the function and the state of all streams on its inputs, to avoid
     calling the function unnecessarily. Note that because memoization
     includes the streams found on the inputs it may be disabled if the
     stream requires it and is triggering.
@@ -499,18 +503,64 @@ class Callable(param.Parameterized):
          based on the call arguments and any streams attached to the
          inputs.""")
 
+    memoize_size = param.Integer(default=10, bounds=(1, None), doc="""
+         The number of return values to memoize, once exceeded the
+         least recently used value is discarded.""")
+
     stream_mapping = param.Dict(default={}, constant=True, doc="""
          Defines how streams should be mapped to objects returned by
          the Callable, e.g. when it returns a Layout.""")
 
+    persistent_cache = param.Parameter(default=None, doc="""
+         Optional persistent cache, e.g. a holoviews.core.io.FileCache,
+         the memoized return values are also stored in. The cache is
+         keyed by the identity of the callable, the call arguments and
+         the state of the streams, allowing return values to be reused
+         across Python sessions.""")
+
     def __init__(self, callable, **params):
         super(Callable, self).__init__(callable=callable,
                                        **dict(params, name=util.callable_name(callable)))
-        self._memoized = {}
+        self._memoized = OrderedDict()
+        # Last completed scheduled task by hashed key and the
+        # (hashed key, task) of the pending scheduled call
+        self._resolved = {}
+        self._pending = None
+        self._cache_identity = None
         self._is_overlay = False
         self.args = None
         self.kwargs = None
-        self._stream_memoization = self.memoize
+        # Guards the memoized values and arguments of the last call,
+        # since the callable may be called from multiple threads
+        self._lock = threading.RLock()
+        self._local = threading.local()
+
+
+    def __getstate__(self):
+        state = super(Callable, self).__getstate__()
+        for attr in ('_lock', '_local'):
+            state.pop(attr, None)
+        return state
+
+
+    def __setstate__(self, state):
+        super(Callable, self).__setstate__(state)
+        self._lock = threading.RLock()
+        self._local = threading.local()
+
+
+    @property
+    def _stream_memoization(self):
+        """
+        Whether the streams allow memoization, which is set on the
+        thread calling the Callable by dynamicmap_memoization.
+        """
+        return getattr(self._local, 'stream_memoization', self.memoize)
+
+    @_stream_memoization.setter
+    def _stream_memoization(self, memoize):
+        self._local.stream_memoization = memoize
+
 
     @property
     def argspec(self):
@@ -522,6 +572,11 @@ class Callable(param.Parameterized):
         noargs = ArgSpec(args=[], varargs=None, keywords=None, defaults=None)
         return self.argspec == noargs
 
+    @property
+    def asynchronous(self):
+        "Returns True if the callable is a coroutine function"
+        return util.iscoroutinefunction(self.callable)
+
 
     def clone(self, callable=None, **overrides):
         """
@@ -535,11 +590,13 @@ class Callable(param.Parameterized):
         return self.__class__(callable, **params)
 
 
-    def __call__(self, *args, **kwargs):
-        # Nothing to do for callbacks that accept no arguments
-        kwarg_hash = kwargs.pop('memoization_hash', ())
-        (self.args, self.kwargs) = (args, kwargs)
-        if not args and not kwargs: return self.callable()
+    def _memoization_key(self, args, kwarg_hash):
+        """
+        Returns whether memoization is enabled given the state of the
+        streams on the inputs, the key of call arguments and stream
+        state and the hashable key the return values are memoized
+        under, which is None if the arguments cannot be hashed.
+        """
         inputs = [i for i in self.inputs if isinstance(i, DynamicMap)]
         streams = []
         for stream in [s for i in inputs for s in get_nested_streams(i)]:
@@ -549,10 +606,15 @@ class Callable(param.Parameterized):
         values = tuple(tuple(sorted(s.hashkey.items())) for s in streams)
         key = args + kwarg_hash + values
 
-        hashed_key = util.deephash(key) if self.memoize else None
-        if hashed_key is not None and memoize and hashed_key in self._memoized:
-            return self._memoized[hashed_key]
+        hashed = self.memoize or self.asynchronous
+        return memoize, key, (util.hashkey(key) if hashed else None)
 
+
+    def _keyword_args(self, args, kwargs):
+        """
+        Turns positional arguments into keyword arguments where the
+        argument names are known.
+        """
         if self.argspec.varargs is not None:
             # Missing information on positional argument names, cannot promote to keywords
             pass
@@ -567,16 +629,52 @@ class Callable(param.Parameterized):
                 self.warning('Positional arguments %r overriden by keywords'
                              % list(clashes))
             args, kwargs = (), dict(pos_kwargs, **kwargs)
+        return args, kwargs
+
+
+    def __call__(self, *args, **kwargs):
+        # Nothing to do for callbacks that accept no arguments
+        kwarg_hash = kwargs.pop('memoization_hash', ())
+        call_args, call_kwargs = args, kwargs
+        with self._lock:
+            (self.args, self.kwargs) = (args, kwargs)
+        if not args and not kwargs:
+            if None in self._resolved:
+                return self._resolved.pop(None).result()
+            ret = self.callable()
+            return util.run_coroutine(ret) if util.isawaitable(ret) else ret
+
+        memoize, key, hashed_key = self._memoization_key(args, kwarg_hash)
+        if self.memoize and memoize:
+            with self._lock:
+                if hashed_key in self._memoized:
+                    # Mark the memoized value as the most recently used
+                    ret = self._memoized.pop(hashed_key)
+                    self._memoized[hashed_key] = ret
+                    return ret
+
+        task = None if hashed_key is None else self._resolved.pop(hashed_key, None)
+        if task is not None:
+            # Use the result of a completed scheduled call only once
+            call = task.result
+        else:
+            args, kwargs = self._keyword_args(args, kwargs)
+            call = partial(self.callable, *args, **kwargs)
+            if self.persistent_cache is not None and self.memoize and memoize:
+                key = key + tuple(sorted(kwargs.items()))
+                call = partial(self._persistent_call, call, key)
 
         try:
-            ret = self.callable(*args, **kwargs)
+            ret = call()
+            if util.isawaitable(ret):
+                ret = util.run_coroutine(ret)
         except KeyError:
             # KeyError is caught separately because it is used to signal
             # invalid keys on DynamicMap and should not warn
             raise
         except:
-            posstr = ', '.join(['%r' % el for el in self.args]) if self.args else ''
-            kwstr = ', '.join('%s=%r' % (k,v) for k,v in self.kwargs.items())
+            posstr = ', '.join(['%r' % el for el in call_args]) if call_args else ''
+            kwstr = ', '.join('%s=%r' % (k,v) for k,v in call_kwargs.items())
             argstr = ', '.join([el for el in [posstr, kwstr] if el])
             message = ("Exception raised in callable '{name}' of type '{ctype}'.\n"
                        "Invoked as {name}({argstr})")
@@ -585,11 +683,100 @@ class Callable(param.Parameterized):
                                         argstr=argstr))
             raise
 
-        if hashed_key is not None:
-            self._memoized = {hashed_key : ret}
+        if self.memoize and hashed_key is not None:
+            with self._lock:
+                # Values memoized before an event on a triggering
+                # transient stream may be stale and are discarded
+                if not memoize:
+                    self._memoized.clear()
+                self._memoized.pop(hashed_key, None)
+                self._memoized[hashed_key] = ret
+                while len(self._memoized) > self.memoize_size:
+                    self._memoized.popitem(last=False)
+        return ret
+
+
+    def _persistent_call(self, call, key):
+        """
+        Looks up the return value for the key in the persistent cache,
+        invoking the call and storing the return value if it is not
+        available.
+        """
+        cache = self.persistent_cache
+        if self._cache_identity is None or self._cache_identity[0] is not cache:
+            # The identity of the callable is only computed once
+            self._cache_identity = (cache, cache.identity(self.callable))
+        identity = self._cache_identity[1]
+        hashkey = None if identity is None else cache.hashkey(identity, key)
+        if hashkey is not None:
+            try:
+                return cache.get(hashkey)
+            except KeyError:
+                pass
+        ret = call()
+        if util.isawaitable(ret):
+            ret = util.run_coroutine(ret)
+        if hashkey is not None:
+            cache.set(hashkey, ret)
         return ret
 
 
+    def schedule(self, *args, **kwargs):
+        """
+        Schedules a call to an asynchronous callable as a task on the
+        running asyncio event loop, returning the task or None if
+        the return value is already available. Once the task has
+        completed, calling the Callable with the same arguments returns
+        the result without blocking. Scheduling a call with different
+        arguments supersedes and cancels any pending call.
+        """
+        kwarg_hash = kwargs.pop('memoization_hash', ())
+        with self._lock:
+            (self.args, self.kwargs) = (args, kwargs)
+        if not self.asynchronous:
+            return None
+        elif not args and not kwargs:
+            return self._schedule(None, self.callable)
+
+        memoize, key, hashed_key = self._memoization_key(args, kwarg_hash)
+        if hashed_key is None or (self.memoize and memoize and hashed_key in self._memoized):
+            return None
+        args, kwargs = self._keyword_args(args, kwargs)
+        return self._schedule(hashed_key, partial(self.callable, *args, **kwargs))
+
+
+    def _schedule(self, hashed_key, call, keep_errors=False):
+        """
+        Schedules the coroutine returned by the supplied call as a task,
+        storing the completed task under the hashed_key so the result
+        is returned by the next matching call. Unless keep_errors is
+        set, tasks which raised are discarded, so the next matching
+        call invokes the callable again. A pending task with the same
+        hashed_key is reused.
+        """
+        import asyncio
+        if self._pending is not None:
+            pending_key, task = self._pending
+            if pending_key == hashed_key:
+                return task
+            task.cancel()
+            self._pending = None
+        if hashed_key is not None and hashed_key in self._resolved:
+            return None
+
+        def resolve(task):
+            if self._pending is not None and self._pending[1] is task:
+                self._pending = None
+            # Failed calls are not kept so the next call retries them
+            if not task.cancelled() and (keep_errors or task.exception() is None):
+                self._resolved = {hashed_key: task}
+
+        task = asyncio.ensure_future(call())
+        task.add_done_callback(resolve)
+        self._pending = (hashed_key, task)
+        return task
+
+
 
 class Generator(Callable):
     """
@@ -597,25 +784,74 @@ class Generator(Callable):
     arguments and never memoize.
     """
 
-    callable = param.ClassSelector(default=None, class_ = types.GeneratorType,
-                                   constant=True, doc="""
-         The generator that is wrapped by this Generator.""")
+    callable = param.ClassSelector(default=None, constant=True,
+                                   class_=(types.GeneratorType,)+util.async_generator_types,
+                                   doc="""
+         The generator (or asynchronous generator) that is wrapped by
+         this Generator.""")
 
     @property
     def argspec(self):
         return ArgSpec(args=[], varargs=None, keywords=None, defaults=None)
 
+    @property
+    def asynchronous(self):
+        "Returns True if the generator is an asynchronous generator"
+        return isinstance(self.callable, util.async_generator_types)
+
+    def schedule(self):
+        """
+        Schedules advancing an asynchronous generator as a task on the
+        running asyncio event loop, returning the task. The next call
+        returns the value the generator yielded without blocking.
+        """
+        if not self.asynchronous:
+            return None
+        # A generator which raised cannot be advanced again
+        return self._schedule(None, self.callable.__anext__, keep_errors=True)
+
     def __call__(self):
         try:
+            if None in self._resolved:
+                return self._resolved.pop(None).result()
+            elif self.asynchronous:
+                return util.run_coroutine(self.callable.__anext__())
             return next(self.callable)
         except StopIteration:
             raise
+        except util.async_stop_iteration:
+            raise StopIteration
         except Exception:
             msg = 'Generator {name} raised the following exception:'
             self.warning(msg.format(name=self.name))
             raise
 
 
+# DynamicMaps owning a pool of threads to prefetch keys
+_prefetching_dmaps = weakref.WeakSet()
+
+def _shutdown_prefetches():
+    """
+    Cancels the pending prefetches of all DynamicMaps so that exiting
+    the interpreter does not wait for them to be evaluated.
+    """
+    for dmap in list(_prefetching_dmaps):
+        dmap._shutdown_prefetch()
+
+_prefetch_exit_registered = False
+
+def _register_prefetch_exit():
+    """
+    Registers _shutdown_prefetches to run at exit once concurrent.futures
+    has been imported, so it runs before the handler joining the
+    threads of the pools.
+    """
+    global _prefetch_exit_registered
+    if not _prefetch_exit_registered:
+        atexit.register(_shutdown_prefetches)
+        _prefetch_exit_registered = True
+
+
 def get_nested_dmaps(dmap):
     """
     Get all DynamicMaps referenced by the supplied DynamicMap's callback.
@@ -733,23 +969,78 @@ class DynamicMap(HoloMap):
        updating the streams.""" )
 
     cache_size = param.Integer(default=500, doc="""
-       The number of entries to cache for fast access. This is an LRU
-       cache where the least recently used item is overwritten once
-       the cache is full.""")
+       The number of entries to cache for fast access. Once the cache
+       is full entries are evicted according to the cache_policy.""")
+
+    cache_policy = param.ObjectSelector(default='lru', objects=['fifo', 'lru', 'lfu'], doc="""
+       The policy used to select the entry to evict when the cache is
+       full. The 'fifo' policy evicts the oldest entry, the 'lru' policy
+       the least recently used entry and the 'lfu' policy the least
+       frequently used entry, evicting the least recently used of
+       equally frequently used entries.""")
+
+    cache_bytes = param.Integer(default=None, allow_None=True, bounds=(0, None), doc="""
+       Optional budget for the number of bytes held by the cache,
+       estimated from the nbytes of the data of each cached element.
+       Entries are evicted according to the cache_policy until the
+       newly cached entry fits within the budget.""")
+
+    persistent_cache = param.Parameter(default=None, doc="""
+       Optional persistent cache, e.g. a holoviews.core.io.FileCache,
+       the elements returned by the callback are stored in, allowing
+       them to be reused across Python sessions. Sets the
+       persistent_cache of the Callable wrapping the callback.""")
+
+    executor = param.Parameter(default='serial', doc="""
+       The executor used to evaluate the callback for the missing keys
+       of a cross-product or sampled lookup, which may be 'serial',
+       'thread' to use a pool of threads or a thread based
+       concurrent.futures Executor instance. The results are cached
+       and retain the order of the requested keys.""")
+
+    max_workers = param.Integer(default=None, allow_None=True, bounds=(1, None), doc="""
+       The maximum number of workers used when the executor is
+       'thread' and by the pool used to prefetch keys, defaulting to
+       the number of CPUs.""")
+
+    prefetch = param.Integer(default=0, bounds=(0, None), doc="""
+       The number of neighbouring values along each key dimension to
+       precompute in the background whenever a key is looked up, e.g.
+       the adjacent values of the sliders of a widget. Neighbours are
+       only determined for key dimensions which declare values or a
+       step. The callbacks are evaluated on the executor if it is an
+       Executor instance, otherwise on a pool of threads owned by the
+       DynamicMap, which is shut down when it is reset.""")
 
     def __init__(self, callback, initial_items=None, **params):
 
-        if isinstance(callback, types.GeneratorType):
+        if isinstance(callback, (types.GeneratorType,)+util.async_generator_types):
             callback = Generator(callback)
         elif not isinstance(callback, Callable):
             callback = Callable(callback)
 
+        persistent_cache = params.get('persistent_cache')
+        if (persistent_cache is not None and not isinstance(callback, Generator)
+            and callback.persistent_cache is not persistent_cache):
+            callback = callback.clone(persistent_cache=persistent_cache)
+
         if 'sampled' in params:
             self.warning('DynamicMap sampled parameter is deprecated '
                          'and no longer needs to be specified.')
             del params['sampled']
 
         super(DynamicMap, self).__init__(initial_items, callback=callback, **params)
+
+        # Usage of each cached key as [hits, nbytes], ordered by
+        # insertion or by recency of use depending on the cache_policy
+        self._cache_usage = OrderedDict()
+        self.cache_stats = dict(hits=0, misses=0, evictions=0, nbytes=0)
+
+        # Futures of the callbacks submitted to prefetch keys and the
+        # pool of threads they are submitted to
+        self._prefetched = OrderedDict()
+        self._prefetch_pool = None
+
         invalid = [s for s in self.streams if not isinstance(s, Stream)]
         if invalid:
             msg = ('The supplied streams list contains objects that '
@@ -822,6 +1113,19 @@ class DynamicMap(HoloMap):
         return tuple(key)
 
 
+    @property
+    def _cache_disabled(self):
+        """
+        Whether the cache is bypassed because the DynamicMap has no
+        key dimensions and stream parameters or has dimensionless
+        streams.
+        """
+        dimensionless = util.dimensionless_contents(get_nested_streams(self),
+                                                    self.kdims, no_duplicates=False)
+        empty = util.stream_parameters(self.streams) == [] and self.kdims==[]
+        return bool(dimensionless or empty)
+
+
     def _validate_key(self, key):
         """
         Make sure the supplied key values are within the bounds
@@ -880,10 +1184,10 @@ class DynamicMap(HoloMap):
         return retval.opts(spec)
 
 
-    def _execute_callback(self, *args):
+    def _callback_args(self, *args):
         """
-        Execute the callback, validating both the input key and output
-        key where applicable.
+        Validates the input key and returns the arguments and keywords
+        the callback is invoked with for the supplied key.
         """
         self._validate_key(args)      # Validate input key
 
@@ -901,10 +1205,184 @@ class DynamicMap(HoloMap):
             kwargs = dict(flattened)
         if not isinstance(self.callback, Generator):
             kwargs['memoization_hash'] = hash_items
+        return args, kwargs
+
+
+    def _execute_callback(self, *args):
+        """
+        Execute the callback, validating both the input key and output
+        key where applicable.
+        """
+        args, kwargs = self._callback_args(*args)
+        with dynamicmap_memoization(self.callback, self.streams):
+            return self._styled_callback(args, kwargs)
+
+
+    def _styled_callback(self, args, kwargs):
+        return self._style(self.callback(*args, **kwargs))
+
+
+    def _worker_callback(self, memoize, args, kwargs):
+        """
+        Executes the callback on a worker thread, applying the stream
+        memoization state of the thread that submitted the callback.
+        """
+        self.callback._stream_memoization = memoize
+        return self._styled_callback(args, kwargs)
+
+
+    def _execute_callbacks(self, keys):
+        """
+        Executes the callback for each of the supplied keys using the
+        executor, returning the results in the order of the keys.
+        """
+        executor = self.executor
+        if executor == 'serial' or len(keys) < 2 or self.callback.noargs:
+            return [self._execute_callback(*key) for key in keys]
+
+        from concurrent import futures
+        if executor == 'thread':
+            with futures.ThreadPoolExecutor(self.max_workers or cpu_count()) as pool:
+                return self._submit_callbacks(pool, keys)
+        elif isinstance(executor, futures.Executor):
+            return self._submit_callbacks(executor, keys)
+        raise ValueError("DynamicMap executor must be one of 'serial', "
+                         "'thread' or a concurrent.futures Executor, "
+                         "not %r." % executor)
+
+
+    def _submit_callbacks(self, pool, keys):
+        """
+        Submits the callback for each of the supplied keys to the
+        executor and collects the results in the order of the keys.
+        The callback arguments are resolved before any callback is
+        submitted so that the workers do not access the streams.
+        """
+        calls = [self._callback_args(*key) for key in keys]
+        with dynamicmap_memoization(self.callback, self.streams):
+            memoize = self.callback._stream_memoization
+        results = [pool.submit(self._worker_callback, memoize, args, kwargs)
+                   for args, kwargs in calls]
+        return [result.result() for result in results]
+
+
+    def _neighbour_keys(self, key):
+        """
+        Returns the valid keys up to prefetch values away from the
+        supplied key along each key dimension declaring values or a
+        step, ordered from the nearest to the furthest neighbours.
+        """
+        stream_params = set(util.stream_parameters(self.streams))
+        neighbours = []
+        for offset in range(1, self.prefetch+1):
+            for i, kdim in enumerate(self.kdims):
+                if kdim.name in stream_params:
+                    continue
+                elif kdim.values:
+                    values = list(kdim.values)
+                    if all(util.isnumeric(v) for v in values):
+                        values = sorted(values)
+                    if key[i] not in values:
+                        continue
+                    idx = values.index(key[i])
+                    candidates = [values[j] for j in (idx+offset, idx-offset)
+                                  if 0 <= j < len(values)]
+                elif kdim.step is not None:
+                    candidates = [key[i]+offset*kdim.step, key[i]-offset*kdim.step]
+                else:
+                    continue
+                for value in candidates:
+                    neighbour = key[:i]+(value,)+key[i+1:]
+                    try:
+                        self._validate_key(neighbour)
+                    except KeyError:
+                        continue
+                    neighbours.append(neighbour)
+        return neighbours
+
+
+    def _prefetch(self, key):
+        """
+        Submits the callback for the keys neighbouring the supplied key
+        to be evaluated in the background. Completed prefetches are
+        moved into the cache while pending prefetches of keys which are
+        no longer neighbours are cancelled.
+        """
+        if not self.prefetch or self.callback.noargs or self._cache_disabled:
+            return
+        neighbours = self._neighbour_keys(key)
+        for k, future in list(self._prefetched.items()):
+            if future.done():
+                del self._prefetched[k]
+                if (not future.cancelled() and future.exception() is None
+                    and k not in self.data):
+                    self._cache(k, future.result())
+            elif k not in neighbours and future.cancel():
+                del self._prefetched[k]
+
+        from concurrent import futures
+        if isinstance(self.executor, futures.Executor):
+            pool = self.executor
+        else:
+            if self._prefetch_pool is None:
+                _register_prefetch_exit()
+                self._prefetch_pool = futures.ThreadPoolExecutor(self.max_workers or cpu_count())
+                _prefetching_dmaps.add(self)
+            pool = self._prefetch_pool
+        with dynamicmap_memoization(self.callback, self.streams):
+            memoize = self.callback._stream_memoization
+        for k in neighbours:
+            if k in self.data or k in self._prefetched:
+                continue
+            args, kwargs = self._callback_args(*k)
+            self._prefetched[k] = pool.submit(self._worker_callback, memoize, args, kwargs)
+
+
+    def _prefetched_callback(self, key):
+        """
+        Returns the result of the prefetched callback for the supplied
+        key, waiting for it to complete if necessary, or executes the
+        callback if the key was not prefetched. Exceptions raised by
+        a prefetched callback are reraised.
+        """
+        future = self._prefetched.pop(key, None)
+        if future is not None and not future.cancelled():
+            return future.result()
+        return self._execute_callback(*key)
+
+
+    def _shutdown_prefetch(self):
+        """
+        Cancels pending prefetches and shuts down the pool of threads
+        used to prefetch keys.
+        """
+        for future in self._prefetched.values():
+            future.cancel()
+        self._prefetched = OrderedDict()
+        if self._prefetch_pool is not None:
+            self._prefetch_pool.shutdown(wait=False)
+            self._prefetch_pool = None
+        _prefetching_dmaps.discard(self)
+
 
+    def _schedule_callback(self, *args):
+        """
+        Schedules an asynchronous callback for the supplied key on the
+        running asyncio event loop, returning the scheduled task or
+        None if the callback is synchronous, the key is cached or the
+        callback does not have to be invoked.
+        """
+        if not self.callback.asynchronous:
+            return None
+        tuple_key = util.wrap_tuple_streams(args, self.kdims, self.streams)
+        if tuple_key in self.data and not self._cache_disabled:
+            return None
+        try:
+            args, kwargs = self._callback_args(*tuple_key)
+        except KeyError:
+            return None
         with dynamicmap_memoization(self.callback, self.streams):
-            retval = self.callback(*args, **kwargs)
-        return self._style(retval)
+            return self.callback.schedule(*args, **kwargs)
 
 
     def opts(self, options=None, backend=None, clone=True, **kwargs):
@@ -992,6 +1470,9 @@ class DynamicMap(HoloMap):
         Return a cleared dynamic map with a cleared cached
         """
         self.data = OrderedDict()
+        self._cache_usage = OrderedDict()
+        self.cache_stats['nbytes'] = 0
+        self._shutdown_prefetch()
         return self
 
 
@@ -1004,7 +1485,9 @@ class DynamicMap(HoloMap):
 
         Each key inside the cross product is looked up in the cache
         (self.data) to check if the appropriate element is
-        available. Otherwise the element is computed accordingly.
+        available. Otherwise the element is computed using the
+        executor and cached, subject to the cache_size and
+        cache_policy of the DynamicMap.
 
         The data_slice may specify slices into each value in the
         the cross-product.
@@ -1018,13 +1501,20 @@ class DynamicMap(HoloMap):
                     else set([el]) for el in tuple_key]
             product = itertools.product(*args)
 
+        keys = [util.wrap_tuple(inner_key) for inner_key in product]
+        missing = [key for key in keys if key not in cache]
+        computed = dict(zip(missing, self._execute_callbacks(missing)))
+
         data = []
-        for inner_key in product:
-            key = util.wrap_tuple(inner_key)
+        for key in keys:
             if key in cache:
                 val = cache[key]
+                self._cache_hit(key)
             else:
-                val = self._execute_callback(*key)
+                val = computed[key]
+                self.cache_stats['misses'] += 1
+                if not self._cache_disabled:
+                    self._cache(key, val)
             if data_slice:
                 val = self._dataslice(val, data_slice)
             data.append((key, val))
@@ -1101,10 +1591,7 @@ class DynamicMap(HoloMap):
 
         # Cache lookup
         try:
-            dimensionless = util.dimensionless_contents(get_nested_streams(self),
-                                                        self.kdims, no_duplicates=False)
-            empty = util.stream_parameters(self.streams) == [] and self.kdims==[]
-            if dimensionless or empty:
+            if self._cache_disabled:
                 raise KeyError('Using dimensionless streams disables DynamicMap cache')
             cache = super(DynamicMap,self).__getitem__(key)
         except KeyError:
@@ -1116,11 +1603,17 @@ class DynamicMap(HoloMap):
             return product
 
         # Not a cross product and nothing cached so compute element.
-        if cache is not None: return cache
-        val = self._execute_callback(*tuple_key)
+        if cache is not None:
+            if tuple_key in self.data:
+                self._cache_hit(tuple_key)
+                self._prefetch(tuple_key)
+            return cache
+        self.cache_stats['misses'] += 1
+        val = self._prefetched_callback(tuple_key)
         if data_slice:
             val = self._dataslice(val, data_slice)
         self._cache(tuple_key, val)
+        self._prefetch(tuple_key)
         return val
 
 
@@ -1164,10 +1657,54 @@ class DynamicMap(HoloMap):
         """
         cache_size = (1 if util.dimensionless_contents(self.streams, self.kdims)
                       else self.cache_size)
-        if len(self) >= cache_size:
-            first_key = next(k for k in self.data)
-            self.data.pop(first_key)
+        nbytes = 0
+        if isinstance(val, Dimensioned):
+            nbytes = sum(val.traverse(lambda x: util.data_nbytes(x.data)))
+        budget = None if self.cache_bytes is None else self.cache_bytes-nbytes
+        self._evict(key, cache_size-1, budget)
         self[key] = val
+        self._cache_usage[key] = [0, nbytes]
+        self.cache_stats['nbytes'] += nbytes
+
+
+    def _cache_hit(self, key):
+        """
+        Records a cache hit on the supplied key, marking it as the
+        most recently used entry unless the cache_policy is 'fifo'.
+        """
+        self.cache_stats['hits'] += 1
+        usage = self._cache_usage
+        if key not in usage:
+            return
+        usage[key][0] += 1
+        if self.cache_policy != 'fifo':
+            usage[key] = usage.pop(key)
+
+
+    def _evict(self, key, size, nbytes):
+        """
+        Evicts entries from the cache according to the cache_policy
+        until at most size entries remain and the cached entries hold
+        at most nbytes, after discarding the entry for the supplied
+        key. Entries added to the cache directly are evicted first.
+        """
+        usage, stats = self._cache_usage, self.cache_stats
+        for k in [k for k in usage if k == key or k not in self.data]:
+            stats['nbytes'] -= usage.pop(k)[1]
+        if key in self.data:
+            self.pop(key)
+        while self.data and (len(self) > size or (nbytes is not None and
+                                                  stats['nbytes'] > nbytes)):
+            if len(usage) < len(self):
+                evicted = next(k for k in self.data if k not in usage)
+            elif self.cache_policy == 'lfu':
+                evicted = min(usage, key=lambda k: usage[k][0])
+            else:
+                evicted = next(iter(usage))
+            self.pop(evicted)
+            if evicted in usage:
+                stats['nbytes'] -= usage.pop(evicted)[1]
+            stats['evictions'] += 1
 
 
     def map(self, map_fn, specs=None, clone=True, link_inputs=True):
@@ -1,5 +1,6 @@
 import os, sys, warnings, operator
 import time
+import hashlib
 import types
 import numbers
 import inspect
@@ -47,6 +48,11 @@ try:
 except ImportError:
     dd = None
 
+try:
+    import asyncio
+except ImportError:
+    asyncio = None
+
 
 class VersionError(Exception):
     "Raised when there is a library version mismatch."
@@ -209,17 +215,96 @@ def deephash(obj):
         return None
 
 
+def _buffer_digest(arr):
+    "Returns a digest of the memory buffer of a NumPy array."
+    return hashlib.md5(np.ascontiguousarray(arr).view(np.uint8)).digest()
+
+
+def _hashable(obj):
+    """
+    Converts an object to a hashable representation of its structure
+    and contents for use by fasthash.
+    """
+    obj_type = type(obj)
+    if obj_type in _primitive_types:
+        # Ensure numbers of different types do not hash identically
+        return (obj_type, obj)
+    elif obj_type is tuple or obj_type is list:
+        types = tuple(map(type, obj))
+        if _primitive_set.issuperset(types):
+            return (types, tuple(obj))
+        return tuple(map(_hashable, obj))
+    elif isinstance(obj, (list, tuple)):
+        return tuple(_hashable(o) for o in obj)
+    elif isinstance(obj, dict):
+        return frozenset((_hashable(k), _hashable(v)) for k, v in obj.items())
+    elif isinstance(obj, (set, frozenset)):
+        return frozenset(_hashable(o) for o in obj)
+    elif isinstance(obj, np.ndarray):
+        if obj.dtype.kind == 'O':
+            return (obj.shape, _hashable(obj.tolist()))
+        return (obj.dtype.str, obj.shape, _buffer_digest(obj))
+    elif pd and isinstance(obj, (pd.Series, pd.DataFrame)):
+        try:
+            hashed = pd.util.hash_pandas_object(obj).values
+        except (AttributeError, TypeError):
+            return obj.to_csv()
+        labels = tuple(obj.columns) if isinstance(obj, pd.DataFrame) else obj.name
+        return (type(obj).__name__, labels, _buffer_digest(hashed))
+    elif isinstance(obj, numbers.Number):
+        # Ensure numbers of different types do not hash identically
+        return (type(obj), obj)
+    hash(obj) # Raises TypeError for unhashable objects
+    return obj
+
+
+def hashkey(obj):
+    """
+    Given an object, return a hashable key representing its structure
+    and contents, which compares equal to the key of another object
+    only if their contents are equal, or None if the object contains
+    unhashable values. Unlike fasthash the key may be used to look up
+    values without the risk of hash collisions.
+    """
+    try:
+        return _hashable(obj)
+    except:
+        return None
+
+
+def fasthash(obj):
+    """
+    Given an object, return a hash of its structure and contents.
+    Unlike deephash the object is not serialized to JSON, instead
+    containers are hashed directly and NumPy arrays and pandas
+    objects are hashed by a digest of their memory buffers. Like
+    deephash the hash is not architecture, Python version or
+    platform independent.
+    """
+    key = hashkey(obj)
+    return None if key is None else hash(key)
+
+
 # Python3 compatibility
 if sys.version_info.major == 3:
     basestring = str
     unicode = str
     long = int
     generator_types = (zip, range, types.GeneratorType)
+    async_generator_types = ((types.AsyncGeneratorType,)
+                             if hasattr(types, 'AsyncGeneratorType') else ())
+    async_stop_iteration = getattr(builtins, 'StopAsyncIteration', StopIteration)
 else:
     basestring = basestring
     unicode = unicode
     from itertools import izip
     generator_types = (izip, xrange, types.GeneratorType) # noqa
+    async_generator_types = ()
+    async_stop_iteration = StopIteration
+
+_primitive_types = (int, long, float, bool, complex, basestring, unicode,
+                    bytes, type(None))
+_primitive_set = frozenset(_primitive_types)
 
 
 
@@ -348,7 +433,7 @@ def callable_name(callable_obj):
             if meth.__name__ == '__call__':
                 return type(owner).__name__
             return '.'.join([owner.__name__, meth.__name__])
-        elif isinstance(callable_obj, types.GeneratorType):
+        elif isinstance(callable_obj, (types.GeneratorType,)+async_generator_types):
             return callable_obj.__name__
         else:
             return type(callable_obj).__name__
@@ -356,6 +441,98 @@ def callable_name(callable_obj):
         return str(callable_obj)
 
 
+def iscoroutinefunction(callable_obj):
+    """
+    Whether the supplied callable is a coroutine function, i.e. it was
+    declared using async def, unwrapping partials and callable objects.
+    """
+    check = getattr(inspect, 'iscoroutinefunction', None)
+    if check is None:
+        return False
+    elif isinstance(callable_obj, partial):
+        callable_obj = callable_obj.func
+    elif not (inspect.isfunction(callable_obj) or inspect.ismethod(callable_obj)):
+        callable_obj = getattr(callable_obj, '__call__', callable_obj)
+    return check(callable_obj)
+
+
+def isawaitable(obj):
+    "Whether the supplied object is a coroutine or other awaitable."
+    check = getattr(inspect, 'isawaitable', None)
+    return check is not None and check(obj)
+
+
+def running_loop():
+    """
+    Returns the asyncio event loop running in the current thread or
+    None if no event loop is running.
+    """
+    if asyncio is None:
+        return None
+    get_loop = getattr(asyncio, '_get_running_loop', None)
+    return None if get_loop is None else get_loop()
+
+
+def run_coroutine(coroutine):
+    """
+    Runs a coroutine (or other awaitable) to completion and returns
+    the result. Since an event loop cannot be reentered, the coroutine
+    is run in a separate thread if an event loop is already running
+    in the current thread, e.g. in a notebook kernel.
+    """
+    if running_loop() is not None:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(1) as pool:
+            return pool.submit(run_coroutine, coroutine).result()
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def running_ioloop():
+    """
+    Returns the tornado IOLoop running in the current thread or None,
+    e.g. the loop of a notebook kernel or bokeh server on versions of
+    tornado which do not run on an asyncio event loop.
+    """
+    try:
+        from tornado.ioloop import IOLoop
+    except ImportError:
+        return None
+    loop = IOLoop.current(instance=False)
+    return loop if getattr(loop, '_running', False) else None
+
+
+class _IOLoopTimeout(object):
+    "Handle allowing a timeout on a tornado IOLoop to be cancelled."
+
+    def __init__(self, loop, delay, callback):
+        self._loop = loop
+        self._timeout = loop.call_later(delay, callback)
+
+    def cancel(self):
+        self._loop.remove_timeout(self._timeout)
+
+
+def call_later(delay, callback):
+    """
+    Schedules the callback to be called after the delay (in seconds)
+    on the event loop running in the current thread, returning a
+    handle with a cancel method. Returns None without scheduling the
+    callback if no asyncio event loop or tornado IOLoop is running,
+    since calling it from another thread would not be safe.
+    """
+    loop = running_loop()
+    if loop is not None:
+        return loop.call_later(delay, callback)
+    ioloop = running_ioloop()
+    if ioloop is not None:
+        return _IOLoopTimeout(ioloop, delay, callback)
+    return None
+
+
 def process_ellipses(obj, key, vdim_selection=False):
     """
     Helper function to pad a __getitem__ key with the right number of
@@ -1467,6 +1644,210 @@ def arglexsort(arrays):
     return recarray.argsort()
 
 
+def _lookup_array(arr, values):
+    """
+    Converts a list of values to an array which may be compared
+    against the supplied array using sort based lookups, raising a
+    TypeError if the types are incompatible or would be coerced.
+    """
+    lookup = np.asarray(values)
+    if arr.dtype.kind in 'Mm' and lookup.dtype.kind not in 'Mm':
+        lookup = lookup.astype(arr.dtype)
+    kinds = (arr.dtype.kind, lookup.dtype.kind)
+    if (lookup.dtype.kind in 'SU' and
+        not all(isinstance(v, (basestring, bytes)) for v in values)):
+        # Mixed values are coerced to strings by NumPy
+        raise TypeError('Mixed types')
+    if not (all(k in 'biuf' for k in kinds) or all(k in 'SU' for k in kinds)
+            or kinds[0] == kinds[1] and kinds[0] in 'Mm'):
+        raise TypeError('Incompatible types')
+    return lookup
+
+
+def isin(arr, values):
+    """
+    Vectorized membership test returning a boolean mask of the
+    elements in the array which are contained in the supplied values.
+    Uses a sort based lookup for compatible types, falling back to a
+    hash based lookup for arrays and values which cannot be sorted.
+    """
+    arr = np.asarray(arr)
+    values = list(values)
+    if not values:
+        return np.zeros(arr.shape, dtype=bool)
+    try:
+        return np.isin(arr, _lookup_array(arr, values))
+    except (TypeError, ValueError):
+        pass
+    try:
+        lookup = set(values)
+    except TypeError:
+        return np.logical_or.reduce([arr == v for v in values])
+    return np.array([v in lookup for v in arr.flat], dtype=bool).reshape(arr.shape)
+
+
+def factorize_array(arr):
+    """
+    Encodes the supplied array as integer codes, returning the codes
+    and the unique values in the order they first appear in the array.
+    Arrays which cannot be sorted (e.g. mixed object arrays) fall back
+    to a hashing based approach.
+    """
+    arr = np.asarray(arr)
+    try:
+        uniques, first, codes = np.unique(arr, return_index=True,
+                                          return_inverse=True)
+    except TypeError:
+        lookup = OrderedDict()
+        codes = np.array([lookup.setdefault(v, len(lookup)) for v in arr],
+                         dtype=np.int64)
+        uniques = np.empty(len(lookup), dtype=arr.dtype)
+        uniques[:] = list(lookup)
+        return codes, uniques
+    codes = codes.reshape(arr.shape)
+    if arr.dtype.kind in 'fcmM' and len(uniques):
+        # NumPy does not merge NaNs (or NaTs), which are sorted last
+        missing = np.isnat(uniques) if arr.dtype.kind in 'mM' else np.isnan(uniques)
+        if missing.sum() > 1:
+            nan = missing.argmax()
+            codes = np.minimum(codes, nan)
+            first = np.concatenate([first[:nan], [first[nan:].min()]])
+            uniques = uniques[:nan+1]
+    order = np.argsort(first)
+    remap = np.empty(len(order), dtype=np.int64)
+    remap[order] = np.arange(len(order))
+    return remap[codes], uniques[order]
+
+
+def group_partitions(arrays):
+    """
+    Partitions the rows of a list of equal length key arrays into
+    groups of identical keys using a single factorization and stable
+    argsort instead of computing a mask per group. Returns the unique
+    key tuples in the order they first appear, the row ordering which
+    makes each group contiguous and a list of slices into the reordered
+    rows, one per group. Within a group rows retain their original order.
+    """
+    if not arrays:
+        return [()], slice(None), [slice(None)]
+    arrays = [np.asarray(arr) for arr in arrays]
+    codes = np.zeros(len(arrays[0]), dtype=np.int64)
+    for arr in arrays:
+        arr_codes, uniques = factorize_array(arr)
+        # Refactorize combined codes to avoid integer overflow
+        codes, _ = factorize_array(codes*len(uniques)+arr_codes)
+    order = np.argsort(codes, kind='mergesort')
+    bounds = np.cumsum(np.bincount(codes))
+    starts = np.concatenate([[0], bounds[:-1]]).astype(np.int64)[:len(bounds)]
+    keys = list(zip(*[arr[order[starts]] for arr in arrays]))
+    slices = [slice(s, e) for s, e in zip(starts, bounds)]
+    return keys, order, slices
+
+
+def group_key(key):
+    """
+    Normalizes a tuple of group key values such that values which
+    compare equal also hash identically, e.g. converting datetime
+    types to nanosecond datetime64 values and NaNs (including NaT)
+    to None.
+    """
+    normalized = []
+    for v in key:
+        if isinstance(v, datetime_types):
+            try:
+                v = np.datetime64(v, 'ns')
+            except (TypeError, ValueError):
+                pass
+        if v is None or is_nan(v) or (pd is not None and v is pd.NaT):
+            v = None
+        normalized.append(v)
+    return tuple(normalized)
+
+
+def _join_codes(arr, values):
+    """
+    Encodes an array and a list of values using a shared set of
+    integer codes, returning the codes of the array, the codes of
+    the values (-1 where the value does not occur in the array) and
+    the number of unique values in the array.
+    """
+    try:
+        lookup = _lookup_array(arr, values)
+        uniques, codes = np.unique(arr, return_inverse=True)
+        pos = np.searchsorted(uniques, lookup).clip(0, max(len(uniques)-1, 0))
+        found = uniques[pos] == lookup if len(uniques) else np.zeros(len(lookup), dtype=bool)
+        return codes.reshape(arr.shape), np.where(found, pos, -1), len(uniques)
+    except (TypeError, ValueError):
+        codes, uniques = factorize_array(arr)
+        mapping = {}
+        for i, v in enumerate(uniques):
+            mapping.setdefault(v, i)
+        value_codes = []
+        for v in values:
+            try:
+                value_codes.append(mapping.get(v, -1))
+            except TypeError:
+                value_codes.append(-1)
+        return codes, np.array(value_codes, dtype=np.int64), len(uniques)
+
+
+def sample_indices(arrays, samples):
+    """
+    Joins a list of sample coordinates against the rows of a list of
+    equal length key arrays, returning the indices of the rows which
+    match each sample in the order the samples were supplied. Samples
+    may specify coordinates for a leading subset of the arrays and
+    rows matching multiple samples are only returned once. Instead of
+    computing one mask per sample the keys and samples are encoded
+    as integer codes and joined in a single sorted pass.
+    """
+    samples = [tuple(s) if isinstance(s, (list, tuple)) else (s,)
+               for s in samples]
+    if not samples or not arrays:
+        return np.array([], dtype=np.int64)
+    arrays = [np.asarray(arr) for arr in arrays[:len(samples[0])]]
+    row_codes = np.zeros(len(arrays[0]), dtype=np.int64)
+    sample_codes = np.zeros(len(samples), dtype=np.int64)
+    missing = np.zeros(len(samples), dtype=bool)
+    for i, arr in enumerate(arrays):
+        codes, value_codes, n = _join_codes(arr, [s[i] for s in samples])
+        missing |= value_codes < 0
+        # Refactorize combined codes to avoid integer overflow
+        combined, _ = factorize_array(np.concatenate([row_codes*n+codes,
+                                                      sample_codes*n+value_codes]))
+        row_codes, sample_codes = combined[:len(row_codes)], combined[len(row_codes):]
+
+    # Drop samples without matches and duplicated samples
+    sample_codes = sample_codes[~missing]
+    _, first = np.unique(sample_codes, return_index=True)
+    sample_codes = sample_codes[np.sort(first)]
+
+    # Look up the contiguous run of matching rows for each sample
+    order = np.argsort(row_codes, kind='mergesort')
+    sorted_codes = row_codes[order]
+    lower = np.searchsorted(sorted_codes, sample_codes, 'left')
+    counts = np.searchsorted(sorted_codes, sample_codes, 'right') - lower
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts)-counts, counts)
+    return order[np.repeat(lower, counts)+offsets]
+
+
+def data_nbytes(data):
+    """
+    Estimates the number of bytes held by the supplied data, which
+    may be an array, a pandas or xarray object or a dictionary, list
+    or tuple of such objects. Any other objects are not counted.
+    """
+    if hasattr(data, 'memory_usage'):
+        return int(np.sum(data.memory_usage()))
+    elif hasattr(data, 'nbytes') and not isinstance(data, type):
+        return int(data.nbytes)
+    elif isinstance(data, dict):
+        return sum(data_nbytes(v) for v in data.values())
+    elif isinstance(data, (list, tuple)):
+        return sum(data_nbytes(v) for v in data)
+    return 0
+
+
 def dimensioned_streams(dmap):
     """
     Given a DynamicMap return all streams that have any dimensioned
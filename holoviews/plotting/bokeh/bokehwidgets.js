@@ -25,6 +25,11 @@ var BokehMethods = {
     var data = this.frames[current];
 	if (data !== undefined) {
       var doc = Bokeh.index[data.root].model.document;
+      // Frame patches are relative to the first frame
+      var base = this.frames['base'];
+      if (base !== undefined) {
+        doc.apply_json_patch(base.content);
+      }
       doc.apply_json_patch(data.content);
     }
   },
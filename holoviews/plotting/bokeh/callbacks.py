@@ -1,6 +1,7 @@
 from collections import defaultdict
 
 import param
+from bokeh.io import curdoc
 from bokeh.models import (CustomJS, FactorRange, DatetimeAxis, ColumnDataSource)
 
 from ...core import OrderedDict
@@ -972,6 +973,38 @@ class PolyEditCallback(CDSCallback):
 
 
 
+class DocumentTimeout(object):
+    """
+    Handle allowing a timeout callback on a bokeh Document to be
+    cancelled.
+    """
+
+    def __init__(self, doc, delay, callback):
+        self._doc = doc
+        self._timeout = doc.add_timeout_callback(callback, int(delay*1000))
+
+    def cancel(self):
+        try:
+            self._doc.remove_timeout_callback(self._timeout)
+        except ValueError:
+            pass # Callback already ran or was removed
+
+
+def schedule_document_trigger(delay, callback):
+    """
+    Schedules a deferred stream trigger as a timeout callback on the
+    bokeh server Document the events are received on, so that the
+    plots are updated while holding the Document lock. Returns None
+    outside of a bokeh server session.
+    """
+    doc = curdoc()
+    if doc is None or doc.session_context is None:
+        return None
+    return DocumentTimeout(doc, delay, callback)
+
+
+Stream._schedulers['bokeh'] = schedule_document_trigger
+
 callbacks = Stream._callbacks['bokeh']
 
 callbacks[PointerXY]   = PointerXYCallback
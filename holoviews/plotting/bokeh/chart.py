@@ -14,7 +14,7 @@ from ...operation import interpolate_curve
 from ..util import compute_sizes, get_min_distance, dim_axis_label
 from .element import (ElementPlot, ColorbarPlot, LegendPlot, line_properties,
                       fill_properties)
-from .util import expand_batched_style, categorize_array, rgb2hex, mpl_to_bokeh
+from .util import categorize_array, rgb2hex, mpl_to_bokeh
 
 
 class PointPlot(LegendPlot, ColorbarPlot):
@@ -102,38 +102,6 @@ class PointPlot(LegendPlot, ColorbarPlot):
         return data, mapping, style
 
 
-    def get_batched_data(self, element, ranges):
-        data = defaultdict(list)
-        zorders = self._updated_zorders(element)
-        for (key, el), zorder in zip(element.data.items(), zorders):
-            self.set_param(**self.lookup_options(el, 'plot').options)
-            style = self.lookup_options(element.last, 'style')
-            style = style.max_cycles(len(self.ordering))[zorder]
-            eldata, elmapping, style = self.get_data(el, ranges, style)
-            for k, eld in eldata.items():
-                data[k].append(eld)
-
-            # Skip if data is empty
-            if not eldata:
-                continue
-
-            # Apply static styles
-            nvals = len(list(eldata.values())[0])
-            sdata, smapping = expand_batched_style(style, self._batched_style_opts,
-                                                   elmapping, nvals)
-            elmapping.update(smapping)
-            for k, v in sdata.items():
-                data[k].append(v)
-
-            if any(isinstance(t, HoverTool) for t in self.state.tools):
-                for dim, k in zip(element.dimensions(), key):
-                    sanitized = dimension_sanitizer(dim.name)
-                    data[sanitized].append([k]*nvals)
-
-        data = {k: np.concatenate(v) for k, v in data.items()}
-        return data, elmapping, style
-
-
 
 class VectorFieldPlot(ColorbarPlot):
 
@@ -287,45 +255,13 @@ class CurvePlot(ElementPlot):
             line_policy = 'nearest'
         return dims, dict(line_policy=line_policy)
 
-    def get_batched_data(self, overlay, ranges):
-        data = defaultdict(list)
-
-        zorders = self._updated_zorders(overlay)
-        for (key, el), zorder in zip(overlay.data.items(), zorders):
-            self.set_param(**self.lookup_options(el, 'plot').options)
-            style = self.lookup_options(el, 'style')
-            style = style.max_cycles(len(self.ordering))[zorder]
-            eldata, elmapping, style = self.get_data(el, ranges, style)
-
-            # Skip if data empty
-            if not eldata:
-                continue
-
-            for k, eld in eldata.items():
-                data[k].append(eld)
-
-            # Apply static styles
-            sdata, smapping = expand_batched_style(style, self._batched_style_opts,
-                                                   elmapping, nvals=1)
-            elmapping.update(smapping)
-            for k, v in sdata.items():
-                data[k].append(v[0])
-
-            for d, k in zip(overlay.kdims, key):
-                sanitized = dimension_sanitizer(d.name)
-                data[sanitized].append(k)
-        data = {opt: vals for opt, vals in data.items()
-                if not any(v is None for v in vals)}
-        mapping = {{'x': 'xs', 'y': 'ys'}.get(k, k): v
-                   for k, v in elmapping.items()}
-        return data, mapping, style
-
 
 
 class HistogramPlot(ElementPlot):
 
     style_opts = line_properties + fill_properties
-    _plot_methods = dict(single='quad')
+    _plot_methods = dict(single='quad', batched='quad')
+    _batched_style_opts = line_properties + fill_properties
 
     def get_data(self, element, ranges, style):
         if self.invert_axes:
@@ -430,7 +366,8 @@ class ErrorPlot(ElementPlot):
 
     _mapping = dict(base="base", upper="upper", lower="lower")
 
-    _plot_methods = dict(single=Whisker)
+    _plot_methods = dict(single=Whisker, batched='segment')
+    _batched_style_opts = line_properties
 
     def get_data(self, element, ranges, style):
         mapping = dict(self._mapping)
@@ -446,19 +383,57 @@ class ErrorPlot(ElementPlot):
             err = element.dimension_values(2)
             lower, upper = ys-err, ys+err
         data = dict(base=base, lower=lower, upper=upper)
+        self._categorize_data(data, ('base',), element.dimensions())
 
-        if self.invert_axes:
+        if self.batched:
+            # Whisker annotations cannot vary style across layers
+            # so batched error bars are drawn as segments
+            data = self._get_segments(data, style)
+            if self.invert_axes:
+                mapping = dict(x0='lower', x1='upper', y0='base0', y1='base1')
+            else:
+                mapping = dict(x0='base0', x1='base1', y0='lower', y1='upper')
+        elif self.invert_axes:
             mapping['dimension'] = 'width'
         else:
             mapping['dimension'] = 'height'
-        self._categorize_data(data, ('base',), element.dimensions())
         return (data, mapping, style)
 
 
+    def _get_segments(self, data, style):
+        """
+        Converts the error bars to segments drawing the whiskers and
+        their heads. Heads span 40% of the minimum spacing between
+        the base values and are omitted on categorical axes or if the
+        lower_head or upper_head style option is None.
+        """
+        base, lower, upper = (np.asarray(data[c]) for c in ('base', 'lower', 'upper'))
+        segments = dict(base0=[base], base1=[base], lower=[lower], upper=[upper])
+        heads = [v for h, v in [('lower_head', lower), ('upper_head', upper)]
+                 if style.get(h, True) is not None]
+        spacing = np.diff(np.unique(base)) if base.dtype.kind in 'uifM' else None
+        if spacing is not None and len(spacing):
+            width = spacing.min()*0.4
+        elif spacing is not None and len(base) and base.dtype.kind != 'M':
+            width = 0.4
+        else:
+            heads = []
+        for head in heads:
+            segments['base0'].append(base-width/2.)
+            segments['base1'].append(base+width/2.)
+            segments['lower'].append(head)
+            segments['upper'].append(head)
+        return {k: np.concatenate(v) for k, v in segments.items()}
+
+
     def _init_glyph(self, plot, mapping, properties):
         """
         Returns a Bokeh glyph object.
         """
+        if self.batched:
+            properties = {k: v for k, v in properties.items()
+                          if k not in ('lower_head', 'upper_head')}
+            return super(ErrorPlot, self)._init_glyph(plot, mapping, properties)
         properties.pop('legend', None)
         for prop in ['color', 'alpha']:
             if prop not in properties:
@@ -481,7 +456,8 @@ class ErrorPlot(ElementPlot):
 class SpreadPlot(ElementPlot):
 
     style_opts = line_properties + fill_properties
-    _plot_methods = dict(single='patch')
+    _plot_methods = dict(single='patch', batched='patches')
+    _batched_style_opts = line_properties + fill_properties
 
     def get_data(self, element, ranges, style):
          mapping = dict(x='x', y='y')
@@ -554,7 +530,8 @@ class SpikesPlot(ColorbarPlot):
 
     style_opts = (['color', 'cmap', 'palette'] + line_properties)
 
-    _plot_methods = dict(single='segment')
+    _plot_methods = dict(single='segment', batched='segment')
+    _batched_style_opts = line_properties
 
     def get_extents(self, element, ranges):
         l, b, r, t = super(SpikesPlot, self).get_extents(element, ranges)
@@ -721,11 +698,13 @@ class BarPlot(ColorbarPlot, LegendPlot):
 
         xdim, ydim = element.dimensions()[:2]
         xvals = element.dimension_values(0, False)
-        xvals = [x if xvals.dtype.kind in 'SU' else xdim.pprint_value(x)
-                 for x in xvals]
+        if xvals.dtype.kind not in 'SU':
+            xvals = categorize_array(xvals, xdim)
+        xvals = list(xvals)
         if gdim and not sdim:
             gvals = element.dimension_values(gdim, False)
-            gvals = [g if gvals.dtype.kind in 'SU' else gdim.pprint_value(g) for g in gvals]
+            if gvals.dtype.kind not in 'SU':
+                gvals = categorize_array(gvals, gdim)
             coords = ([(x, g) for x in xvals for g in gvals], [])
         else:
             coords = (xvals, [])
@@ -893,8 +872,8 @@ class BarPlot(ColorbarPlot, LegendPlot):
             elif grouping == 'grouped':
                 xs = ds.dimension_values(xdim)
                 ys = ds.dimension_values(ydim)
-                xoffsets = [(x if xs.dtype.kind in 'SU' else xdim.pprint_value(x), gval)
-                            for x in xs]
+                xlabels = xs if xs.dtype.kind in 'SU' else categorize_array(xs, xdim)
+                xoffsets = [(x, gval) for x in xlabels]
                 data['xoffsets'].append(xoffsets)
                 data[ydim.name].append(ys)
                 if hover: data[xdim.name].append(xs)
@@ -1,4 +1,5 @@
 import warnings
+from collections import defaultdict
 
 import param
 import numpy as np
@@ -26,7 +27,7 @@ from ..util import dynamic_update, process_cmap
 from .plot import BokehPlot, TOOLS
 from .util import (mpl_to_bokeh, get_tab_title,  py2js_tickformatter,
                    rgba_tuple, recursive_model_update, glyph_order,
-                   decode_bytes)
+                   decode_bytes, expand_batched_style, categorize_array)
 
 property_prefixes = ['selection', 'nonselection', 'muted', 'hover']
 
@@ -116,6 +117,12 @@ class ElementPlot(BokehPlot, GenericElementPlot):
     # Whether the plot supports streaming data
     _stream_data = True
 
+    # Style options which may vary across the layers of a batched plot
+    _batched_style_opts = []
+
+    # Batched glyphs which draw one row of arrays per layer
+    _ragged_glyphs = ('multi_line', 'patches')
+
     def __init__(self, element, plot=None, **params):
         self.current_ranges = None
         super(ElementPlot, self).__init__(element, **params)
@@ -196,7 +203,7 @@ class ElementPlot(BokehPlot, GenericElementPlot):
             if dim not in data:
                 data[dim] = element.dimension_values(d)
             elif isinstance(data[dim], np.ndarray) and data[dim].dtype.kind == 'M':
-                data[dim+'_dt_strings'] = [d.pprint_value(v) for v in data[dim]]
+                data[dim+'_dt_strings'] = categorize_array(data[dim], d)
 
         for k, v in self.overlay_dims.items():
             dim = util.dimension_sanitizer(k.name)
@@ -554,7 +561,7 @@ class ElementPlot(BokehPlot, GenericElementPlot):
             column = data[col]
             if (isinstance(ranges[i], FactorRange) and
                 (isinstance(column, list) or column.dtype.kind not in 'SU')):
-                data[col] = [dims[i].pprint_value(v) for v in column]
+                data[col] = categorize_array(column, dims[i])
 
     def _get_factors(self, element):
         """
@@ -563,12 +570,77 @@ class ElementPlot(BokehPlot, GenericElementPlot):
         xdim, ydim = element.dimensions()[:2]
         xvals, yvals = [element.dimension_values(i, False)
                         for i in range(2)]
-        coords = tuple([v if vals.dtype.kind in 'SU' else dim.pprint_value(v) for v in vals]
-                  for dim, vals in [(xdim, xvals), (ydim, yvals)])
+        coords = tuple(list(vals if vals.dtype.kind in 'SU' else categorize_array(vals, dim))
+                       for dim, vals in [(xdim, xvals), (ydim, yvals)])
         if self.invert_axes: coords = coords[::-1]
         return coords
 
 
+    def get_batched_data(self, overlay, ranges):
+        """
+        Packs all layers of a batched NdOverlay into a single
+        ColumnDataSource. Glyphs which draw one row per sample
+        concatenate the columns of each layer and expand per-layer
+        styles and keys using the layer lengths, while ragged glyphs
+        (multi_line and patches) draw one row of arrays per layer.
+        """
+        ragged = self._plot_methods.get('batched') in self._ragged_glyphs
+        hover = any(isinstance(t, HoverTool) for t in self.state.tools)
+        zorders = self._updated_zorders(overlay)
+        columns, styles = defaultdict(list), defaultdict(list)
+        keys, lengths, options = [], [], {}
+        mapping, style, applied = {}, {}, None
+        for (key, el), zorder in zip(overlay.data.items(), zorders):
+            # Options only have to be looked up once per distinct spec
+            spec = (type(el), el.group, el.label, el.id)
+            if spec not in options:
+                el_style = self.lookup_options(el, 'style')
+                options[spec] = (self.lookup_options(el, 'plot').options,
+                                 el_style.max_cycles(len(self.ordering)))
+            plot_opts, style_opts = options[spec]
+            if plot_opts is not applied:
+                self.set_param(**plot_opts)
+                applied = plot_opts
+            eldata, elmapping, style = self.get_data(el, ranges, style_opts[zorder])
+
+            # Skip if data is empty
+            if not eldata:
+                continue
+
+            for k, v in eldata.items():
+                columns[k].append(v)
+            sdata, smapping = expand_batched_style(style, self._batched_style_opts,
+                                                   elmapping, nvals=1)
+            for k, v in sdata.items():
+                styles[k].append(v[0])
+            elmapping.update(smapping)
+            mapping = elmapping
+            keys.append(key)
+            lengths.append(len(list(eldata.values())[0]))
+
+        # Drop columns which are undefined for some of the layers
+        nlayers = len(keys)
+        columns = {k: v for k, v in columns.items() if len(v) == nlayers}
+        for k, v in list(styles.items()):
+            if len(v) != nlayers or any(sv is None for sv in v):
+                del styles[k]
+                mapping.pop(k, None)
+        if hover:
+            for i, d in enumerate(overlay.kdims):
+                styles[util.dimension_sanitizer(d.name)] = [k[i] for k in keys]
+
+        if ragged:
+            data = dict(columns, **styles)
+            mapping = {{'x': 'xs', 'y': 'ys'}.get(k, k): v
+                       for k, v in mapping.items()}
+        else:
+            data = {k: np.concatenate(v) for k, v in columns.items()}
+            lengths = np.array(lengths, dtype=int)
+            for k, v in styles.items():
+                data[k] = np.repeat(np.asarray(v), lengths)
+        return data, mapping, style
+
+
     def _process_legend(self):
         """
         Disables legends if show_legend is disabled.
@@ -14,6 +14,7 @@ from .chart import ColorbarPlot, PointPlot
 from .element import (CompositeElementPlot, LegendPlot, line_properties,
                       fill_properties, text_properties)
 from ..util import process_cmap
+from .util import categorize_array
 
 
 class GraphPlot(CompositeElementPlot, ColorbarPlot, LegendPlot):
@@ -201,7 +202,7 @@ class GraphPlot(CompositeElementPlot, ColorbarPlot, LegendPlot):
         if any(isinstance(t, HoverTool) for t in self.state.tools):
             if self.inspection_policy == 'nodes':
                 index_dim = element.nodes.get_dimension(2)
-                point_data['index_hover'] = [index_dim.pprint_value(v) for v in element.nodes.dimension_values(2)]
+                point_data['index_hover'] = categorize_array(element.nodes.dimension_values(2), index_dim)
                 for d in element.nodes.dimensions()[3:]:
                     point_data[dimension_sanitizer(d.name)] = element.nodes.dimension_values(d)
             elif self.inspection_policy == 'edges':
@@ -357,9 +358,9 @@ class ChordPlot(GraphPlot):
                 nodes = list(np.unique([edges.dimension_values(i) for i in range(2)]))
                 nodes = element.nodes.select(**{element.nodes.kdims[2].name: nodes})
         xs, ys = (nodes.dimension_values(i)*offset for i in range(2))
-        labels = [lidx.pprint_value(v) for v in nodes.dimension_values(lidx)]
+        labels = categorize_array(nodes.dimension_values(lidx), lidx)
         angles = np.arctan2(ys, xs)
-        data['text_1'] = dict(x=xs, y=ys, text=[str(l) for l in labels], angle=angles)
+        data['text_1'] = dict(x=xs, y=ys, text=labels, angle=angles)
         mapping['text_1'] = dict(text='text', x='x', y='y', angle='angle', text_baseline='middle')
         return data, mapping, style
 
@@ -6,7 +6,22 @@ from bokeh.models.glyphs import AnnularWedge
 from ...core.util import is_nan, dimension_sanitizer
 from .element import (ColorbarPlot, CompositeElementPlot,
                       line_properties, fill_properties, text_properties)
-from .util import mpl_to_bokeh
+from .util import mpl_to_bokeh, categorize_array
+
+
+def hover_labels(values, dim):
+    """
+    Formats the values of a value dimension for display in a hover
+    tooltip, replacing missing values with '-'.
+    """
+    labels = categorize_array(values, dim)
+    if values.dtype.kind == 'f':
+        missing = np.isnan(values)
+    elif values.dtype.kind == 'O':
+        missing = np.array([is_nan(v) for v in values], dtype=bool)
+    else:
+        return labels
+    return np.where(missing, '-', labels)
 
 
 
@@ -82,16 +97,15 @@ class HeatMapPlot(ColorbarPlot):
         else:
             zvals = zvals.T.flatten()
         if xvals.dtype.kind not in 'SU':
-            xvals = [xdim.pprint_value(xv) for xv in xvals]
+            xvals = categorize_array(xvals, xdim)
         if yvals.dtype.kind not in 'SU':
-            yvals = [ydim.pprint_value(yv) for yv in yvals]
+            yvals = categorize_array(yvals, ydim)
         data = {x: xvals, y: yvals, 'zvalues': zvals}
 
         if any(isinstance(t, HoverTool) for t in self.state.tools) and not self.static_source:
             for vdim in element.vdims:
                 sanitized = dimension_sanitizer(vdim.name)
-                data[sanitized] = ['-' if is_nan(v) else vdim.pprint_value(v)
-                                   for v in aggregate.dimension_values(vdim)]
+                data[sanitized] = hover_labels(aggregate.dimension_values(vdim), vdim)
 
         # Filter radial heatmap options
         style = {k: v for k, v in style.items() if not
@@ -339,7 +353,7 @@ class RadialHeatMapPlot(CompositeElementPlot, ColorbarPlot):
 
         if vals.dtype.kind not in 'SU':
             dim = element.gridded.get_dimension(dim_label)
-            return [dim.pprint_value(v) for v in vals]
+            return categorize_array(vals, dim)
 
         return vals
 
@@ -524,8 +538,7 @@ class RadialHeatMapPlot(CompositeElementPlot, ColorbarPlot):
         if any(isinstance(t, HoverTool) for t in self.state.tools):
             for vdim in element.vdims:
                 sanitized = dimension_sanitizer(vdim.name)
-                values = ['-' if is_nan(v) else vdim.pprint_value(v)
-                          for v in aggregate.dimension_values(vdim)]
+                values = hover_labels(aggregate.dimension_values(vdim), vdim)
                 data_annular[sanitized] = values
 
         data_text_seg = self._get_seg_labels_data(order_seg, bins_seg)
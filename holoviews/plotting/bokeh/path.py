@@ -7,7 +7,7 @@ from bokeh.models import HoverTool
 
 from ...core import util
 from .element import ColorbarPlot, LegendPlot, line_properties, fill_properties
-from .util import expand_batched_style
+from .util import expand_batched_style, categorize_array
 
 
 class PathPlot(ColorbarPlot):
@@ -137,7 +137,7 @@ class ContourPlot(LegendPlot, PathPlot):
             if dim not in data:
                 data[dim] = element.dimension_values(d, expanded=False)
             elif isinstance(data[dim], np.ndarray) and data[dim].dtype.kind == 'M':
-                data[dim+'_dt_strings'] = [d.pprint_value(v) for v in data[dim]]
+                data[dim+'_dt_strings'] = categorize_array(data[dim], d)
 
         for k, v in self.overlay_dims.items():
             dim = util.dimension_sanitizer(k.name)
@@ -17,7 +17,8 @@ from ..plot import (DimensionedPlot, GenericCompositePlot, GenericLayoutPlot,
 from ..util import attach_streams, displayable, collate
 from .util import (layout_padding, pad_plots, filter_toolboxes, make_axis,
                    update_shared_sources, empty_plot, decode_bytes,
-                   bokeh_version)
+                   bokeh_version, column_delta, column_nbytes,
+                   compact_array)
 
 from bokeh.layouts import gridplot
 from bokeh.plotting.helpers import _known_tools as known_tools
@@ -103,6 +104,11 @@ class BokehPlot(DimensionedPlot):
         self._document = None
         self.root = None
 
+        # Number of bytes sent when updating datasources and saved by
+        # only sending changed columns and rows, along with the number
+        # of updates sent as patch and stream events
+        self.datasource_stats = dict(sent=0, saved=0, patched=0, streamed=0)
+
 
     def get_data(self, element, ranges, style):
         """
@@ -148,6 +154,17 @@ class BokehPlot(DimensionedPlot):
         return cbs
 
 
+    def _apply_refresh(self, refresh):
+        """
+        In server mode the refresh is applied in a Document callback
+        so that the models are updated while holding the Document lock.
+        """
+        if self.renderer.mode == 'server' and self.document is not None:
+            self.document.add_next_tick_callback(refresh)
+        else:
+            refresh()
+
+
     def push(self):
         """
         Pushes updated plot data via the Comm.
@@ -180,19 +197,41 @@ class BokehPlot(DimensionedPlot):
         """
         Initializes a data source to be passed into the bokeh glyph.
         """
+        return ColumnDataSource(data=self._encode_columns(data))
+
+
+    def _encode_columns(self, data, source=None):
+        """
+        Decodes bytestring columns and, if the renderer transfers
+        binary arrays, compacts numeric columns so they are serialized
+        as base64 encoded typed arrays. When updating a source, the
+        integer columns are not compacted below their current dtype.
+        """
         data = {k: decode_bytes(vs) for k, vs in data.items()}
-        return ColumnDataSource(data=data)
+        if self.renderer.binary_arrays:
+            dtypes = self.renderer.array_dtypes
+            current = {} if source is None else source.data
+            data = {k: compact_array(vs, dtypes, getattr(current.get(k), 'dtype', None))
+                    for k, vs in data.items()}
+        return data
 
 
     def _update_datasource(self, source, data):
         """
         Update datasource with data for a new frame.
         """
-        data = {k: decode_bytes(vs) for k, vs in data.items()}
+        data = self._encode_columns(data, source)
         if (self.streaming and self.streaming[0].data is self.current_frame.data
             and self._stream_data):
             stream = self.streaming[0]
-            if stream._triggering:
+            resend = any(isinstance(v, np.ndarray) and k in source.data and
+                         getattr(source.data[k], 'dtype', v.dtype) != v.dtype
+                         for k, v in data.items())
+            if stream._triggering and resend:
+                # Streamed rows are written into the existing typed
+                # arrays, so columns whose dtype changed are resent
+                source.data.update(data)
+            elif stream._triggering:
                 data = {k: v[-stream._chunk_length:] for k, v in data.items()}
 
                 # NOTE: Workaround for bug in bokeh 0.12.14, data conversion
@@ -221,7 +260,54 @@ class BokehPlot(DimensionedPlot):
                 else:
                     source.stream(data, stream.length)
         else:
+            self._update_columns(source, data)
+
+
+    def _update_columns(self, source, data):
+        """
+        Updates the columns of the datasource whose values changed,
+        sending columns which only changed in a contiguous range of
+        rows as a patch and rows appended to all columns as a stream.
+        Records the bytes sent and saved compared to sending all
+        columns in the datasource_stats.
+        """
+        stats = self.datasource_stats
+        deltas = {k: column_delta(source.data.get(k), v) for k, v in data.items()}
+        kinds = set(kind for kind, _ in deltas.values())
+        resized = any(k not in source.data or len(source.data[k]) != len(v)
+                      for k, v in data.items())
+        if (bokeh_version in ['0.12.14', '0.12.15dev1'] and
+            any(isinstance(v, np.ndarray) and v.dtype.kind == 'M' for v in data.values())):
+            # Streaming datetimes is broken in bokeh 0.12.14
+            kinds.discard('stream')
+
+        total = sum(column_nbytes(v) for v in data.values())
+        if kinds == set(['stream']) and set(source.data) == set(data):
+            appended = {k: v for k, (_, v) in deltas.items()}
+            source.stream(appended)
+            sent = sum(column_nbytes(v) for v in appended.values())
+            stats['streamed'] += 1
+        elif resized or 'stream' in kinds:
             source.data.update(data)
+            sent = total
+        else:
+            replaced = {k: v for k, (kind, v) in deltas.items() if kind == 'replace'}
+            patches = {k: [delta] for k, (kind, delta) in deltas.items() if kind == 'patch'}
+            if replaced:
+                source.data.update(replaced)
+            if patches:
+                # Patching writes into the column so it is first replaced
+                # (without notification) by the new values to avoid
+                # modifying the previous data
+                for k in patches:
+                    values = data[k] if data[k].flags.writeable else data[k].copy()
+                    dict.__setitem__(source.data, k, values)
+                source.patch(patches)
+                stats['patched'] += 1
+            sent = (sum(column_nbytes(v) for v in replaced.values()) +
+                    sum(column_nbytes(v) for [(_, v)] in patches.values()))
+        stats['sent'] += sent
+        stats['saved'] += total-sent
 
     @property
     def state(self):
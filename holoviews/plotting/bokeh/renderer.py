@@ -89,6 +89,20 @@ class BokehRenderer(Renderer):
     webgl = param.Boolean(default=False, doc="""Whether to render plots with WebGL
         if bokeh version >=0.10""")
 
+    binary_arrays = param.Boolean(default=False, doc="""
+        Whether to convert numeric columns of the plot data sources to
+        dtypes which are serialized as base64 encoded typed arrays
+        rather than JSON lists, reducing the size of exported HTML and
+        embedded widget frames. Lists of numbers are converted to
+        arrays and integers are cast to the smallest integer type
+        which holds their range.""")
+
+    array_dtypes = param.Dict(default={}, doc="""
+        Mapping from dtype name to the dtype arrays should be cast to
+        when binary_arrays is enabled, e.g. {'float64': 'float32'}
+        halves the size of floating point columns at reduced
+        precision.""")
+
     widgets = {'scrubber': BokehScrubberWidget,
                'widgets': BokehSelectionWidget,
                'server': BokehServerWidgets}
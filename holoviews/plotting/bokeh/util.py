@@ -31,7 +31,8 @@ except:
 
 from ...core.options import abbreviated_exception
 from ...core.overlay import Overlay
-from ...core.util import basestring, unique_array, callable_name, pd, dt64_to_dt
+from ...core.util import (basestring, unique_array, callable_name, pd, dt64_to_dt,
+                          factorize_array)
 from ...core.spaces import get_nested_dmaps, DynamicMap
 
 from ..util import dim_axis_label, rgb2hex, COLOR_ALIASES
@@ -72,8 +73,11 @@ def decode_bytes(array):
     Decodes an array, list or tuple of bytestrings to avoid python 3
     bokeh serialization errors
     """
-    if (sys.version_info.major == 2 or not len(array) or
-        (isinstance(array, np.ndarray) and array.dtype.kind != 'O')):
+    if sys.version_info.major == 2 or not len(array):
+        return array
+    elif isinstance(array, np.ndarray) and array.dtype.kind == 'S':
+        return np.char.decode(array, 'utf-8')
+    elif isinstance(array, np.ndarray) and array.dtype.kind != 'O':
         return array
     decoded = [v.decode('utf-8') if isinstance(v, bytes) else v for v in array]
     if isinstance(array, np.ndarray):
@@ -83,6 +87,111 @@ def decode_bytes(array):
     return decoded
 
 
+def compact_array(array, dtypes=None, min_dtype=None):
+    """
+    Converts numeric columns to dtypes bokeh serializes as base64
+    encoded typed arrays rather than JSON text. Lists of numbers are
+    converted to arrays, integers are cast to the smallest integer
+    type holding their range and the optional dtypes mapping, e.g.
+    {'float64': 'float32'}, downcasts arrays of the matching dtype.
+    Lists of arrays, as used by ragged glyphs, are converted per item.
+
+    Since bokehjs streams and patches values into the existing typed
+    array of a column, the min_dtype of the column being updated
+    ensures integers are never cast to a narrower type than the one
+    already sent.
+    """
+    if isinstance(array, list):
+        if array and all(isinstance(v, np.ndarray) for v in array):
+            return [compact_array(v, dtypes) for v in array]
+        try:
+            values = np.asarray(array)
+        except Exception:
+            return array
+        if values.ndim != 1 or values.dtype.kind not in 'iuf':
+            return array
+        array = values
+    if not isinstance(array, np.ndarray):
+        return array
+    dtype = array.dtype
+    if dtypes and dtype.name in dtypes:
+        return array.astype(dtypes[dtype.name])
+    elif dtype.kind in 'iu' and len(array):
+        low, high = array.min(), array.max()
+        for itype in (np.uint8, np.int8, np.uint16, np.int16, np.uint32, np.int32):
+            bounds = np.iinfo(itype)
+            if low >= bounds.min and high <= bounds.max:
+                itype = np.dtype(itype)
+                if min_dtype is not None and min_dtype.kind in 'iu':
+                    itype = np.promote_types(itype, min_dtype)
+                return array if itype == dtype else array.astype(itype)
+    return array
+
+
+def equal_rows(old, new):
+    """
+    Compares two arrays of the same shape and dtype row by row,
+    treating NaNs and NaTs in the same position as equal. Returns
+    None if the arrays cannot be compared.
+    """
+    kind = old.dtype.kind
+    try:
+        if kind in 'mM':
+            return old.view('i8') == new.view('i8')
+        equal = old == new
+        if kind in 'fc':
+            equal |= np.isnan(old) & np.isnan(new)
+    except Exception:
+        return None
+    if not isinstance(equal, np.ndarray) or equal.shape != old.shape:
+        return None
+    return equal
+
+
+def column_delta(old, new):
+    """
+    Compares the previous and new values of a ColumnDataSource column
+    and returns the kind of update required along with the values to
+    send. The kind is 'unchanged' if the values are the same, 'patch'
+    along with a slice and the new values of those rows if the values
+    only differ in a contiguous range covering less than half of the
+    rows, 'stream' along with the appended rows if rows were only
+    appended and otherwise 'replace' along with the new values.
+    """
+    if old is new:
+        return 'unchanged', None
+    elif not (isinstance(old, np.ndarray) and isinstance(new, np.ndarray)
+              and old.ndim == 1 and new.ndim == 1 and old.dtype == new.dtype):
+        return 'replace', new
+
+    length = len(old)
+    if len(new) > length:
+        equal = equal_rows(old, new[:length])
+        if equal is not None and equal.all():
+            return 'stream', new[length:]
+        return 'replace', new
+    elif len(new) < length:
+        return 'replace', new
+
+    equal = equal_rows(old, new)
+    if equal is None:
+        return 'replace', new
+    changed = np.flatnonzero(~equal)
+    if not len(changed):
+        return 'unchanged', None
+    start, stop = int(changed[0]), int(changed[-1])+1
+    if (stop-start)*2 >= length:
+        return 'replace', new
+    return 'patch', (slice(start, stop), new[start:stop])
+
+
+def column_nbytes(values):
+    "Estimates the number of bytes sent for the values of a column."
+    if not isinstance(values, np.ndarray):
+        values = np.asarray(values)
+    return values.nbytes
+
+
 def get_cmap(cmap):
     """
     Returns matplotlib cmap generated from bokeh palette or
@@ -266,7 +375,14 @@ def make_axis(axis, size, factors, dim, flip=False, rotation=0,
 
 
 def convert_datetime(time):
-    return time.astype('datetime64[s]').astype(float)*1000
+    """
+    Converts a datetime64 array or scalar to milliseconds since the
+    epoch in a single vectorized operation, mapping NaT to NaN.
+    Scalars are returned as floats.
+    """
+    time = np.asarray(time).astype('datetime64[ms]')
+    converted = np.where(np.isnat(time), np.nan, time.astype('int64').astype(float))
+    return converted[()] if converted.ndim == 0 else converted
 
 
 def hsv_to_rgb(hsv):
@@ -524,10 +640,33 @@ def update_shared_sources(f):
 def categorize_array(array, dim):
     """
     Uses a Dimension instance to convert an array of values to categorical
-    (i.e. string) values and applies escaping for colons, which bokeh
-    treats as a categorical suffix.
-    """
-    return np.array([dim.pprint_value(x) for x in array])
+    (i.e. string) values. Strings, bytes and datetimes without a custom
+    formatter are converted using vectorized NumPy operations, all other
+    arrays are factorized so that each distinct value is formatted once.
+    """
+    array = np.asarray(array)
+    if array.ndim != 1:
+        return np.array([dim.pprint_value(x) for x in array])
+    elif not len(array):
+        return array.astype('U')
+    scalar_type = array.dtype.type if dim.type is None else dim.type
+    formatter = dim.value_format or dim.type_formatters.get(scalar_type)
+    kind = array.dtype.kind
+    if formatter is None and kind in 'SUM':
+        if kind == 'S':
+            return np.char.decode(array, 'utf-8')
+        elif kind == 'M':
+            return np.datetime_as_string(array)
+        return array
+    elif kind == 'M' and pd and isinstance(formatter, basestring):
+        return np.asarray(pd.DatetimeIndex(array).strftime(formatter), dtype='U')
+
+    try:
+        codes, uniques = factorize_array(array)
+    except TypeError:
+        return np.array([dim.pprint_value(x) for x in array])
+    labels = np.array([dim.pprint_value(x) for x in uniques])
+    return labels[codes]
 
 
 class periodic(object):
@@ -608,7 +747,9 @@ def attach_periodic(plot):
 
 def date_to_integer(date):
     """
-    Converts datetime types to bokeh's integer format.
+    Converts datetime types to bokeh's integer format. Only used for
+    the single location of an annotation, so it is not vectorized,
+    see convert_datetime for arrays.
     """
     if isinstance(date, np.datetime64):
         date = dt64_to_dt(date)
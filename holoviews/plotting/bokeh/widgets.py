@@ -6,6 +6,10 @@ from functools import partial
 
 import param
 import numpy as np
+from bokeh.document.events import (ModelChangedEvent, ColumnDataChangedEvent,
+                                   ColumnsStreamedEvent, ColumnsPatchedEvent)
+from bokeh.document.util import references_json
+from bokeh.models import ColumnDataSource
 from bokeh.models.widgets import Select, Slider, AutocompleteInput, TextInput, Div
 from bokeh.layouts import widgetbox, row, column
 
@@ -286,26 +290,115 @@ class BokehWidget(NdWidget):
         return frames
 
     def get_frames(self):
-        nframes = len(self.plot)
         if self.embed:
-            self.plot.update(nframes-1)
-            frames = OrderedDict([(idx, self._plot_figure(idx))
-                                  for idx in range(nframes)])
+            frames = self._frame_patches()
         else:
             frames = {}
         return self.encode_frames(frames)
 
-    def _plot_figure(self, idx, fig_format='json'):
+    def _frame_patches(self):
         """
-        Returns the figure in html format on the
-        first call and
+        Renders all frames incrementally, storing a base patch, which
+        sets every document property that varies across the frames to
+        its value in the first frame, and for each frame a patch
+        holding only the properties that differ from the first frame.
+        Applying the base followed by a frame patch therefore restores
+        that frame regardless of the frame currently displayed.
         """
-        self.plot.update(idx)
-        if self.embed:
-            patch = self.renderer.diff(self.plot, binary=False)
-            msg = serialize_json(dict(content=patch.content,
-                                      root=self.plot.state._id))
-            return msg
+        doc = self.plot.document
+        nframes = len(self.plot)
+        self.plot.update(nframes-1)
+
+        # Collect changes relative to the initially rendered state
+        varying = OrderedDict((k, None) for k in self._changed_keys(doc)[0])
+        changes, transient = [], []
+        for idx in range(nframes):
+            self.plot.update(idx)
+            keys, events = self._changed_keys(doc)
+            changes.append(OrderedDict((k, self._patch_fragment(doc, k))
+                                       for k in keys))
+            transient.append([self._patch_fragment(doc, e) for e in events])
+            varying.update((k, None) for k in keys)
+
+        # The document is back at the final frame, i.e. in its initial
+        # state, which supplies the values the first frame left unchanged
+        first = changes[0] if changes else {}
+        base = OrderedDict()
+        for k in varying:
+            base[k] = first[k] if k in first else self._patch_fragment(doc, k)
+        current = OrderedDict(base)
+        frames = OrderedDict([('base', self._patch_message(base.values()))])
+        for idx, (fragments, events) in enumerate(zip(changes, transient)):
+            current.update(fragments)
+            diff = [f for k, f in current.items() if f[0] != base[k][0]]
+            frames[idx] = self._patch_message(diff+events)
+        return frames
+
+    def _changed_keys(self, doc):
+        """
+        Consumes the events held by the document returning the keys of
+        the model properties and data source columns they changed and
+        any other events which cannot be expressed as property state.
+        """
+        events = doc._held_events
+        doc._held_events = []
+        keys, other = [], []
+        for event in events:
+            hint = getattr(event, 'hint', None) or event
+            if isinstance(hint, (ColumnDataChangedEvent, ColumnsPatchedEvent,
+                                 ColumnsStreamedEvent)):
+                source = hint.column_source
+                if isinstance(hint, ColumnsStreamedEvent):
+                    cols = list(hint.data)
+                elif isinstance(hint, ColumnsPatchedEvent):
+                    cols = list(hint.patches)
+                else:
+                    cols = hint.cols or list(source.data)
+                keys += [('column', source, col) for col in cols]
+            elif isinstance(event, ModelChangedEvent):
+                if event.attr == 'data' and isinstance(event.model, ColumnDataSource):
+                    keys += [('column', event.model, col) for col in event.model.data]
+                else:
+                    keys.append(('attr', event.model, event.attr))
+            else:
+                other.append(event)
+        return list(OrderedDict.fromkeys(keys)), other
+
+    def _patch_fragment(self, doc, key):
+        """
+        Serializes the current value of a property or column key (or a
+        document event) returning the JSON event and the JSON of any
+        models it references.
+        """
+        if not isinstance(key, tuple):
+            event = key
+        elif key[0] == 'column':
+            _, source, col = key
+            cols = [col] if col in source.data else []
+            event = ColumnDataChangedEvent(doc, source, cols)
+        else:
+            _, model, attr = key
+            new = getattr(model, attr)
+            serializable = model.lookup(attr).serializable_value(model)
+            event = ModelChangedEvent(doc, model, attr, None, new, serializable)
+        references = set()
+        event_json = serialize_json(event.generate(references, None))
+        refs = [(ref['id'], serialize_json(ref))
+                for ref in references_json(references)]
+        return event_json, refs
+
+    def _patch_message(self, fragments):
+        """
+        Assembles serialized fragments into a PATCH-DOC message for the
+        plot document.
+        """
+        events, references = [], OrderedDict()
+        for event_json, refs in fragments:
+            events.append(event_json)
+            references.update(refs)
+        return ('{"content":{"events":[%s],"references":[%s]},"root":%s}'
+                % (','.join(events), ','.join(references.values()),
+                   json.dumps(self.plot.state._id)))
 
 
 class BokehSelectionWidget(BokehWidget, SelectionWidget):
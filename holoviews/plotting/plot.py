@@ -5,6 +5,7 @@ of this Plot baseclass.
 """
 
 from itertools import groupby, product
+from functools import partial
 from collections import Counter, defaultdict
 
 import numpy as np
@@ -17,7 +18,7 @@ from ..core.overlay import Overlay, CompositeOverlay
 from ..core.layout import Empty, NdLayout, Layout
 from ..core.options import Store, Compositor, SkipRendering
 from ..core.overlay import NdOverlay
-from ..core.spaces import HoloMap, DynamicMap
+from ..core.spaces import HoloMap, DynamicMap, get_nested_dmaps
 from ..core.util import stream_parameters
 from ..element import Table
 from .util import (get_dynamic_mode, initialize_unbounded, dim_axis_label,
@@ -214,6 +215,7 @@ class DimensionedPlot(Plot):
         self.comm = None
         self._force = False
         self._updated = False # Whether the plot should be marked as updated
+        self._pending_refresh = None # Refresh awaiting asynchronous callbacks
 
         params = {k: v for k, v in params.items()
                   if k in self.params()}
@@ -509,15 +511,70 @@ class DimensionedPlot(Plot):
         key = tuple(None if d in stream_params else k
                     for d, k in zip(self.dimensions, key))
         stream_key = util.wrap_tuple_streams(key, self.dimensions, self.streams)
+        if not self._schedule_refresh(stream_key):
+            self._trigger_refresh(stream_key)
 
+
+    def _trigger_refresh(self, key):
+        "Triggers update to a plot on a refresh event"
         # Update if not top-level, batched or an ElementPlot
         if not self.top_level or isinstance(self, GenericElementPlot):
-            self.update(stream_key)
+            self.update(key)
 
         if self.comm is not None and self.top_level:
             self.push()
 
 
+    def _schedule_refresh(self, key):
+        """
+        Schedules the asynchronous callbacks of any DynamicMaps the
+        plot depends on as tasks on the running asyncio event loop,
+        triggering the refresh once they have completed. A refresh
+        scheduled while an earlier one is pending supersedes it.
+        Returns False if no event loop is running or no asynchronous
+        callbacks had to be scheduled.
+        """
+        self._pending_refresh = None
+        if util.running_loop() is None:
+            return False
+
+        obj = self.hmap if hasattr(self, 'hmap') else self.layout
+        dmaps = {d for dmap in obj.traverse(lambda x: x, [DynamicMap])
+                 for d in get_nested_dmaps(dmap) if d.callback.asynchronous}
+        key_map = dict(zip([d.name for d in self.dimensions], key))
+        tasks = []
+        for dmap in dmaps:
+            if any(kd.name not in key_map for kd in dmap.kdims):
+                continue
+            task = dmap._schedule_callback(*(key_map[kd.name] for kd in dmap.kdims))
+            if task is not None:
+                tasks.append(task)
+        if not tasks:
+            return False
+
+        def refresh(pending):
+            # Refreshes superseded by a later event are discarded
+            if self._pending_refresh is not pending:
+                return
+            self._pending_refresh = None
+            if not any(t.cancelled() for t in tasks):
+                self._apply_refresh(partial(self._trigger_refresh, key))
+
+        pending = util.asyncio.gather(*tasks, return_exceptions=True)
+        pending.add_done_callback(refresh)
+        self._pending_refresh = pending
+        return True
+
+
+    def _apply_refresh(self, refresh):
+        """
+        Applies a refresh once the asynchronous callbacks it depends
+        on have completed, may be overridden by backends which have to
+        apply updates on a specific thread or event loop callback.
+        """
+        refresh()
+
+
     def push(self):
         """
         Pushes updated plot data via the Comm.
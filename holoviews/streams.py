@@ -4,9 +4,10 @@ generate and respond to events, originating either in Python on the
 server-side or in Javascript in the Jupyter notebook (client-side).
 """
 
+import time
 import uuid
 from numbers import Number
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 from contextlib import contextmanager
 
 import param
@@ -64,6 +65,19 @@ class Stream(param.Parameterized):
     determine whether a stream is active by checking whether the
     stream values match the default (usually None).
 
+    The throttle and debounce options limit the rate at which the
+    stream triggers its subscribers, which is useful when a stream
+    receives bursts of events that drive expensive callbacks. A
+    throttled stream triggers at most once per throttle period (in
+    seconds), while a debounced stream only triggers once no event
+    has been received for the debounce period. Deferred events are
+    coalesced, only the latest state of the stream is triggered and
+    the number of events dropped is recorded on the coalesced
+    attribute. Deferred triggers are scheduled on the bokeh server
+    Document or the event loop the events are received on (e.g. the
+    notebook kernel), without a running event loop events trigger
+    immediately.
+
     The Stream class is meant for subclassing and subclasses should
     generally add one or more parameters but may also override the
     transform and reset method to preprocess parameters before they
@@ -78,6 +92,12 @@ class Stream(param.Parameterized):
     # e.g. Stream._callbacks['bokeh'][Stream] = Callback
     _callbacks = defaultdict(dict)
 
+    # Mapping of functions by backend which schedule deferred triggers
+    # given a delay and callback, returning a handle with a cancel
+    # method or None if the backend cannot schedule the trigger.
+    # e.g. Stream._schedulers['bokeh'] = schedule_document_trigger
+    _schedulers = OrderedDict()
+
 
     @classmethod
     def define(cls, name, **kwargs):
@@ -130,15 +150,77 @@ class Stream(param.Parameterized):
         Passing multiple streams at once to trigger can be useful when a
         subscriber may be set multiple times across streams but only
         needs to be called once.
+
+        If any of the streams declare a throttle or debounce period
+        the subscribers are triggered according to the longest period
+        declared on the streams.
+        """
+        if any(stream.throttle or stream.debounce for stream in streams):
+            cls._schedule_trigger(streams)
+        else:
+            cls._trigger(streams)
+
+
+    @classmethod
+    def _schedule_trigger(cls, streams):
+        """
+        Triggers the streams immediately if they are throttled and the
+        throttle period has passed, otherwise schedules a deferred
+        trigger on the event loop running in the current thread. Any
+        pending triggers of the streams are cancelled and their streams
+        merged into the deferred trigger, so the subscribers of all the
+        streams are triggered with the latest state. If no event loop
+        is running the trigger cannot be deferred and is applied
+        immediately.
         """
-        # Union of stream contents
-        items = [stream.contents.items() for stream in streams]
-        union = [kv for kvs in items for kv in kvs]
-        klist = [k for k, _ in union]
-        clashes = set([k for k in klist if klist.count(k) > 1])
-        if clashes:
-            param.main.warning('Parameter name clashes for keys: %r' % clashes)
+        pending = OrderedDict((id(stream._pending), stream._pending)
+                              for stream in streams if stream._pending)
+        pending = list(pending.values())
+        merged = list(util.unique_iterator([s for _, pending_streams in pending
+                                            for s in pending_streams]+list(streams)))
+        throttle = max(stream.throttle or 0 for stream in merged)
+        debounce = max(stream.debounce or 0 for stream in merged)
+        last = max(stream._last_trigger for stream in merged)
+        remaining = last + throttle - time.time()
+
+        if pending:
+            for stream in streams:
+                stream.coalesced += 1
+            for handle, _ in pending:
+                handle.cancel()
+        elif not debounce and remaining <= 0:
+            cls._trigger(streams)
+            return
+
+        def deferred():
+            for stream in merged:
+                stream._pending = None
+            cls._trigger(merged)
+
+        handle = cls._call_later(max(debounce, remaining), deferred)
+        if handle is None:
+            return deferred()
+        for stream in merged:
+            stream._pending = (handle, merged)
 
+
+    @classmethod
+    def _call_later(cls, delay, callback):
+        """
+        Schedules a deferred trigger using the first backend scheduler
+        able to schedule it, e.g. on a bokeh server Document so that
+        the trigger is applied while holding the Document lock, and
+        otherwise on the event loop running in the current thread.
+        """
+        for scheduler in cls._schedulers.values():
+            handle = scheduler(delay, callback)
+            if handle is not None:
+                return handle
+        return util.call_later(delay, callback)
+
+
+    @classmethod
+    def _trigger(cls, streams):
         # Group subscribers by precedence while keeping the ordering
         # within each group
         subscriber_precedence = defaultdict(list)
@@ -146,8 +228,23 @@ class Stream(param.Parameterized):
             for precedence, subscriber in stream._subscribers:
                 subscriber_precedence[precedence].append(subscriber)
         sorted_subscribers = sorted(subscriber_precedence.items(), key=lambda x: x[0])
-        subscribers = util.unique_iterator([s for _, subscribers in sorted_subscribers
-                                            for s in subscribers])
+        subscribers = list(util.unique_iterator([s for _, subscribers in sorted_subscribers
+                                                 for s in subscribers]))
+
+        # Union of stream contents, which are only computed if there
+        # are subscribers since they may have to be materialized
+        union = []
+        if subscribers:
+            items = [stream.contents.items() for stream in streams]
+            union = [kv for kvs in items for kv in kvs]
+            klist = [k for k, _ in union]
+            clashes = set([k for k in klist if klist.count(k) > 1])
+            if clashes:
+                param.main.warning('Parameter name clashes for keys: %r' % clashes)
+
+        now = time.time()
+        for stream in streams:
+            stream._last_trigger = now
 
         with triggering_streams(streams):
             for subscriber in subscribers:
@@ -160,7 +257,7 @@ class Stream(param.Parameterized):
 
 
     def __init__(self, rename={}, source=None, subscribers=[], linked=False,
-                 transient=False, **params):
+                 transient=False, throttle=None, debounce=None, **params):
         """
         The rename argument allows multiple streams with similar event
         state to be used by remapping parameter names.
@@ -171,6 +268,9 @@ class Stream(param.Parameterized):
 
         Some streams are configured to automatically link to the source
         plot, to disable this set linked=False
+
+        The throttle and debounce arguments optionally declare the
+        periods in seconds used to limit the rate of triggered events.
         """
         self._source = source
         self._subscribers = []
@@ -180,6 +280,15 @@ class Stream(param.Parameterized):
         self.linked = linked
         self._rename = self._validate_rename(rename)
         self.transient = transient
+        self.throttle = throttle
+        self.debounce = debounce
+
+        # Number of events coalesced by throttling or debouncing, the
+        # handle and streams of the pending deferred trigger and the
+        # time of the last trigger
+        self.coalesced = 0
+        self._pending = None
+        self._last_trigger = 0
 
         # Whether this stream is currently triggering its subscribers
         self._triggering = False
@@ -270,7 +379,9 @@ class Stream(param.Parameterized):
         params = {k: v for k, v in self.get_param_values() if k != 'name'}
         return self.__class__(rename=mapping,
                               source=self._source,
-                              linked=self.linked, **params)
+                              linked=self.linked,
+                              throttle=self.throttle,
+                              debounce=self.debounce, **params)
 
     @property
     def source(self):
@@ -395,6 +506,29 @@ class Pipe(Stream):
         return {'hash': uuid.uuid4().hex}
 
 
+class _BufferData(param.Parameter):
+    """
+    Parameter holding the data of a Buffer. Appended rows are written
+    to the circular buffers of the Buffer and the ordered data is only
+    materialized once the parameter is read.
+    """
+
+    __slots__ = []
+
+    def __get__(self, obj, objtype):
+        if obj is not None and getattr(obj, '_stale', False):
+            obj._stale = False
+            obj.__dict__[self._internal_name] = obj._materialize()
+        return super(_BufferData, self).__get__(obj, objtype)
+
+    def __set__(self, obj, val):
+        super(_BufferData, self).__set__(obj, val)
+        if obj is not None:
+            # Explicitly set data replaces the contents of the buffers
+            obj._stale = False
+            obj._ring = None
+
+
 class Buffer(Pipe):
     """
     Buffer allows streaming and accumulating incoming chunks of rows
@@ -404,6 +538,11 @@ class Buffer(Pipe):
     by the specified ``length``. The accumulated data is then made
     available via the ``data`` parameter.
 
+    The rows are held in preallocated circular buffers for each
+    column, so that streaming a chunk only copies the rows in the
+    chunk. The accumulated data is materialized in order only when
+    the ``data`` parameter is read.
+
     A Buffer may also be instantiated with a streamz.StreamingDataFrame
     or a streamz.StreamingSeries, it will automatically subscribe to
     events emitted by a streamz object.
@@ -413,6 +552,12 @@ class Buffer(Pipe):
     this may be disabled by setting index=False.
     """
 
+    data = _BufferData(default=None, constant=True, doc="""
+        The rows accumulated by the Buffer.""")
+
+    # Minimum number of rows to allocate for the circular buffers
+    min_capacity = 16
+
     def __init__(self, data, length=1000, index=True, **params):
         if (util.pd and isinstance(data, util.pd.DataFrame)):
             example = data
@@ -454,25 +599,32 @@ class Buffer(Pipe):
         self._count = 0
         self._index = index
 
+        # The circular column buffers, the position of the oldest row
+        # and the number of rows held
+        self._ring = None
+        self._start = 0
+        self._size = 0
+
 
     def verify(self, x):
         """ Verify consistency of dataframes that pass through this stream """
-        if type(x) != type(self.data):
+        example = self._example
+        if type(x) != type(example):
             raise TypeError("Input expected to be of type %s, got %s." %
-                            (type(self.data).__name__, type(x).__name__))
+                            (type(example).__name__, type(x).__name__))
         elif isinstance(x, np.ndarray):
             if x.ndim != 2:
                 raise ValueError('Streamed array data must be two-dimensional')
-            elif x.shape[1] != self.data.shape[1]:
+            elif x.shape[1] != example.shape[1]:
                 raise ValueError("Streamed array data expeced to have %d columns, "
-                                 "got %d." % (self.data.shape[1], x.shape[1]))
-        elif util.pd and isinstance(x, util.pd.DataFrame) and list(x.columns) != list(self.data.columns):
+                                 "got %d." % (example.shape[1], x.shape[1]))
+        elif util.pd and isinstance(x, util.pd.DataFrame) and list(x.columns) != list(example.columns):
             raise IndexError("Input expected to have columns %s, got %s" %
-                             (list(self.data.columns), list(x.columns)))
+                             (list(example.columns), list(x.columns)))
         elif isinstance(x, dict):
-            if any(c not in x for c in self.data):
+            if any(c not in x for c in example):
                 raise IndexError("Input expected to have columns %s, got %s" %
-                                 (sorted(self.data.keys()), sorted(x.keys())))
+                                 (sorted(example.keys()), sorted(x.keys())))
             elif len(set(len(v) for v in x.values())) > 1:
                 raise ValueError("Input columns expected to have the "
                                  "same number of rows.")
@@ -491,51 +643,124 @@ class Buffer(Pipe):
         self.send(data)
 
 
-    def _concat(self, data):
+    def _columns(self, data):
         """
-        Concatenate and slice the accepted data types to the defined
-        length.
+        Returns the columns of the supplied data as a list of arrays,
+        treating 2D arrays as a single column and appending the index
+        of a DataFrame.
         """
         if isinstance(data, np.ndarray):
-            data_length = len(data)
-            if data_length < self.length:
-                prev_chunk = self.data[-(self.length-data_length):]
-                data = np.concatenate([prev_chunk, data])
-            elif data_length > self.length:
-                data = data[-self.length:]
+            return [data]
         elif util.pd and isinstance(data, util.pd.DataFrame):
-            data_length = len(data)
-            if data_length < self.length:
-                prev_chunk = self.data.iloc[-(self.length-data_length):]
-                data = util.pd.concat([prev_chunk, data])
-            elif data_length > self.length:
-                data = data.iloc[-self.length:]
-        elif isinstance(data, dict) and data:
-            data_length = len(list(data.values())[0])
-            new_data = {}
-            for k, v in data.items():
-                if data_length < self.length:
-                    prev_chunk = self.data[k][-(self.length-data_length):]
-                    new_data[k] = np.concatenate([prev_chunk, v])
-                elif data_length > self.length:
-                    new_data[k] = v[-self.length:]
-                else:
-                    new_data[k] = v
-            data = new_data
-        self._chunk_length = data_length
-        return data
+            return ([np.asarray(data.iloc[:, i]) for i in range(len(data.columns))]
+                    + [np.asarray(data.index)])
+        return [np.asarray(data[k]) for k in self._example]
+
+
+    def _allocate(self, values, dtype, capacity):
+        buf = np.empty((capacity,)+values.shape[1:], dtype=dtype)
+        buf[:len(values)] = values
+        return buf
+
+
+    def _ordered(self, buf):
+        "Returns a copy of the rows in a circular buffer in order."
+        if self._size < len(buf):
+            return buf[:self._size].copy()
+        return np.concatenate([buf[self._start:], buf[:self._start]])
+
+
+    def _reset_buffers(self, data):
+        """
+        Initializes the circular buffers from the supplied data, holding
+        on to an empty slice of the data to verify and reconstruct the
+        streamed data from.
+        """
+        if isinstance(data, np.ndarray):
+            self._example = data[:0]
+        elif util.pd and isinstance(data, util.pd.DataFrame):
+            self._example = data.iloc[:0]
+        else:
+            self._example = type(data)((k, np.asarray(v)[:0]) for k, v in data.items())
+        columns = self._columns(data)
+        rows = min(len(columns[0]), self.length) if columns else 0
+        capacity = min(self.length, max(rows, self.min_capacity))
+        self._ring = [self._allocate(c[len(c)-rows:], c.dtype, capacity)
+                      for c in columns]
+        self._start, self._size = 0, rows
+
+
+    def _append(self, columns):
+        """
+        Writes the supplied columns into the circular buffers, growing
+        the buffers geometrically up to the defined length and
+        overwriting the oldest rows once they are full.
+        """
+        rows = len(columns[0]) if columns else 0
+        if not rows:
+            return
+        elif rows > self.length:
+            columns = [c[-self.length:] for c in columns]
+            rows = self.length
+
+        capacity = len(self._ring[0])
+        if self._size + rows > capacity and capacity < self.length:
+            capacity = min(self.length, max(2*capacity, self._size+rows))
+            self._ring = [self._allocate(self._ordered(buf), buf.dtype, capacity)
+                          for buf in self._ring]
+            self._start = 0
+
+        end = (self._start + self._size) % capacity
+        split = min(rows, capacity-end)
+        for i, values in enumerate(columns):
+            buf = self._ring[i]
+            try:
+                dtype = np.result_type(buf.dtype, values.dtype)
+            except TypeError:
+                dtype = np.dtype(object)
+            if dtype != buf.dtype:
+                buf = self._ring[i] = buf.astype(dtype)
+            buf[end:end+split] = values[:split]
+            buf[:rows-split] = values[split:]
+        self._size = min(self._size+rows, capacity)
+        self._start = (end + rows - self._size) % capacity
+
+
+    def _materialize(self):
+        "Returns the rows held in the circular buffers in order."
+        columns = [self._ordered(buf) for buf in self._ring]
+        example = self._example
+        if isinstance(example, np.ndarray):
+            return columns[0]
+        elif util.pd and isinstance(example, util.pd.DataFrame):
+            index = util.pd.Index(columns.pop(), name=example.index.name)
+            data = util.pd.DataFrame(OrderedDict(enumerate(columns)), index=index)
+            data.columns = example.columns
+            return data
+        return type(example)(zip(example, columns))
 
 
     def update(self, **kwargs):
         """
-        Overrides update to concatenate streamed data up to defined length.
+        Overrides update to append streamed data to the circular
+        buffers holding the last length rows.
         """
-        data = kwargs.get('data')
+        data = kwargs.pop('data', None)
         if data is not None:
             if util.pd and isinstance(data, util.pd.DataFrame) and self._index:
                 data = data.reset_index()
+            if self._ring is None:
+                self._reset_buffers(self.data)
             self.verify(data)
-            kwargs['data'] = self._concat(data)
+            if self._pending is None:
+                # Rows appended previously have already been triggered,
+                # otherwise the chunks of coalesced events accumulate
+                self._chunk_length = 0
+            columns = self._columns(data)
+            self._append(columns)
+            rows = len(columns[0]) if columns else 0
+            self._chunk_length = min(self._chunk_length+rows, self._size)
+            self._stale = True
             self._count += 1
         super(Buffer, self).update(**kwargs)
 
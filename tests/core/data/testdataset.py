@@ -2,6 +2,8 @@
 Tests for the Dataset Element types.
 """
 
+import shutil
+import tempfile
 from unittest import SkipTest
 from nose.plugins.attrib import attr
 from itertools import product
@@ -12,13 +14,14 @@ try:
 except ImportError:
     da = None
 
-from holoviews import Dataset, HoloMap, Dimension, Image
+from holoviews import Dataset, HoloMap, DynamicMap, Dimension, Image, NdLayout
 from holoviews.element import Distribution, Points, Scatter
 from holoviews.element.comparison import ComparisonTestCase
 
 from collections import OrderedDict
 from holoviews.core.dimension import OrderedDict as cyODict
-from holoviews.core.data.interface import DataError
+from holoviews.core.data.interface import DataError, Interface
+from holoviews.core.data import ColumnStore
 
 try:
     import pandas as pd
@@ -30,6 +33,11 @@ try:
 except:
     dd = None
 
+try:
+    import pyarrow as pa
+except:
+    pa = None
+
 
 class DatatypeContext(object):
 
@@ -55,6 +63,46 @@ class DatatypeContext(object):
             self.dataset_type.datatype = self._old_datatypes
 
 
+class InterfaceDispatchTest(ComparisonTestCase):
+    """
+    Tests for the cached interface resolution in Interface.initialize.
+    """
+
+    def setUp(self):
+        self.stats = dict(Interface.dispatch_stats)
+
+    def test_dispatch_cache_skips_interface_rejecting_type(self):
+        datatype = ['columnstore', 'dictionary']
+        Interface._dispatch_cache.pop((list, Dataset, tuple(datatype)), None)
+        ds = Dataset([(0, 1), (1, 2)], kdims=['x', 'y'], datatype=datatype)
+        self.assertEqual(ds.interface.datatype, 'dictionary')
+        self.assertEqual(Interface.dispatch_stats['fallbacks'], self.stats['fallbacks']+1)
+        ds = Dataset([(0, 1), (1, 2)], kdims=['x', 'y'], datatype=datatype)
+        self.assertEqual(ds.interface.datatype, 'dictionary')
+        self.assertEqual(Interface.dispatch_stats['fallbacks'], self.stats['fallbacks']+1)
+        self.assertEqual(Interface.dispatch_stats['hits'], self.stats['hits']+1)
+        self.assertEqual(Interface._dispatch_cache[(list, Dataset, tuple(datatype))],
+                         {Interface.interfaces['columnstore']})
+
+    def test_dispatch_cache_ignores_content_dependent_failures(self):
+        # GridInterface cannot be initialized without value dimensions
+        datatype = ['grid', 'dictionary']
+        Interface._dispatch_cache.pop((list, Dataset, tuple(datatype)), None)
+        for _ in range(2):
+            ds = Dataset([(0, 1), (1, 2)], kdims=['x', 'y'], vdims=[], datatype=datatype)
+            self.assertEqual(ds.interface.datatype, 'dictionary')
+        self.assertEqual(Interface.dispatch_stats['fallbacks'], self.stats['fallbacks']+2)
+        self.assertEqual(Interface._dispatch_cache[(list, Dataset, tuple(datatype))], set())
+
+    def test_dispatch_alternating_data_contents(self):
+        datatype = ['array', 'dataframe', 'dictionary']
+        floats = np.random.rand(3, 2)
+        strings = np.array([['a', 'b'], ['c', 'd']])
+        for _ in range(2):
+            self.assertEqual(Scatter(floats, datatype=datatype).interface.datatype, 'array')
+            self.assertNotEqual(Scatter(strings, datatype=datatype).interface.datatype, 'array')
+
+
 class HomogeneousColumnTypes(object):
     """
     Tests for data formats that require all dataset to have the same
@@ -124,6 +172,33 @@ class HomogeneousColumnTypes(object):
     def test_dataset_range(self):
         self.assertEqual(self.dataset_hm.range('y'), (0, 20))
 
+    def test_dataset_stats_range(self):
+        self.assertEqual(self.dataset_hm.stats.range('y'), (0, 20))
+
+    def test_dataset_stats_shared_by_clone(self):
+        self.dataset_hm.range('y')
+        clone = self.dataset_hm.clone()
+        self.assertIs(clone.stats.dataset, clone)
+        self.assertIs(clone.stats._columns, self.dataset_hm.stats._columns)
+
+    def test_dataset_stats_dropped_on_new_data(self):
+        self.dataset_hm.range('y')
+        clone = self.dataset_hm.clone((self.xs, self.y_ints*2))
+        self.assertIsNot(clone.stats, self.dataset_hm.stats)
+        self.assertEqual(clone.range('y'), (0, 40))
+
+    def test_dataset_stats_is_sorted(self):
+        self.assertTrue(self.dataset_hm.stats.is_sorted('x'))
+        if self.dataset_hm.interface.gridded:
+            raise SkipTest("Not supported")
+        reversed_ds = Dataset((self.xs[::-1], self.y_ints[::-1]), kdims=['x'], vdims=['y'])
+        self.assertFalse(reversed_ds.stats.is_sorted('x'))
+
+    def test_dataset_stats_nunique_and_nan_count(self):
+        stats = self.dataset_hm.stats
+        self.assertEqual(stats.nunique('x'), 11)
+        self.assertEqual(stats.nan_count('x'), 0)
+
     def test_dataset_closest(self):
         closest = self.dataset_hm.closest([0.51, 1, 9.9])
         self.assertEqual(closest, [1., 1., 10.])
@@ -233,6 +308,23 @@ class HomogeneousColumnTypes(object):
                                 kdims=[('x', 'X')], vdims=[('y', 'Y')])
         self.assertEqual(self.dataset_hm_alias[5:9], dataset_slice)
 
+    def test_dataset_slice_hm_sorted_index(self):
+        interface = self.dataset_hm.interface
+        if interface.gridded:
+            raise SkipTest("Not supported")
+        self.assertEqual(interface.select_slice(self.dataset_hm, {'x': (5, 9)}),
+                         slice(5, 9))
+
+    def test_dataset_slice_hm_unsorted(self):
+        if self.dataset_hm.interface.gridded:
+            raise SkipTest("Not supported")
+        dataset = Dataset((self.xs[::-1], self.y_ints[::-1]), kdims=['x'], vdims=['y'])
+        interface = dataset.interface
+        self.assertEqual(interface.select_slice(dataset, {'x': (5, 9)}), None)
+        dataset_slice = Dataset({'x':range(8, 4, -1), 'y':[2 * i for i in range(8, 4, -1)]},
+                                kdims=['x'], vdims=['y'])
+        self.assertEqual(dataset[5:9], dataset_slice)
+
     def test_dataset_slice_fn_hm(self):
         dataset_slice = Dataset({'x':range(5, 9), 'y':[2 * i for i in range(5, 9)]},
                                 kdims=['x'], vdims=['y'])
@@ -500,6 +592,19 @@ class HeterogeneousColumnTypes(HomogeneousColumnTypes):
         samples = self.dataset_ht.sample([0, 5, 10]).dimension_values('y')
         self.assertEqual(samples, np.array([0, 0.5, 1]))
 
+    def test_dataset_sample_order_ht(self):
+        samples = self.table.sample([('F', 12), ('M', 10), ('F', 0)])
+        self.assertEqual(samples.dimension_values('Weight'), np.array([10, 15]))
+
+    def test_dataset_append_ht(self):
+        table = self.table.clone()
+        self.assertEqual(table.range('Age'), (10, 16))
+        table.append({'Gender': ['F'], 'Age': [20], 'Weight': [12], 'Height': [0.5]})
+        self.assertEqual(table.dimension_values('Age'), np.array([10, 16, 12, 20]))
+        self.assertEqual(table.dimension_values('Gender'), np.array(['M', 'M', 'F', 'F']))
+        self.assertEqual(table.range('Age'), (10, 20))
+        self.assertEqual(self.table.dimension_values('Age'), self.age)
+
     def test_dataset_reduce_ht(self):
         reduced = Dataset({'Age':self.age, 'Weight':self.weight, 'Height':self.height},
                           kdims=self.kdims[1:], vdims=self.vdims)
@@ -590,6 +695,15 @@ class HeterogeneousColumnTypes(HomogeneousColumnTypes):
                           kdims=['Age'])
         self.assertEqual(self.table.groupby(['Age']), grouped)
 
+    def test_dataset_groupby_interleaved_keys(self):
+        ds = Dataset({'A': [1, 2, 1, 3, 2], 'B': ['a', 'b', 'a', 'a', 'c'], 'C': range(5)},
+                     kdims=['A', 'B'], vdims=['C'])
+        grouped = ds.groupby(['A', 'B'], container_type=list)
+        self.assertEqual([k for k, _ in grouped],
+                         [(1, 'a'), (2, 'b'), (3, 'a'), (2, 'c')])
+        self.assertEqual([list(g.dimension_values('C')) for _, g in grouped],
+                         [[0, 2], [1], [3], [4]])
+
     def test_dataset_groupby_dynamic(self):
         grouped_dataset = self.table.groupby('Gender', dynamic=True)
         self.assertEqual(grouped_dataset['M'],
@@ -597,6 +711,43 @@ class HeterogeneousColumnTypes(HomogeneousColumnTypes):
         self.assertEqual(grouped_dataset['F'],
                          self.table.select(Gender='F').reindex(['Age']))
 
+    def test_dataset_groupby_lazy(self):
+        grouped_dataset = self.table.groupby('Gender', lazy=True)
+        self.assertIsInstance(grouped_dataset, DynamicMap)
+        self.assertEqual(grouped_dataset['M'],
+                         self.table.select(Gender='M').reindex(['Age']))
+        self.assertEqual(grouped_dataset['F'],
+                         self.table.select(Gender='F').reindex(['Age']))
+
+    def test_dataset_groupby_lazy_materializes_on_access(self):
+        grouped_dataset = self.table.groupby('Gender', lazy=True)
+        self.assertEqual(len(grouped_dataset), 0)
+        grouped_dataset['F']
+        self.assertEqual(grouped_dataset.keys(), ['F'])
+
+    def test_dataset_groupby_lazy_container_type(self):
+        grouped_dataset = self.table.groupby('Gender', lazy=True, container_type=NdLayout)
+        self.assertIsInstance(grouped_dataset, NdLayout)
+        self.assertEqual(grouped_dataset['F'],
+                         self.table.select(Gender='F').reindex(['Age']))
+
+    def test_dataset_groupby_lazy_normalizes_datetime_keys(self):
+        dates = np.array(['2017-01-01', '2017-01-01', '2017-01-02'], dtype='datetime64[ns]')
+        ds = Dataset({'t': dates, 'y': np.arange(3)}, kdims=['t'], vdims=['y'],
+                     datatype=[self.datatype])
+        grouped = ds.groupby('t', lazy=True)
+        group = grouped.callback(np.datetime64('2017-01-01', 'D'))
+        self.assertEqual(group.dimension_values('y'), np.array([0, 1]))
+        if pd is not None:
+            group = grouped.callback(pd.Timestamp('2017-01-02'))
+            self.assertEqual(group.dimension_values('y'), np.array([2]))
+
+    def test_dataset_groupby_lazy_nan_key(self):
+        ds = Dataset({'x': np.array([np.nan, 1, np.nan]), 'y': np.arange(3)},
+                     kdims=['x'], vdims=['y'], datatype=[self.datatype])
+        group = ds.groupby('x', lazy=True).callback(float('nan'))
+        self.assertEqual(group.dimension_values('y'), np.array([0, 2]))
+
     def test_dataset_groupby_dynamic_alias(self):
         grouped_dataset = self.alias_table.groupby('Gender', dynamic=True)
         self.assertEqual(grouped_dataset['M'],
@@ -657,6 +808,20 @@ class HeterogeneousColumnTypes(HomogeneousColumnTypes):
         self.assertEquals(row, indexed)
         self.assertEquals(alias_row, indexed)
 
+    def test_dataset_select_rows_age_list(self):
+        row = self.table.select(Age=[10, 12, 99])
+        indexed = Dataset({'Gender':['M', 'F'], 'Age':[10, 12],
+                           'Weight':[15,10], 'Height':[0.8,0.8]},
+                          kdims=self.kdims, vdims=self.vdims)
+        self.assertEquals(row, indexed)
+
+    def test_dataset_select_rows_gender_set(self):
+        row = self.table.select(Gender={'F', 'X'})
+        indexed = Dataset({'Gender':['F'], 'Age':[12],
+                           'Weight':[10], 'Height':[0.8]},
+                          kdims=self.kdims, vdims=self.vdims)
+        self.assertEquals(row, indexed)
+
     def test_dataset_index_row_age(self):
         indexed = Dataset({'Gender':['F'], 'Age':[12],
                            'Weight':[10], 'Height':[0.8]},
@@ -869,6 +1034,17 @@ class ArrayDatasetTest(HomogeneousColumnTypes, ComparisonTestCase):
                             kdims=['x', 'y'], vdims=['z'])
         self.assertEqual(ds.sort(reverse=True), ds_sorted)
 
+    def test_dataset_append_casts_rows(self):
+        if pd is None:
+            raise SkipTest("Pandas not available")
+        dataset = Dataset(np.array([[0, 1], [1, 2]]), kdims=['x'], vdims=['y'])
+        dataset.append({'x': [2.5], 'y': [3.5]})
+        dataset.append([(3, 4)])
+        dataset.append(pd.DataFrame({'y': [5], 'x': [4]}))
+        self.assertIsInstance(dataset.data, np.ndarray)
+        self.assertEqual(dataset.dimension_values('x'), np.array([0, 1, 2.5, 3, 4]))
+        self.assertEqual(dataset.dimension_values('y'), np.array([1, 2, 3.5, 4, 5]))
+
 
 
 class DFDatasetTest(HeterogeneousColumnTypes, ComparisonTestCase):
@@ -996,6 +1172,35 @@ class DFDatasetTest(HeterogeneousColumnTypes, ComparisonTestCase):
         self.assertEqual(dataset, Dataset([(i, i) for i in range(1, 4)],
                                           kdims=['x'], vdims=['y']))
 
+    def test_dataset_stats_range_inplace_column_update(self):
+        df = pd.DataFrame({'x': np.arange(3), 'y': np.arange(3)})
+        dataset = Dataset(df, kdims=['x'], vdims=['y'])
+        self.assertEqual(dataset.range('y'), (0, 2))
+        df.loc[0, 'y'] = 10
+        self.assertEqual(dataset.range('y'), (1, 10))
+        df['y'] = np.arange(3)*-1
+        self.assertEqual(dataset.range('y'), (-2, 0))
+
+    def test_dataset_append_dataframe_reuses_buffers(self):
+        df = pd.DataFrame({'x': np.arange(3), 'y': np.arange(3.)}, columns=['x', 'y'])
+        dataset = Dataset(df, kdims=['x'], vdims=['y'])
+        dataset.append({'x': [3], 'y': [3.]})
+        values = dataset.data['x'].values
+        dataset.append({'x': [4, 5], 'y': [4., 5.]})
+        self.assertTrue(np.shares_memory(dataset.data['x'].values, values))
+        self.assertEqual(dataset.dimension_values('x'), np.arange(6))
+        self.assertEqual(dataset.dimension_values('y'), np.arange(6.))
+
+    def test_dataset_append_dataframe_preserves_index_and_columns(self):
+        df = pd.DataFrame({'x': [0, 1], 'y': [0., 1.], 'z': ['A', 'B']},
+                          columns=['x', 'y', 'z'], index=[10, 20])
+        dataset = Dataset(df, kdims=['x'], vdims=['y'])
+        dataset.append({'x': [2], 'y': [2.]})
+        self.assertEqual(list(dataset.data.index), [10, 20, 0])
+        self.assertEqual(list(dataset.data['z'].iloc[:2]), ['A', 'B'])
+        self.assertTrue(np.isnan(dataset.data['z'].iloc[2]))
+        self.assertEqual(dataset.dimension_values('x'), np.arange(3))
+
 
 class DaskDatasetTest(DFDatasetTest):
     """
@@ -1025,6 +1230,9 @@ class DaskDatasetTest(DFDatasetTest):
     def test_dataset_sort_hm(self):
         raise SkipTest("Not supported")
 
+    def test_dataset_sample_order_ht(self):
+        raise SkipTest("Not supported")
+
     def test_dataset_sort_reverse_hm(self):
         raise SkipTest("Not supported")
 
@@ -1043,6 +1251,15 @@ class DaskDatasetTest(DFDatasetTest):
     def test_dataset_boolean_index(self):
         raise SkipTest("Not supported")
 
+    def test_dataset_stats_range_inplace_column_update(self):
+        raise SkipTest("Not supported")
+
+    def test_dataset_append_dataframe_reuses_buffers(self):
+        raise SkipTest("Not supported")
+
+    def test_dataset_append_dataframe_preserves_index_and_columns(self):
+        raise SkipTest("Not supported")
+
 
 class DictDatasetTest(HeterogeneousColumnTypes, ScalarColumnTypes, ComparisonTestCase):
     """
@@ -1062,6 +1279,127 @@ class DictDatasetTest(HeterogeneousColumnTypes, ScalarColumnTypes, ComparisonTes
         self.assertEqual(dataset, Dataset([(i, i) for i in range(1, 4)],
                                           kdims=['x'], vdims=['y']))
 
+    def test_dataset_append_reuses_buffers(self):
+        dataset = Dataset({'x': np.arange(3), 'y': np.arange(3)}, kdims=['x'], vdims=['y'])
+        dataset.append({'x': [3], 'y': [3]})
+        buf = dataset.data['x'].base
+        dataset.append({'x': [4, 5], 'y': [4, 5]})
+        self.assertIs(dataset.data['x'].base, buf)
+        self.assertEqual(dataset.dimension_values('x'), np.arange(6))
+
+    def test_dataset_append_updates_sorted(self):
+        dataset = Dataset({'x': np.arange(3), 'y': np.arange(3)}, kdims=['x'], vdims=['y'])
+        self.assertTrue(dataset.stats.is_sorted('x'))
+        dataset.append({'x': [3, 4], 'y': [0, 0]})
+        self.assertTrue(dataset.stats.is_sorted('x'))
+        dataset.append({'x': [1], 'y': [0]})
+        self.assertFalse(dataset.stats.is_sorted('x'))
+
+    def test_dataset_stats_range_replaced_column(self):
+        dataset = Dataset({'x': np.arange(3), 'y': np.arange(3)}, kdims=['x'], vdims=['y'])
+        self.assertEqual(dataset.range('y'), (0, 2))
+        dataset.data['y'] = np.arange(3)*2
+        self.assertEqual(dataset.range('y'), (0, 4))
+
+    def test_dataset_select_computes_slice_once(self):
+        dataset = Dataset({'x': np.arange(5), 'y': np.arange(5)}, kdims=['x'], vdims=['y'])
+        interface, calls = dataset.interface, []
+        select_slice = interface.select_slice.__func__
+        def counted(cls, dataset, selection):
+            calls.append(selection)
+            return select_slice(cls, dataset, selection)
+        interface.select_slice = classmethod(counted)
+        try:
+            selected = dataset.select(x={1, 3})
+        finally:
+            del interface.select_slice
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(selected.dimension_values('y'), np.array([1, 3]))
+
+
+
+class ArrowDatasetTest(HeterogeneousColumnTypes, ComparisonTestCase):
+    """
+    Test of the pyarrow Table interface.
+    """
+
+    datatype = 'arrow'
+
+    def setUp(self):
+        if pa is None:
+            raise SkipTest("pyarrow not available")
+        self.restore_datatype = Dataset.datatype
+        Dataset.datatype = [self.datatype]
+        self.data_instance_type = pa.Table
+        self.init_column_data()
+
+    def test_dataset_arrow_table_init(self):
+        table = pa.Table.from_arrays([pa.array(self.xs), pa.array(self.ys)],
+                                     names=['x', 'y'])
+        dataset = Dataset(table, kdims=['x'], vdims=['y'])
+        self.assertIs(dataset.data, table)
+        self.assertEqual(dataset.dimension_values('y'), self.ys)
+
+    def test_dataset_arrow_zero_copy_values(self):
+        values = self.dataset_ht.dimension_values('y')
+        self.assertFalse(values.flags.owndata)
+        self.assertFalse(values.flags.writeable)
+
+
+class ColumnStoreDatasetTest(ComparisonTestCase):
+    """
+    Test of the memory-mapped ColumnStore interface.
+    """
+
+    def setUp(self):
+        self.restore_datatype = Dataset.datatype
+        Dataset.datatype = ['columnstore', 'dictionary']
+        self.path = tempfile.mkdtemp()
+        self.xs = np.arange(10)
+        self.ys = np.linspace(0, 1, 10)
+        self.gs = np.array(['A', 'B']*5)
+        source = Dataset({'x': self.xs, 'g': self.gs, 'y': self.ys},
+                         kdims=['x', 'g'], vdims=['y'], datatype=['dictionary'])
+        self.store = ColumnStore.write(source, self.path)
+        self.dataset = Dataset(self.store)
+
+    def tearDown(self):
+        Dataset.datatype = self.restore_datatype
+        shutil.rmtree(self.path)
+
+    def test_columnstore_init_dimensions(self):
+        self.assertIs(self.dataset.data, self.store)
+        self.assertEqual(self.dataset.interface.datatype, 'columnstore')
+        self.assertEqual(self.dataset.kdims, [Dimension('x'), Dimension('g')])
+        self.assertEqual(self.dataset.vdims, [Dimension('y')])
+
+    def test_columnstore_memory_mapped(self):
+        self.assertIsInstance(self.store['y'], np.memmap)
+
+    def test_columnstore_values(self):
+        self.assertEqual(self.dataset.dimension_values('y'), self.ys)
+        self.assertEqual(self.dataset.dimension_values('g'), self.gs)
+
+    def test_columnstore_stored_range(self):
+        self.assertEqual(self.store.range('x'), (0, 9))
+        self.assertEqual(self.dataset.range('y'), (0., 1.))
+        self.assertEqual(self.dataset.range('g'), ('A', 'B'))
+
+    def test_columnstore_select(self):
+        selected = self.dataset.select(x=(2, 5))
+        self.assertEqual(selected.interface.datatype, 'dictionary')
+        self.assertEqual(selected.dimension_values('x'), np.array([2, 3, 4]))
+
+    def test_columnstore_groupby(self):
+        grouped = self.dataset.groupby('g')
+        self.assertEqual(grouped.keys(), ['A', 'B'])
+        self.assertEqual(grouped['B'].dimension_values('x'), self.xs[1::2])
+        self.assertEqual(grouped['B'].dimension_values('y'), self.ys[1::2])
+
+    def test_columnstore_append_read_only(self):
+        with self.assertRaises(DataError):
+            self.dataset.append({'x': [0], 'y': [0], 'g': ['A']})
+
 
 class GridTests(object):
     """
@@ -3,13 +3,17 @@ Unit test of the archive system, namely FileArchive with different
 exporters (not including renderers).
 """
 import os
+import sys
 import shutil
+import subprocess
+import threading
 import json
 import zipfile
 import tarfile
+import tempfile
 import numpy as np
 from holoviews import Image
-from holoviews.core.io import Serializer, FileArchive
+from holoviews.core.io import Serializer, FileArchive, FileCache
 from holoviews.element.comparison import ComparisonTestCase
 
 
@@ -124,3 +128,87 @@ class TestFileArchive(ComparisonTestCase):
             raise AssertionError("No file %r created on export." % fname)
         self.assertEqual(json.load(open(fname, 'r')), data)
         self.assertEqual(archive.listing(), [])
+
+
+
+def cached_function(x):
+    return x
+
+
+class TestFileCache(ComparisonTestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.image1 = Image(np.array([[1,2],[4,5]]), group='Group1', label='Im1')
+        self.image2 = Image(np.array([[5,4],[3,2]]), group='Group2', label='Im2')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_filecache_set_get(self):
+        cache = FileCache(self.directory)
+        key = cache.hashkey(cache.identity(cached_function), (1,))
+        cache.set(key, self.image1)
+        self.assertIn(key, cache)
+        self.assertEqual(cache.get(key), self.image1)
+        self.assertEqual(cache.hits, 1)
+
+    def test_filecache_persists_across_instances(self):
+        cache = FileCache(self.directory)
+        key = cache.hashkey(cache.identity(cached_function), (1,))
+        FileCache(self.directory).set(key, self.image1)
+        self.assertEqual(FileCache(self.directory).get(key), self.image1)
+
+    def test_filecache_missing_key(self):
+        cache = FileCache(self.directory)
+        with self.assertRaises(KeyError):
+            cache.get(cache.hashkey(cache.identity(cached_function), (1,)))
+        self.assertEqual(cache.misses, 1)
+
+    def test_filecache_hashkey_distinct(self):
+        cache = FileCache(self.directory)
+        self.assertNotEqual(cache.hashkey(cache.identity(cached_function), (1,)),
+                            cache.hashkey(cache.identity(cached_function), (2,)))
+        self.assertNotEqual(cache.hashkey(cache.identity(cached_function), (1,)),
+                            cache.hashkey(cache.identity(lambda x: x), (1,)))
+
+    def test_filecache_hashkey_stable_across_sessions(self):
+        script = ("from holoviews.core.io import FileCache;"
+                  "cache = FileCache();"
+                  "print(cache.hashkey(cache.identity(len), ({'a', 'b', 'c'}, {'x': 1, 'y': 2})))")
+        keys = set()
+        for seed in ['1', '2']:
+            env = dict(os.environ, PYTHONHASHSEED=seed)
+            output = subprocess.check_output([sys.executable, '-c', script], env=env)
+            keys.add(output.strip())
+        self.assertEqual(len(keys), 1)
+
+    def test_filecache_identity_unserializable_closure(self):
+        lock = threading.Lock()
+        def callback(x):
+            with lock:
+                return x
+        cache = FileCache(self.directory)
+        self.assertIsNone(cache.identity(callback))
+
+    def test_filecache_evict_max_entries(self):
+        cache = FileCache(self.directory, max_entries=1)
+        key1 = cache.hashkey(cache.identity(cached_function), (1,))
+        key2 = cache.hashkey(cache.identity(cached_function), (2,))
+        cache.set(key1, self.image1)
+        cache.set(key2, self.image2)
+        self.assertEqual(len(cache), 1)
+        self.assertNotIn(key1, cache)
+        self.assertEqual(cache.get(key2), self.image2)
+
+    def test_filecache_evict_max_bytes(self):
+        cache = FileCache(self.directory, max_bytes=0)
+        key = cache.hashkey(cache.identity(cached_function), (1,))
+        cache.set(key, self.image1)
+        self.assertEqual(len(cache), 0)
+
+    def test_filecache_clear(self):
+        cache = FileCache(self.directory)
+        cache.set(cache.hashkey(cache.identity(cached_function), (1,)), self.image1)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
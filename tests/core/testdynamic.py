@@ -1,9 +1,15 @@
+import sys
 import uuid
+import shutil
+import tempfile
 from collections import deque
 import time
+from functools import partial
+from unittest import SkipTest
 
 import numpy as np
 from holoviews import Dimension, NdLayout, GridSpace, Layout
+from holoviews.core.io import FileCache
 from holoviews.core.spaces import DynamicMap, HoloMap, Callable
 from holoviews.element import Image, Scatter, Curve, Text, Points
 from holoviews.operation import histogram
@@ -18,6 +24,33 @@ frequencies =  np.linspace(0.5,2.0,5)
 phases = np.linspace(0, np.pi*2, 5)
 x,y = np.mgrid[-5:6, -5:6] * 0.1
 
+# Coroutine functions are declared using exec because async syntax
+# is not valid on Python 2
+async_namespace = {}
+if sys.version_info >= (3, 6):
+    exec("""
+import asyncio
+from holoviews.element import Curve
+
+async def async_curve(x, calls):
+    calls.append(x)
+    await asyncio.sleep(0)
+    return Curve([(0, x)])
+
+async def async_flaky_curve(x, calls):
+    calls.append(x)
+    await asyncio.sleep(0)
+    if len(calls) == 1:
+        raise ValueError('First call fails')
+    return Curve([(0, x)])
+
+async def async_curves():
+    for i in range(2):
+        await asyncio.sleep(0)
+        yield Curve([(0, i)])
+""", async_namespace)
+
+
 def sine_array(phase, freq):
     return np.sin(phase + (freq*x**2+freq*y**2))
 
@@ -499,6 +532,349 @@ class DynamicCallableMemoize(ComparisonTestCase):
         self.assertEqual(dmap[()], Curve([1, 1, 1, 2, 2, 2]))
 
 
+    def test_dynamic_callable_memoize_multiple_entries(self):
+        # Flipping between memoized stream states does not recompute
+        def history_callback(x, history=deque(maxlen=10)):
+            history.append(x)
+            return Curve(list(history))
+
+        x = PointerX()
+        dmap = DynamicMap(history_callback, kdims=[], streams=[x])
+
+        # Add stream subscriber mocking plot
+        x.add_subscriber(lambda **kwargs: dmap[()])
+
+        for i in [1, 2, 1, 2]:
+            x.event(x=i)
+
+        self.assertEqual(dmap[()], Curve([1, 2]))
+
+    def test_dynamic_callable_memoize_size(self):
+        def history_callback(x, history=deque(maxlen=10)):
+            history.append(x)
+            return Curve(list(history))
+
+        x = PointerX()
+        callable_obj = Callable(history_callback, memoize_size=1)
+        dmap = DynamicMap(callable_obj, kdims=[], streams=[x])
+
+        # Add stream subscriber mocking plot
+        x.add_subscriber(lambda **kwargs: dmap[()])
+
+        for i in [1, 2, 1]:
+            x.event(x=i)
+
+        self.assertEqual(dmap[()], Curve([1, 2, 1]))
+
+    def test_dynamic_callable_memoize_equal_hashes(self):
+        # hash(-1) == hash(-2) must not return the memoized value of -1
+        dmap = DynamicMap(lambda i: Curve([i, i]), kdims=['i'])
+        self.assertEqual(dmap[-1], Curve([-1, -1]))
+        self.assertEqual(dmap[-2], Curve([-2, -2]))
+
+    def test_callable_memoize_unhashable_disabled(self):
+        class Mutable(object):
+            __hash__ = None
+            def __init__(self, value):
+                self.value = value
+
+        callable_obj = Callable(lambda obj: obj.value)
+        obj = Mutable(1)
+        self.assertEqual(callable_obj(obj), 1)
+        obj.value = 2
+        self.assertEqual(callable_obj(obj), 2)
+        self.assertEqual(len(callable_obj._memoized), 0)
+
+
+
+class DynamicAsyncCallback(ComparisonTestCase):
+
+    def setUp(self):
+        if 'async_curve' not in async_namespace:
+            raise SkipTest('Asynchronous callbacks require Python >= 3.6')
+        import asyncio
+        self.loop = asyncio.new_event_loop()
+        self.calls = []
+        self.callback = partial(async_namespace['async_curve'], calls=self.calls)
+
+    def tearDown(self):
+        self.loop.close()
+
+    def schedule(self, dmap, *keys):
+        "Schedules the callback for each key on a running event loop"
+        import asyncio
+        tasks = []
+        for key in keys:
+            self.loop.call_soon(lambda k=key: tasks.append(dmap._schedule_callback(k)))
+        self.loop.run_until_complete(asyncio.sleep(0.01))
+        return tasks
+
+    def test_dynamic_async_callback_sync_access(self):
+        dmap = DynamicMap(self.callback, kdims=['x'])
+        self.assertTrue(dmap.callback.asynchronous)
+        self.assertEqual(dmap[1], Curve([(0, 1)]))
+
+    def test_dynamic_async_callback_sync_access_running_loop(self):
+        import asyncio
+        dmap = DynamicMap(self.callback, kdims=['x'])
+        frames = []
+        self.loop.call_soon(lambda: frames.append(dmap[1]))
+        self.loop.run_until_complete(asyncio.sleep(0.01))
+        self.assertEqual(frames, [Curve([(0, 1)])])
+
+    def test_dynamic_async_callback_scheduled(self):
+        dmap = DynamicMap(self.callback, kdims=['x'])
+        tasks = self.schedule(dmap, 1)
+        self.assertTrue(all(t.done() for t in tasks))
+        self.assertEqual(dmap[1], Curve([(0, 1)]))
+        self.assertEqual(self.calls, [1])
+
+    def test_dynamic_async_callback_superseded(self):
+        dmap = DynamicMap(self.callback, kdims=['x'])
+        first, second = self.schedule(dmap, 1, 2)
+        self.assertTrue(first.cancelled())
+        self.assertEqual(dmap[2], Curve([(0, 2)]))
+        self.assertEqual(self.calls, [2])
+
+    def test_dynamic_async_callback_cached_not_scheduled(self):
+        dmap = DynamicMap(self.callback, kdims=['x'])
+        dmap[1]
+        self.assertEqual(self.schedule(dmap, 1), [None])
+        self.assertEqual(self.calls, [1])
+
+    def test_dynamic_async_callback_failure_retried(self):
+        callback = partial(async_namespace['async_flaky_curve'], calls=self.calls)
+        dmap = DynamicMap(callback, kdims=['x'])
+        task, = self.schedule(dmap, 1)
+        self.assertIsInstance(task.exception(), ValueError)
+        self.assertEqual(dmap[1], Curve([(0, 1)]))
+        self.assertEqual(self.calls, [1, 1])
+
+    def test_dynamic_async_callback_not_memoized_reset(self):
+        dmap = DynamicMap(Callable(self.callback, memoize=False), kdims=['x'])
+        self.schedule(dmap, 1)
+        self.assertEqual(dmap[1], Curve([(0, 1)]))
+        dmap.reset()
+        self.assertEqual(dmap[1], Curve([(0, 1)]))
+        self.assertEqual(self.calls, [1, 1])
+
+    def test_dynamic_async_generator(self):
+        dmap = DynamicMap(async_namespace['async_curves']())
+        self.assertTrue(dmap.callback.asynchronous)
+        self.assertEqual(dmap[()], Curve([(0, 0)]))
+        self.assertEqual(dmap[()], Curve([(0, 1)]))
+        with self.assertRaises(StopIteration):
+            dmap[()]
+
+
+class DynamicPersistentCache(ComparisonTestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.calls = []
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def callback(self, x):
+        self.calls.append(x)
+        return Curve([(0, x)])
+
+    def stream_callback(self, x, y):
+        return self.callback(x+y)
+
+    def test_dynamic_persistent_cache_new_dmap(self):
+        cache = FileCache(self.directory)
+        dmap = DynamicMap(self.callback, kdims=['x'], persistent_cache=cache)
+        self.assertEqual(dmap[1], Curve([(0, 1)]))
+        dmap = DynamicMap(self.callback, kdims=['x'], persistent_cache=cache)
+        self.assertEqual(dmap[1], Curve([(0, 1)]))
+        self.assertEqual(self.calls, [1])
+        self.assertEqual(cache.hits, 1)
+
+    def test_dynamic_persistent_cache_streams(self):
+        cache = FileCache(self.directory)
+        xy = XY()
+        dmap = DynamicMap(self.stream_callback, streams=[xy], persistent_cache=cache)
+        dmap.event(x=1, y=1)
+        dmap[()]
+        dmap.event(x=1, y=2)
+        dmap[()]
+        dmap.callback._memoized.clear()
+        dmap.event(x=1, y=1)
+        self.assertEqual(dmap[()], Curve([(0, 2)]))
+        self.assertEqual(self.calls, [2, 3])
+
+    def test_callable_persistent_cache_identity_computed_once(self):
+        identities = []
+        class CountingCache(FileCache):
+            def identity(self, callable_obj):
+                identities.append(callable_obj)
+                return super(CountingCache, self).identity(callable_obj)
+        callable_obj = Callable(self.callback, persistent_cache=CountingCache(self.directory))
+        callable_obj(1)
+        callable_obj(2)
+        self.assertEqual(len(identities), 1)
+        self.assertEqual(self.calls, [1, 2])
+
+    def test_callable_persistent_cache_memoize_disabled(self):
+        cache = FileCache(self.directory)
+        callable_obj = Callable(self.callback, memoize=False, persistent_cache=cache)
+        callable_obj(1)
+        self.assertEqual(len(cache), 0)
+
+
+class DynamicMapCachePolicy(ComparisonTestCase):
+
+    def test_dynamic_cache_policy_fifo(self):
+        dmap = DynamicMap(lambda i: Curve([i, i]), kdims=['i'],
+                          cache_size=2, cache_policy='fifo')
+        for i in [0, 1, 0, 2]:
+            dmap[i]
+        self.assertEqual(dmap.keys(), [1, 2])
+
+    def test_dynamic_cache_policy_lru(self):
+        dmap = DynamicMap(lambda i: Curve([i, i]), kdims=['i'], cache_size=2)
+        for i in [0, 1, 0, 2]:
+            dmap[i]
+        self.assertEqual(dmap.keys(), [0, 2])
+        self.assertEqual(dmap.cache_stats['hits'], 1)
+        self.assertEqual(dmap.cache_stats['misses'], 3)
+        self.assertEqual(dmap.cache_stats['evictions'], 1)
+
+    def test_dynamic_cache_policy_lfu(self):
+        dmap = DynamicMap(lambda i: Curve([i, i]), kdims=['i'],
+                          cache_size=2, cache_policy='lfu')
+        for i in [0, 0, 0, 1, 1, 2]:
+            dmap[i]
+        self.assertEqual(dmap.keys(), [0, 2])
+
+    def test_dynamic_cache_bytes(self):
+        dmap = DynamicMap(lambda i: Image(np.full((10, 10), i, dtype='float64')),
+                          kdims=['i'], cache_bytes=2000)
+        for i in range(3):
+            dmap[i]
+        self.assertEqual(dmap.keys(), [1, 2])
+        self.assertEqual(dmap.cache_stats['nbytes'], 1600)
+        self.assertEqual(dmap.cache_stats['evictions'], 1)
+
+    def test_dynamic_cache_reset_stats(self):
+        dmap = DynamicMap(lambda i: Image(np.full((10, 10), i, dtype='float64')),
+                          kdims=['i'])
+        dmap[0]
+        dmap.reset()
+        self.assertEqual(dmap.cache_stats['nbytes'], 0)
+
+
+
+class DynamicMapExecutor(ComparisonTestCase):
+
+    def setUp(self):
+        self.calls = []
+
+    def callback(self, x, y=0):
+        self.calls.append((x, y))
+        return Curve([(x, y)])
+
+    def wait_for_prefetch(self, dmap):
+        from concurrent.futures import wait
+        wait(list(dmap._prefetched.values()))
+
+    def test_cross_product_thread_executor(self):
+        dmap = DynamicMap(self.callback, kdims=['x', 'y'], executor='thread')
+        product = dmap[[0, 1, 2], [0, 1]]
+        self.assertEqual(product.keys(), [(x, y) for x in range(3) for y in range(2)])
+        self.assertEqual(product[2, 1], Curve([(2, 1)]))
+        self.assertEqual(sorted(self.calls), product.keys())
+
+    def test_cross_product_caches_results(self):
+        dmap = DynamicMap(self.callback, kdims=['x', 'y'], executor='thread')
+        dmap[[0, 1], [0, 1]]
+        dmap[[0, 1], [0, 1]]
+        self.assertEqual(len(self.calls), 4)
+        self.assertEqual(len(dmap), 4)
+        self.assertEqual(dmap.cache_stats['hits'], 4)
+
+    def test_cross_product_cache_size(self):
+        dmap = DynamicMap(self.callback, kdims=['x', 'y'], executor='thread',
+                          cache_size=2)
+        dmap[[0, 1], [0, 1]]
+        self.assertEqual(len(dmap), 2)
+        self.assertEqual(len(self.calls), 4)
+
+    def test_callable_concurrent_memoization(self):
+        from concurrent.futures import ThreadPoolExecutor
+        callable_obj = Callable(lambda x: x, memoize_size=5)
+        with ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(callable_obj, [i % 20 for i in range(2000)]))
+        self.assertEqual(results, [i % 20 for i in range(2000)])
+        self.assertEqual(len(callable_obj._memoized), 5)
+
+    def test_sampled_executor_instance(self):
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(2) as pool:
+            dmap = DynamicMap(self.callback, kdims=['x', 'y'], executor=pool)
+            sampled = dmap[[(0, 1), (3, 2), (1, 1)]]
+        self.assertEqual(sampled.keys(), [(0, 1), (1, 1), (3, 2)])
+        self.assertEqual(sampled[3, 2], Curve([(3, 2)]))
+
+    def test_invalid_executor(self):
+        dmap = DynamicMap(self.callback, kdims=['x', 'y'], executor='process')
+        with self.assertRaisesRegexp(ValueError, "DynamicMap executor must be"):
+            dmap[[0, 1], [0, 1]]
+
+    def test_prefetch_neighbouring_values(self):
+        dmap = DynamicMap(self.callback, kdims=[Dimension('x', values=[0, 1, 2, 3])],
+                          prefetch=1)
+        dmap[2]
+        self.wait_for_prefetch(dmap)
+        self.assertEqual(sorted(self.calls), [(1, 0), (2, 0), (3, 0)])
+        self.assertEqual(dmap[3], Curve([(3, 0)]))
+        self.assertEqual(len(self.calls), 3)
+
+    def test_prefetch_caches_completed(self):
+        dmap = DynamicMap(self.callback, kdims=[Dimension('x', values=[0, 1, 2, 3])],
+                          prefetch=1)
+        dmap[0]
+        self.wait_for_prefetch(dmap)
+        dmap[0]
+        self.assertEqual(dmap.keys(), [0, 1])
+        self.assertEqual(list(dmap._prefetched), [])
+
+    def test_prefetch_error_raised_once(self):
+        def callback(x):
+            self.calls.append(x)
+            if x == 1:
+                raise ValueError('Prefetch failed')
+            return Curve([(x, 0)])
+        dmap = DynamicMap(callback, kdims=[Dimension('x', values=[0, 1, 2])],
+                          prefetch=1)
+        dmap[0]
+        self.wait_for_prefetch(dmap)
+        with self.assertRaisesRegexp(ValueError, 'Prefetch failed'):
+            dmap[1]
+        self.assertEqual(self.calls, [0, 1])
+
+    def test_prefetch_reset_shuts_down_pool(self):
+        dmap = DynamicMap(self.callback, kdims=[Dimension('x', values=[0, 1, 2])],
+                          prefetch=1)
+        dmap[0]
+        pool = dmap._prefetch_pool
+        dmap.reset()
+        self.assertIsNone(dmap._prefetch_pool)
+        self.assertEqual(list(dmap._prefetched), [])
+        with self.assertRaises(RuntimeError):
+            pool.submit(self.callback, 0)
+
+    def test_prefetch_step_within_range(self):
+        dmap = DynamicMap(self.callback, prefetch=2,
+                          kdims=[Dimension('x', range=(0, 10), step=2)])
+        dmap[8]
+        self.wait_for_prefetch(dmap)
+        self.assertEqual(sorted(self.calls), [(4, 0), (6, 0), (8, 0), (10, 0)])
+
+
+
 class StreamSubscribersAddandClear(ComparisonTestCase):
 
     def setUp(self):
@@ -1,7 +1,7 @@
 from collections import OrderedDict
 
 from holoviews.core import Dimension
-from holoviews.core.ndmapping import MultiDimensionalMapping, NdMapping
+from holoviews.core.ndmapping import MultiDimensionalMapping, NdMapping, sorted_context
 from holoviews.element.comparison import ComparisonTestCase
 from holoviews import HoloMap, Dataset
 import numpy as np
@@ -120,6 +120,29 @@ class NdIndexableMappingTest(ComparisonTestCase):
         ndmap = NdMapping(self.init_item_odict, kdims=[self.dim1, self.dim2])
         self.assertEqual(ndmap[:, 0.0:3.0].keys(), [(1, 2.0)])
 
+    def test_ndmapping_slice_multiple_dimensions(self):
+        ndmap = NdMapping([((i, j), (i, j)) for i in range(5) for j in range(5)],
+                          kdims=['x', 'y'])
+        self.assertEqual(ndmap[1:3, [0, 4]].keys(), [(1, 0), (1, 4), (2, 0), (2, 4)])
+
+    def test_ndmapping_slice_categorical(self):
+        ndmap = NdMapping([(k, k) for k in 'ABCD'],
+                          kdims=[Dimension('x', values=['D', 'C', 'B', 'A'])])
+        self.assertEqual(ndmap['C':'A'].keys(), ['C', 'B'])
+        self.assertEqual(ndmap[{'A', 'D'}].keys(), ['D', 'A'])
+
+    def test_ndmapping_slice_unsortable_keys(self):
+        ndmap = NdMapping([(1, 1), ('A', 'A')], kdims=['x'])
+        self.assertEqual(ndmap[lambda x: x != 1].keys(), ['A'])
+        self.assertEqual(ndmap[[1]].keys(), [1])
+
+    def test_ndmapping_slice_after_insertion(self):
+        ndmap = NdMapping([(k, k) for k in range(3)], kdims=['x'])
+        self.assertEqual(ndmap[1:].keys(), [1, 2])
+        ndmap[5] = 5
+        ndmap.pop(1)
+        self.assertEqual(ndmap[1:].keys(), [2, 5])
+
     def test_idxmapping_unsorted(self):
         data = [('B', 1), ('C', 2), ('A', 3)]
         ndmap = MultiDimensionalMapping(data, sort=False)
@@ -197,6 +220,75 @@ class NdIndexableMappingTest(ComparisonTestCase):
         ndmap.update({'A': nested2})
         self.assertEqual(ndmap['A'].data, nested_clone.data)
 
+    def test_setitem_sorted_insertion(self):
+        ndmap = MultiDimensionalMapping(kdims=[self.dim1])
+        for k in [3, 1, 4, 0, 5, 2]:
+            ndmap[k] = str(k)
+        self.assertEqual(ndmap.keys(), [0, 1, 2, 3, 4, 5])
+        self.assertEqual(ndmap.values(), ['0', '1', '2', '3', '4', '5'])
+
+    def test_setitem_sorted_insertion_categorical(self):
+        dim = Dimension('cat', values=['C', 'A', 'B'])
+        ndmap = MultiDimensionalMapping(kdims=[dim, self.dim1])
+        for k in [('A', 2), ('B', 0), ('C', 1), ('A', 1)]:
+            ndmap[k] = k
+        self.assertEqual(ndmap.keys(), [('C', 1), ('A', 1), ('A', 2), ('B', 0)])
+
+    def test_setitem_sorted_insertion_after_pop(self):
+        ndmap = MultiDimensionalMapping([(k, k) for k in range(5)])
+        ndmap.pop(0)
+        ndmap.pop(3)
+        ndmap[3] = 3
+        ndmap[-1] = -1
+        self.assertEqual(ndmap.keys(), [-1, 1, 2, 3, 4])
+
+    def test_setitem_sorted_insertion_pop_before_access(self):
+        ndmap = MultiDimensionalMapping(kdims=[self.dim1])
+        for k in [3, 1, 4, 0]:
+            ndmap[k] = k
+        ndmap.pop(1)
+        ndmap[2] = 2
+        self.assertEqual(ndmap.keys(), [0, 2, 3, 4])
+
+    def test_setitem_sorted_insertion_pickle(self):
+        import pickle
+        ndmap = MultiDimensionalMapping(kdims=[self.dim1])
+        for k in [3, 1, 2]:
+            ndmap[k] = k
+        unpickled = pickle.loads(pickle.dumps(ndmap))
+        self.assertEqual(unpickled.keys(), [1, 2, 3])
+        unpickled[0] = 0
+        self.assertEqual(unpickled.keys(), [0, 1, 2, 3])
+
+    def test_setitem_sorted_insertion_mixed_types(self):
+        ndmap = MultiDimensionalMapping([(1, 1), ('A', 'A')])
+        ndmap[0] = 0
+        ndmap['B'] = 'B'
+        self.assertEqual(ndmap.keys(), [0, 1, 'A', 'B'])
+
+    def test_init_sorted_keys(self):
+        ndmap = MultiDimensionalMapping([(k, k) for k in [3, 1, 2, 0]])
+        self.assertEqual(ndmap.keys(), [0, 1, 2, 3])
+        self.assertEqual(ndmap._sorted_keys[2], [(0,), (1,), (2,), (3,)])
+        ndmap[-1] = -1
+        self.assertEqual(ndmap.keys(), [-1, 0, 1, 2, 3])
+
+    def test_setitem_sorted_insertion_pending_pop(self):
+        ndmap = MultiDimensionalMapping([(k, k) for k in range(0, 10, 2)])
+        for k in [5, 1, 9]:
+            ndmap[k] = k
+        ndmap.pop(5)
+        ndmap.pop(4)
+        self.assertEqual(ndmap.keys(), [0, 1, 2, 6, 8, 9])
+
+    def test_setitem_unsorted_context(self):
+        ndmap = MultiDimensionalMapping([(k, k) for k in range(3)])
+        with sorted_context(False):
+            ndmap[-1] = -1
+        self.assertEqual(ndmap.keys(), [0, 1, 2, -1])
+        ndmap[5] = 5
+        self.assertEqual(ndmap.keys(), [-1, 0, 1, 2, 5])
+
 
 class HoloMapTest(ComparisonTestCase):
 
@@ -16,8 +16,9 @@ except:
 
 from holoviews.core.util import (
     sanitize_identifier_fn, find_range, max_range, wrap_tuple_streams,
-    deephash, merge_dimensions, get_path, make_path_unique, compute_density,
-    date_range, dt_to_int, compute_edges
+    deephash, fasthash, hashkey, merge_dimensions, get_path, make_path_unique, compute_density,
+    date_range, dt_to_int, compute_edges, factorize_array, group_partitions,
+    group_key, isin, sample_indices
 )
 from holoviews import Dimension, Element
 from holoviews.streams import PointerXY
@@ -137,6 +138,64 @@ class TestDeepHash(ComparisonTestCase):
         self.assertNotEqual(deephash(obj1), deephash(obj2))
 
 
+class TestFastHash(ComparisonTestCase):
+    """
+    Tests of fasthash function used for memoization.
+    """
+
+    def test_fasthash_list_equality(self):
+        self.assertEqual(fasthash([1,2,3]), fasthash([1,2,3]))
+
+    def test_fasthash_number_type_inequality(self):
+        self.assertNotEqual(fasthash((1,)), fasthash((1.0,)))
+
+    def test_fasthash_dict_equality(self):
+        self.assertEqual(fasthash({1:'a',2:'b'}), fasthash({2:'b', 1:'a'}))
+
+    def test_fasthash_dict_inequality(self):
+        self.assertNotEqual(fasthash({1:'a',2:'b'}), fasthash({2:'b', 1:'c'}))
+
+    def test_fasthash_numpy_equality(self):
+        self.assertEqual(fasthash(np.array([1,2,3])),
+                         fasthash(np.array([1,2,3])))
+
+    def test_fasthash_numpy_inequality(self):
+        self.assertNotEqual(fasthash(np.array([1,2,3])),
+                            fasthash(np.array([1,2,4])))
+
+    def test_fasthash_numpy_dtype_inequality(self):
+        self.assertNotEqual(fasthash(np.array([1,2,3], dtype='int32')),
+                            fasthash(np.array([1,2,3], dtype='int64')))
+
+    def test_fasthash_numpy_noncontiguous_equality(self):
+        arr = np.arange(10)
+        self.assertEqual(fasthash(arr[::2]), fasthash(np.arange(0, 10, 2)))
+
+    def test_fasthash_dataframe_equality(self):
+        if pd is None: raise SkipTest
+        self.assertEqual(fasthash(pd.DataFrame({'a':[1,2,3],'b':[4,5,6]})),
+                         fasthash(pd.DataFrame({'a':[1,2,3],'b':[4,5,6]})))
+
+    def test_fasthash_dataframe_inequality(self):
+        if pd is None: raise SkipTest
+        self.assertNotEqual(fasthash(pd.DataFrame({'a':[1,2,3],'b':[4,5,6]})),
+                            fasthash(pd.DataFrame({'a':[1,2,3],'b':[4,5,8]})))
+
+    def test_fasthash_unhashable(self):
+        self.assertIsNone(fasthash([1, object, bytearray(b'a')]))
+
+    def test_hashkey_equal_hashes_inequality(self):
+        self.assertEqual(hash(-1), hash(-2))
+        self.assertNotEqual(hashkey((-1,)), hashkey((-2,)))
+
+    def test_fasthash_nested_mixed_equality(self):
+        obj1 = [datetime.datetime(1,2,3), set([1,2,3]), np.array([1,2,3]),
+                {'a':'b', '1':True}, OrderedDict([(1,'a'),(2,'b')]), np.int64(34)]
+        obj2 = [datetime.datetime(1,2,3), set([1,2,3]), np.array([1,2,3]),
+                {'a':'b', '1':True}, OrderedDict([(1,'a'),(2,'b')]), np.int64(34)]
+        self.assertEqual(fasthash(obj1), fasthash(obj2))
+
+
 class TestAllowablePrefix(ComparisonTestCase):
     """
     Tests of allowable and hasprefix method.
@@ -638,3 +697,114 @@ class TestComputeEdges(ComparisonTestCase):
     def test_uneven_edges(self):
         self.assertEqual(compute_edges(self.array3),
                          np.array([0.5, 1.5, 3.0, 5.0]))
+
+
+class TestGroupPartitions(ComparisonTestCase):
+    """
+    Tests for the factorize_array and group_partitions functions.
+    """
+
+    def test_factorize_first_appearance_order(self):
+        codes, uniques = factorize_array(np.array([3, 1, 3, 2, 1]))
+        self.assertEqual(codes, np.array([0, 1, 0, 2, 1]))
+        self.assertEqual(uniques, np.array([3, 1, 2]))
+
+    def test_factorize_unorderable_objects(self):
+        codes, uniques = factorize_array(np.array(['A', None, 'A', 1], dtype=object))
+        self.assertEqual(codes, np.array([0, 1, 0, 2]))
+        self.assertEqual(list(uniques), ['A', None, 1])
+
+    def test_factorize_merges_nans(self):
+        codes, uniques = factorize_array(np.array([np.nan, 1, np.nan, 0]))
+        self.assertEqual(codes, np.array([0, 1, 0, 2]))
+        self.assertEqual(uniques, np.array([np.nan, 1, 0]))
+
+    def test_group_key_normalizes_datetimes_and_nans(self):
+        key = group_key((np.datetime64('2017-01-01', 'D'), np.nan))
+        self.assertEqual(key, (np.datetime64('2017-01-01', 'ns'), None))
+        self.assertEqual(hash(key), hash((np.datetime64('2017-01-01', 'ns'), None)))
+
+    def test_group_partitions_single_array(self):
+        keys, order, slices = group_partitions([np.array(['b', 'a', 'b', 'c'])])
+        self.assertEqual(keys, [('b',), ('a',), ('c',)])
+        self.assertEqual([order[s] for s in slices],
+                         [np.array([0, 2]), np.array([1]), np.array([3])])
+
+    def test_group_partitions_multiple_arrays(self):
+        keys, order, slices = group_partitions([np.array([1, 2, 1, 1]),
+                                                np.array([0, 0, 0, 1])])
+        self.assertEqual(keys, [(1, 0), (2, 0), (1, 1)])
+        self.assertEqual([order[s] for s in slices],
+                         [np.array([0, 2]), np.array([1]), np.array([3])])
+
+    def test_group_partitions_empty(self):
+        keys, order, slices = group_partitions([np.array([])])
+        self.assertEqual(keys, [])
+        self.assertEqual(slices, [])
+
+    def test_group_partitions_no_arrays(self):
+        keys, order, slices = group_partitions([])
+        self.assertEqual(keys, [()])
+        self.assertEqual(slices, [slice(None)])
+
+
+class TestIsIn(ComparisonTestCase):
+    """
+    Tests for the vectorized isin membership function.
+    """
+
+    def test_isin_numeric(self):
+        self.assertEqual(isin(np.array([1, 2, 3.]), [2, 3]),
+                         np.array([False, True, True]))
+
+    def test_isin_empty_values(self):
+        self.assertEqual(isin(np.array([1, 2, 3]), []),
+                         np.array([False, False, False]))
+
+    def test_isin_strings_mixed_values(self):
+        self.assertEqual(isin(np.array(['a', '1', 'b']), [1, 'a']),
+                         np.array([True, False, False]))
+
+    def test_isin_object_array(self):
+        self.assertEqual(isin(np.array(['a', None, 3], dtype=object), {'a', 3}),
+                         np.array([True, False, True]))
+
+    def test_isin_datetime(self):
+        dates = np.array(['2017-01-01', '2017-01-02'], dtype='datetime64[ns]')
+        self.assertEqual(isin(dates, [np.datetime64('2017-01-02')]),
+                         np.array([False, True]))
+
+    def test_isin_2d(self):
+        self.assertEqual(isin(np.arange(6).reshape(2, 3), {1, 5}),
+                         np.array([[False, True, False], [False, False, True]]))
+
+    def test_isin_many_values(self):
+        values = np.arange(100000)
+        mask = isin(values, list(range(0, 100000, 2)))
+        self.assertEqual(mask, values % 2 == 0)
+
+
+class TestSampleIndices(ComparisonTestCase):
+    """
+    Tests for the join of sample coordinates against key arrays.
+    """
+
+    def test_sample_indices_sample_order(self):
+        xs = np.array([0, 1, 2, 3, 4, 5, 1])
+        self.assertEqual(sample_indices([xs], [5, 1, 9, 1]), np.array([5, 1, 6]))
+
+    def test_sample_indices_multiple_arrays(self):
+        xs, ys = np.array([0, 1, 2, 0]), np.array(['a', 'b', 'c', 'b'])
+        self.assertEqual(sample_indices([xs, ys], [(0, 'b'), (1, 'a'), (0, 'a')]),
+                         np.array([3, 0]))
+
+    def test_sample_indices_partial_coordinates(self):
+        xs, ys = np.array([0, 1, 2, 0]), np.array(['a', 'b', 'c', 'b'])
+        self.assertEqual(sample_indices([xs, ys], [(0,), (2,)]), np.array([0, 3, 2]))
+
+    def test_sample_indices_object_array(self):
+        values = np.array(['a', 1, None], dtype=object)
+        self.assertEqual(sample_indices([values], [1, None, 'a']), np.array([1, 2, 0]))
+
+    def test_sample_indices_no_samples(self):
+        self.assertEqual(sample_indices([np.arange(3)], []), np.array([], dtype=np.int64))
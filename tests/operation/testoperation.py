@@ -38,6 +38,47 @@ class OperationTests(ComparisonTestCase):
         op_hmap = operation(hmap, op=lambda x, k: x.clone(x.data*2))
         self.assertEqual(op_hmap.last, hmap.last.clone(hmap.last.data*2, group='Operation'))
 
+    def test_operation_holomap_thread_executor(self):
+        hmap = HoloMap({i: Curve(np.random.rand(10)) for i in range(10)})
+        op = lambda x, k: x.clone(x.data*2)
+        op_hmap = operation(hmap, op=op, executor='thread', max_workers=4)
+        self.assertEqual(op_hmap.keys(), hmap.keys())
+        self.assertEqual(op_hmap, operation(hmap, op=op))
+
+    def test_operation_holomap_process_executor(self):
+        hmap = HoloMap({i: Curve([(0, i), (1, i+1), (2, i)]) for i in range(4)})
+        interpolated = interpolate_curve(hmap, interpolation='steps-mid',
+                                         executor='process', max_workers=2)
+        self.assertEqual(interpolated, interpolate_curve(hmap, interpolation='steps-mid'))
+
+    def test_operation_holomap_executor_error(self):
+        def op(x, k):
+            if k == 3:
+                raise ValueError('Frame failed')
+            return x
+        hmap = HoloMap({i: Curve(np.random.rand(10)) for i in range(5)})
+        with self.assertRaisesRegexp(ValueError, 'Frame failed') as cm:
+            operation(hmap, op=op, executor='thread')
+        self.assertEqual(cm.exception.key, 3)
+
+    def test_operation_holomap_process_executor_unpicklable(self):
+        hmap = HoloMap({i: Curve(np.random.rand(10)) for i in range(4)})
+        op = lambda x, k: x.clone(x.data*2)
+        op_hmap = operation(hmap, op=op, executor='process', max_workers=2)
+        self.assertEqual(op_hmap, operation(hmap, op=op))
+
+    def test_operation_holomap_process_pool_unpicklable(self):
+        from concurrent.futures import ProcessPoolExecutor
+        hmap = HoloMap({i: Curve(np.random.rand(10)) for i in range(2)})
+        with ProcessPoolExecutor(1) as pool:
+            with self.assertRaisesRegexp(ValueError, 'cannot be pickled'):
+                operation(hmap, op=lambda x, k: x, executor=pool)
+
+    def test_operation_holomap_invalid_executor(self):
+        hmap = HoloMap({i: Curve(np.random.rand(10)) for i in range(2)})
+        with self.assertRaises(ValueError):
+            operation(hmap, op=lambda x, k: x, executor='gpu')
+
     def test_image_transform(self):
         img = Image(np.random.rand(10, 10))
         op_img = transform(img, operator=lambda x: x*2)
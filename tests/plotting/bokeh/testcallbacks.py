@@ -11,6 +11,7 @@ from holoviews.streams import (PointDraw, PolyDraw, PolyEdit, BoxEdit,
                                PointerXY, PointerX)
 
 try:
+    from bokeh.document import Document
     from bokeh.models import PolyEditTool
     from holoviews.plotting.bokeh.callbacks import (
         Callback, PointDrawCallback, PolyDrawCallback, PolyEditCallback,
@@ -61,6 +62,38 @@ class TestCallbacks(ComparisonTestCase):
 
 
 
+class TestServerDeferredTriggers(ComparisonTestCase):
+
+    def setUp(self):
+        if not bokeh_renderer:
+            raise SkipTest("Bokeh required to test server callbacks")
+        self.doc = Document()
+        self.doc._session_context = object() # Mock a server session
+        self.calls = []
+        self.stream = PointerX(x=0, throttle=10, subscribers=[
+            lambda **kwargs: self.calls.append(kwargs)])
+
+    def events(self, *values):
+        for x in values:
+            self.doc._with_self_as_curdoc(lambda x=x: self.stream.event(x=x))
+
+    def test_throttled_trigger_scheduled_on_document(self):
+        self.events(1, 2, 3)
+        self.assertEqual(self.calls, [{'x': 1}])
+        callbacks = list(self.doc.session_callbacks)
+        self.assertEqual(len(callbacks), 1)
+        callbacks[0].callback()
+        self.assertEqual(self.calls, [{'x': 1}, {'x': 3}])
+        self.assertEqual(self.stream.coalesced, 1)
+
+    def test_throttled_trigger_outside_server_session(self):
+        self.doc._session_context = None
+        self.events(1, 2)
+        self.assertEqual(self.calls, [{'x': 1}, {'x': 2}])
+        self.assertEqual(len(self.doc.session_callbacks), 0)
+
+
+
 class TestEditToolCallbacks(ComparisonTestCase):
 
     def setUp(self):
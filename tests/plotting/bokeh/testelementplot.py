@@ -2,7 +2,7 @@ from nose.plugins.attrib import attr
 
 import numpy as np
 
-from holoviews.core import Dimension, DynamicMap
+from holoviews.core import Dimension, DynamicMap, HoloMap
 from holoviews.element import Curve, Image
 from holoviews.streams import Stream
 
@@ -66,6 +66,50 @@ class TestElementPlot(TestBokehPlot):
         self.assertEqual(source.data['image'][0].mean(), 2)
         self.assertNotIn(source, plot.current_handles)
 
+    def _datasource_update(self, hmap, key):
+        """
+        Plots the first frame of the HoloMap and updates it to the
+        supplied key, returning the plot and the change in the
+        datasource_stats.
+        """
+        plot = bokeh_renderer.get_plot(hmap, doc=Document())
+        before = dict(plot.datasource_stats)
+        plot.update(key)
+        stats = {k: v-before[k] for k, v in plot.datasource_stats.items()}
+        return plot, stats
+
+    def test_datasource_patch_changed_rows(self):
+        ys = np.arange(10.)
+        changed = ys.copy()
+        changed[2:4] = [-1, -2]
+        hmap = HoloMap({0: Curve(ys), 1: Curve(changed)})
+        plot, stats = self._datasource_update(hmap, (1,))
+        self.assertEqual(plot.handles['source'].data['y'], changed)
+        self.assertEqual(hmap[0].dimension_values(1), ys)
+        self.assertEqual(stats, dict(sent=16, saved=144, patched=1, streamed=0))
+
+    def test_datasource_stream_appended_rows(self):
+        hmap = HoloMap({0: Curve(np.arange(5.)), 1: Curve(np.arange(8.))})
+        plot, stats = self._datasource_update(hmap, (1,))
+        source = plot.handles['source']
+        self.assertEqual(source.data['x'], np.arange(8))
+        self.assertEqual(source.data['y'], np.arange(8.))
+        self.assertEqual(stats['streamed'], 1)
+        self.assertEqual(stats['sent'], 48)
+
+    def test_datasource_replace_resized_columns(self):
+        hmap = HoloMap({0: Curve(np.arange(5.)), 1: Curve(np.arange(3.)+1)})
+        plot, stats = self._datasource_update(hmap, (1,))
+        self.assertEqual(plot.handles['source'].data['y'], np.arange(3.)+1)
+        self.assertEqual(stats['saved'], 0)
+
+    def test_datasource_unchanged_columns_not_sent(self):
+        xs = np.arange(10.)
+        hmap = HoloMap({0: Curve((xs, xs)), 1: Curve((xs, -xs))})
+        plot, stats = self._datasource_update(hmap, (1,))
+        self.assertEqual(plot.handles['source'].data['y'], -xs)
+        self.assertEqual(stats, dict(sent=80, saved=80, patched=0, streamed=0))
+
     @attr(optional=1)  # Requires Flexx
     def test_element_formatter_xaxis(self):
         def formatter(x):
@@ -2,7 +2,8 @@ import numpy as np
 
 from holoviews.core import NdOverlay, HoloMap, DynamicMap
 from holoviews.core.options import Cycle
-from holoviews.element import Curve, Points, ErrorBars, Text
+from holoviews.element import (Curve, Points, ErrorBars, Text, Spikes,
+                               Histogram, Area)
 
 from .testplot import TestBokehPlot, bokeh_renderer
 
@@ -164,3 +165,65 @@ class TestOverlayPlot(TestBokehPlot):
         self.assertEqual(len(plot.subplots), 3)
         for i, subplot in enumerate(plot.subplots.values()):
             self.assertEqual(subplot.cyclic_index, i)
+
+    def test_batched_spikes_per_layer_position(self):
+        overlay = NdOverlay({i: Spikes([i, i+1]).opts(plot=dict(position=i))
+                             for i in range(2)}).opts(plot=dict(legend_limit=0))
+        plot = bokeh_renderer.get_plot(overlay).subplots[()]
+        source = plot.handles['source']
+        self.assertTrue(plot.batched)
+        self.assertEqual(source.data['x'], np.array([0, 1, 1, 2]))
+        self.assertEqual(source.data['y0'], np.array([0, 0, 1, 1]))
+        self.assertEqual(source.data['y1'], np.array([0.5, 0.5, 1.5, 1.5]))
+
+    def test_batched_histogram_fill_color(self):
+        overlay = NdOverlay({i: Histogram(([0, 1, 2], [i, i+1]))
+                             for i in range(2)}).opts(plot=dict(legend_limit=0))
+        plot = bokeh_renderer.get_plot(overlay).subplots[()]
+        source = plot.handles['source']
+        self.assertEqual(plot.handles['glyph'].fill_color, {'field': 'fill_color'})
+        self.assertEqual(source.data['top'], np.array([0, 1, 1, 2]))
+        self.assertEqual(source.data['left'], np.array([0, 1, 0, 1]))
+        self.assertEqual(source.data['fill_color'],
+                         np.array(['#30a2da', '#30a2da', '#fc4f30', '#fc4f30']))
+
+    def test_batched_errorbars_segments(self):
+        opts = {'NdOverlay': dict(plot=dict(legend_limit=0)),
+                'ErrorBars': dict(style=dict(color=Cycle(values=['red', 'blue'])))}
+        overlay = NdOverlay({i: ErrorBars([(0, i, 1), (1, i, 2)])
+                             for i in range(2)}).opts(opts)
+        plot = bokeh_renderer.get_plot(overlay).subplots[()]
+        source, glyph = plot.handles['source'], plot.handles['glyph']
+        self.assertEqual(glyph.x0, 'base0')
+        self.assertEqual(glyph.x1, 'base1')
+        self.assertEqual(glyph.y0, 'lower')
+        self.assertEqual(glyph.y1, 'upper')
+        self.assertEqual(source.data['base0'], np.array([0, 1, -0.2, 0.8, -0.2, 0.8]*2))
+        self.assertEqual(source.data['base1'], np.array([0, 1, 0.2, 1.2, 0.2, 1.2]*2))
+        self.assertEqual(source.data['lower'], np.array([-1, -2, -1, -2, 1, 2,
+                                                         0, -1, 0, -1, 2, 3]))
+        self.assertEqual(source.data['upper'], np.array([1, 2, -1, -2, 1, 2,
+                                                         2, 3, 0, -1, 2, 3]))
+        self.assertEqual(source.data['color'], np.array(['red']*6+['blue']*6))
+
+    def test_batched_errorbars_without_heads(self):
+        opts = {'NdOverlay': dict(plot=dict(legend_limit=0)),
+                'ErrorBars': dict(style=dict(lower_head=None, upper_head=None))}
+        overlay = NdOverlay({i: ErrorBars([(0, i, 1), (1, i, 2)])
+                             for i in range(2)}).opts(opts)
+        plot = bokeh_renderer.get_plot(overlay).subplots[()]
+        source = plot.handles['source']
+        self.assertEqual(source.data['base0'], np.array([0, 1, 0, 1]))
+        self.assertEqual(source.data['lower'], np.array([-1, -2, 0, -1]))
+        self.assertEqual(source.data['upper'], np.array([1, 2, 2, 3]))
+
+    def test_batched_area_patches(self):
+        overlay = NdOverlay({i: Area([i, i+1])
+                             for i in range(2)}).opts(plot=dict(legend_limit=0))
+        plot = bokeh_renderer.get_plot(overlay).subplots[()]
+        source, glyph = plot.handles['source'], plot.handles['glyph']
+        self.assertEqual(glyph.xs, 'x')
+        self.assertEqual(glyph.ys, 'y')
+        self.assertEqual(len(source.data['x']), 2)
+        self.assertEqual(source.data['y'][1], np.array([0, 0, 1, 2]))
+        self.assertEqual(source.data['fill_color'], ['#30a2da', '#fc4f30'])
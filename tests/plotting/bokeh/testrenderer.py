@@ -6,7 +6,8 @@ from nose.plugins.attrib import attr
 
 import numpy as np
 
-from holoviews import HoloMap, Image, GridSpace, Table, Curve, Store
+from holoviews import HoloMap, DynamicMap, Image, GridSpace, Table, Curve, Store
+from holoviews.streams import Buffer
 from holoviews.element.comparison import ComparisonTestCase
 
 try:
@@ -79,3 +80,27 @@ class BokehRendererTest(ComparisonTestCase):
         png, info = renderer(curve)
         self.assertIsInstance(png, bytes)
         self.assertEqual(info['file-ext'], 'png')
+
+    def test_render_binary_arrays(self):
+        curve = Curve((np.arange(10), np.arange(10.)))
+        renderer = BokehRenderer.instance(binary_arrays=True,
+                                          array_dtypes={'float64': 'float32'})
+        plot = renderer.get_plot(curve)
+        data = plot.handles['source'].data
+        self.assertEqual(data['x'].dtype, np.uint8)
+        self.assertEqual(data['y'].dtype, np.float32)
+        html, _ = renderer(curve)
+        self.assertIn('"dtype":"float32"', html)
+
+    def test_render_binary_arrays_streaming(self):
+        buff = Buffer({'x': np.arange(3), 'y': np.arange(3)})
+        dmap = DynamicMap(Curve, streams=[buff])
+        renderer = BokehRenderer.instance(binary_arrays=True)
+        source = renderer.get_plot(dmap).handles['source']
+        self.assertEqual(source.data['x'].dtype, np.uint8)
+        buff.send({'x': np.array([1000]), 'y': np.array([3])})
+        self.assertEqual(source.data['x'], np.array([0, 1, 2, 1000]))
+        self.assertEqual(source.data['x'].dtype, np.uint16)
+        buff.send({'x': np.array([4]), 'y': np.array([4])})
+        self.assertEqual(source.data['x'], np.array([0, 1, 2, 1000, 4]))
+        self.assertEqual(source.data['x'].dtype, np.uint16)
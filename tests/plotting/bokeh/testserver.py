@@ -1,10 +1,12 @@
+import sys
+from functools import partial
 from unittest import SkipTest
 
 from holoviews.core.spaces import DynamicMap
 from holoviews.core.options import Store
 from holoviews.element import Curve, Polygons, Path, HLine
 from holoviews.element.comparison import ComparisonTestCase
-from holoviews.streams import RangeXY, PlotReset
+from holoviews.streams import RangeXY, PlotReset, Stream
 
 try:
     from bokeh.application.handlers import FunctionHandler
@@ -22,6 +24,20 @@ try:
 except:
     bokeh_renderer = None
 
+# Coroutine functions are declared using exec because async syntax
+# is not valid on Python 2
+async_namespace = {}
+if sys.version_info >= (3, 6):
+    exec("""
+import asyncio
+from holoviews.element import Curve
+
+async def async_curve(x, calls):
+    calls.append(x)
+    await asyncio.sleep(0)
+    return Curve([(0, x)])
+""", async_namespace)
+
 
 class TestBokehServerSetup(ComparisonTestCase):
 
@@ -78,6 +94,82 @@ class TestBokehServerSetup(ComparisonTestCase):
 
 
 
+class TestBokehServerRefresh(ComparisonTestCase):
+
+    def setUp(self):
+        self.previous_backend = Store.current_backend
+        if not bokeh_renderer:
+            raise SkipTest("Bokeh required to test plot instantiation")
+        elif 'async_curve' not in async_namespace:
+            raise SkipTest('Asynchronous callbacks require Python >= 3.6')
+        import asyncio
+        Store.current_backend = 'bokeh'
+        self.loop = asyncio.new_event_loop()
+        self.calls = []
+        self.stream = Stream.define('X', x=0)()
+        callback = partial(async_namespace['async_curve'], calls=self.calls)
+        self.dmap = DynamicMap(callback, streams=[self.stream])
+
+    def tearDown(self):
+        Store.current_backend = self.previous_backend
+        Callback._callbacks = {}
+        self.loop.close()
+
+    def get_plot(self):
+        plot = bokeh_renderer.get_plot(self.dmap, doc=Document())
+        refreshes = []
+        trigger_refresh = plot._trigger_refresh
+        def record(key):
+            refreshes.append(key)
+            trigger_refresh(key)
+        plot._trigger_refresh = record
+        return plot, refreshes
+
+    def run_events(self, *values):
+        "Triggers events with the supplied values on a running event loop"
+        import asyncio
+        for x in values:
+            self.loop.call_soon(lambda x=x: self.stream.event(x=x))
+        self.loop.run_until_complete(asyncio.sleep(0.01))
+
+    def run_document_callbacks(self, doc):
+        for cb in doc.session_callbacks:
+            cb.callback()
+
+    def test_schedule_refresh_without_loop(self):
+        plot, refreshes = self.get_plot()
+        self.assertFalse(plot._schedule_refresh((None,)))
+        self.assertEqual(self.calls, [0])
+
+    def test_schedule_refresh_applied_on_next_tick(self):
+        plot, refreshes = self.get_plot()
+        self.run_events(1)
+        self.assertEqual(self.calls, [0, 1])
+        self.assertEqual(refreshes, [])
+        self.assertEqual(len(plot.document.session_callbacks), 1)
+        self.run_document_callbacks(plot.document)
+        self.assertEqual(len(refreshes), 1)
+        self.assertEqual(plot.handles['source'].data['y'], [1])
+        self.assertEqual(self.calls, [0, 1])
+
+    def test_schedule_refresh_superseded(self):
+        plot, refreshes = self.get_plot()
+        self.run_events(1, 2)
+        self.assertEqual(self.calls, [0, 2])
+        self.run_document_callbacks(plot.document)
+        self.assertEqual(len(refreshes), 1)
+        self.assertEqual(plot.handles['source'].data['y'], [2])
+
+    def test_apply_refresh_outside_server(self):
+        plot, refreshes = self.get_plot()
+        plot.renderer = plot.renderer.instance(mode='default')
+        applied = []
+        plot._apply_refresh(lambda: applied.append(True))
+        self.assertEqual(applied, [True])
+        self.assertEqual(len(plot.document.session_callbacks), 0)
+
+
+
 class TestBokehServerRun(ComparisonTestCase):
 
     def setUp(self):
@@ -1,11 +1,15 @@
 from unittest import SkipTest
 from nose.plugins.attrib import attr
-from holoviews.core import Store
+
+import numpy as np
+
+from holoviews.core import Dimension, Store
 from holoviews.element.comparison import ComparisonTestCase
 
 try:
     from holoviews.plotting.bokeh.util import (
-        expand_batched_style, filter_batched_data )
+        expand_batched_style, filter_batched_data, compact_array,
+        categorize_array, convert_datetime)
     bokeh_renderer = Store.renderers['bokeh']
 except:
     bokeh_renderer = None
@@ -78,3 +82,69 @@ class TestBokehUtilsInstantiation(ComparisonTestCase):
         filter_batched_data(data, mapping)
         self.assertEqual(data, {'line_color': ['red', 'red', 'blue']})
         self.assertEqual(mapping, {'line_color': {'field': 'line_color'}})
+
+    def test_compact_array_int64_smallest_type(self):
+        self.assertEqual(compact_array(np.arange(10)).dtype, np.uint8)
+        self.assertEqual(compact_array(np.arange(-1, 1000)).dtype, np.int16)
+        self.assertEqual(compact_array(np.array([0, 2**40])).dtype, np.int64)
+
+    def test_compact_array_min_dtype(self):
+        array = compact_array(np.arange(10), min_dtype=np.dtype('int16'))
+        self.assertEqual(array.dtype, np.int16)
+        array = compact_array(np.arange(1000), min_dtype=np.dtype('uint8'))
+        self.assertEqual(array.dtype, np.uint16)
+
+    def test_compact_array_numeric_list(self):
+        array = compact_array([0.5, 1.5])
+        self.assertIsInstance(array, np.ndarray)
+        self.assertEqual(array, np.array([0.5, 1.5]))
+
+    def test_compact_array_string_list_unchanged(self):
+        self.assertEqual(compact_array(['A', 'B']), ['A', 'B'])
+
+    def test_compact_array_downcast_dtypes(self):
+        array = compact_array(np.array([0.5, 1.5]), {'float64': 'float32'})
+        self.assertEqual(array.dtype, np.float32)
+
+    def test_compact_array_ragged_list(self):
+        arrays = compact_array([np.arange(3), np.arange(300)])
+        self.assertEqual([a.dtype for a in arrays], [np.uint8, np.uint16])
+
+    def test_categorize_array_ints(self):
+        labels = categorize_array(np.array([3, 1, 3]), Dimension('x'))
+        self.assertEqual(labels, np.array(['3', '1', '3']))
+
+    def test_categorize_array_value_format(self):
+        dim = Dimension('x', value_format=lambda x: '%.1f' % x)
+        labels = categorize_array(np.array([0.25, 1, 0.25]), dim)
+        self.assertEqual(labels, np.array(['0.2', '1.0', '0.2']))
+
+    def test_categorize_array_bytes(self):
+        labels = categorize_array(np.array([b'A', b'B']), Dimension('x'))
+        self.assertEqual(labels, np.array(['A', 'B']))
+
+    def test_categorize_array_objects(self):
+        labels = categorize_array(np.array([1, 'A', None], dtype=object), Dimension('x'))
+        self.assertEqual(list(labels), ['1', 'A', 'None'])
+
+    def test_categorize_array_datetimes(self):
+        dates = np.array(['2017-01-01', '2017-01-02'], dtype='datetime64[ns]')
+        dim = Dimension('x', type=np.datetime64)
+        labels = categorize_array(dates, dim)
+        self.assertEqual(list(labels), [dim.pprint_value(d) for d in dates])
+
+    def test_convert_datetime_ms_precision_nat(self):
+        dates = np.array(['1970-01-01T00:00:01.5', 'NaT'], dtype='datetime64[ns]')
+        converted = convert_datetime(dates)
+        self.assertEqual(converted[0], 1500.)
+        self.assertTrue(np.isnan(converted[1]))
+
+    def test_convert_datetime_scalar(self):
+        converted = convert_datetime(np.datetime64('1970-01-01T00:00:01.5'))
+        self.assertIsInstance(converted, float)
+        self.assertEqual(converted, 1500.)
+
+    def test_categorize_array_nans(self):
+        values, dim = np.array([1., np.nan, 2., np.nan]), Dimension('x')
+        labels = categorize_array(values, dim)
+        self.assertEqual(list(labels), [dim.pprint_value(v) for v in values])
@@ -1,3 +1,4 @@
+import json
 from unittest import SkipTest
 
 import numpy as np
@@ -10,6 +11,7 @@ from holoviews.element.comparison import ComparisonTestCase
 try:
     from holoviews.plotting.bokeh.widgets import BokehServerWidgets
     from bokeh.models.widgets import Select, Slider, AutocompleteInput, TextInput, Div
+    from bokeh.document import Document
     bokeh_renderer = renderer('bokeh')
 except:
     BokehServerWidgets = None
@@ -373,3 +375,17 @@ class TestSelectionWidget(ComparisonTestCase):
         hmap = HoloMap({chr(65+i): Curve([1, 2, 3]) for i in range(10)}, dim)
         with self.assertRaises(ValueError):
             bokeh_renderer.get_widget(hmap, 'widgets').get_widgets()
+
+    def test_embedded_frames_patch_relative_to_first_frame(self):
+        hmap = HoloMap({i: Curve([1, 2, i % 3]) for i in range(6)})
+        widget = bokeh_renderer.get_widget(hmap, 'widgets')
+        widget.renderer.components(widget.plot, comm=False)
+        client = Document.from_json(widget.plot.document.to_json())
+        frames = {k: json.loads(v) for k, v in
+                  json.loads(widget.get_frames()).items()}
+        self.assertEqual(frames['0']['content']['events'], [])
+        source = client.get_model_by_id(widget.plot.handles['source']._id)
+        for idx in [4, 1, 3, 0, 5, 2]:
+            client.apply_json_patch(frames['base']['content'])
+            client.apply_json_patch(frames[str(idx)]['content'])
+            self.assertEqual(np.asarray(source.data['y']), np.array([1, 2, idx % 3]))
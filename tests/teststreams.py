@@ -1,6 +1,7 @@
 """
 Unit test of the streams system
 """
+from unittest import SkipTest
 from collections import defaultdict
 
 import param
@@ -230,6 +231,103 @@ class TestSubscribers(ComparisonTestCase):
         self.assertEqual(subscriber2.call_count, 1)
 
 
+class TestThrottledSubscribers(ComparisonTestCase):
+
+    def setUp(self):
+        try:
+            import asyncio
+        except ImportError:
+            raise SkipTest('Deferred triggers require asyncio')
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def run_events(self, events, delay=0.2):
+        "Calls the events on a running event loop and waits for the delay"
+        import asyncio
+        self.loop.call_soon(events)
+        self.loop.run_until_complete(asyncio.sleep(delay))
+
+    def test_throttle_first_event_immediate(self):
+        subscriber = TestSubscriber()
+        position = PointerX(subscribers=[subscriber], throttle=0.05)
+        position.event(x=1)
+        self.assertEqual(subscriber.kwargs, dict(x=1))
+        self.assertEqual(subscriber.call_count, 1)
+
+    def test_throttle_without_event_loop_immediate(self):
+        subscriber = TestSubscriber()
+        position = PointerX(subscribers=[subscriber], throttle=0.05, debounce=0.05)
+        for i in range(3):
+            position.event(x=i)
+        self.assertEqual(subscriber.kwargs, dict(x=2))
+        self.assertEqual(subscriber.call_count, 3)
+
+    def test_throttle_coalesces_events(self):
+        subscriber = TestSubscriber()
+        position = PointerX(subscribers=[subscriber], throttle=0.05)
+        counts = []
+        def events():
+            for i in range(5):
+                position.event(x=i)
+            counts.append(subscriber.call_count)
+        self.run_events(events)
+        self.assertEqual(counts, [1])
+        self.assertEqual(subscriber.kwargs, dict(x=4))
+        self.assertEqual(subscriber.call_count, 2)
+        self.assertEqual(position.coalesced, 3)
+
+    def test_throttle_merges_pending_trigger(self):
+        subscriberX, subscriberY = TestSubscriber(), TestSubscriber()
+        positionX = PointerX(subscribers=[subscriberX], throttle=0.05)
+        positionY = PointerY(subscribers=[subscriberY])
+        def events():
+            positionX.event(x=1)
+            positionX.event(x=2)
+            positionY.update(y=3)
+            Stream.trigger([positionX, positionY])
+        self.run_events(events)
+        self.assertEqual(subscriberX.kwargs, dict(x=2, y=3))
+        self.assertEqual(subscriberX.call_count, 2)
+        self.assertEqual(subscriberY.kwargs, dict(x=2, y=3))
+        self.assertEqual(subscriberY.call_count, 1)
+
+    def test_debounce_coalesces_events(self):
+        subscriber = TestSubscriber()
+        position = PointerX(subscribers=[subscriber], debounce=0.05)
+        counts = []
+        def events():
+            for i in range(5):
+                position.event(x=i)
+            counts.append(subscriber.call_count)
+        self.run_events(events)
+        self.assertEqual(counts, [0])
+        self.assertEqual(subscriber.kwargs, dict(x=4))
+        self.assertEqual(subscriber.call_count, 1)
+        self.assertEqual(position.coalesced, 4)
+
+    def test_debounce_batch_subscriber(self):
+        subscriber = TestSubscriber()
+        positionX = PointerX(subscribers=[subscriber], debounce=0.05)
+        positionY = PointerY(subscribers=[subscriber])
+        counts = []
+        def events():
+            positionX.update(x=5)
+            positionY.update(y=10)
+            Stream.trigger([positionX, positionY])
+            counts.append(subscriber.call_count)
+        self.run_events(events)
+        self.assertEqual(counts, [0])
+        self.assertEqual(subscriber.kwargs, dict(x=5, y=10))
+        self.assertEqual(subscriber.call_count, 1)
+
+    def test_throttle_rename_preserved(self):
+        position = PointerX(throttle=0.05, debounce=0.1).rename(x='x1')
+        self.assertEqual(position.throttle, 0.05)
+        self.assertEqual(position.debounce, 0.1)
+
+
 class TestStreamSource(ComparisonTestCase):
 
     def tearDown(self):
@@ -490,3 +588,68 @@ class TestBufferStream(ComparisonTestCase):
         error = "Input expected to have columns \['x', 'y'\], got \['x'\]"
         with self.assertRaisesRegexp(IndexError, error):
             buff.send(pd.DataFrame({'x': np.array([2])}))
+
+    # Circular buffers
+
+    def test_buffer_array_wraps_around(self):
+        buff = Buffer(np.array([[0, 1]]), length=3)
+        for i in range(1, 5):
+            buff.send(np.array([[i, i+1]]))
+        self.assertEqual(buff.data, np.array([[2, 3], [3, 4], [4, 5]]))
+
+    def test_buffer_dict_wraps_around_chunks(self):
+        buff = Buffer({'x': np.array([0]), 'y': np.array([0])}, length=4)
+        buff.send({'x': np.array([1, 2]), 'y': np.array([2, 4])})
+        buff.send({'x': np.array([3, 4, 5]), 'y': np.array([6, 8, 10])})
+        self.assertEqual(buff.data, {'x': np.array([2, 3, 4, 5]),
+                                     'y': np.array([4, 6, 8, 10])})
+        self.assertEqual(buff._chunk_length, 3)
+
+    def test_buffer_dframe_wraps_around(self):
+        data = pd.DataFrame({'x': np.array([0]), 'y': np.array([0.])})
+        buff = Buffer(data, length=2, index=False)
+        for i in range(1, 4):
+            buff.send(pd.DataFrame({'x': np.array([i]), 'y': np.array([i/2.])}, index=[i]))
+        expected = pd.DataFrame({'x': np.array([2, 3]), 'y': np.array([1., 1.5])}, index=[2, 3])
+        self.assertEqual(buff.data, expected)
+
+    def test_buffer_upcasts_dtype(self):
+        buff = Buffer({'x': np.array([0, 1])})
+        buff.send({'x': np.array([0.5])})
+        self.assertEqual(buff.data, {'x': np.array([0, 1, 0.5])})
+
+    def test_buffer_data_materialized_once(self):
+        buff = Buffer({'x': np.array([0])})
+        buff.send({'x': np.array([1])})
+        self.assertIs(buff.data, buff.data)
+
+    def test_buffer_data_not_mutated_by_send(self):
+        buff = Buffer({'x': np.array([0])}, length=2)
+        buff.send({'x': np.array([1])})
+        data = buff.data
+        buff.send({'x': np.array([2])})
+        self.assertEqual(data, {'x': np.array([0, 1])})
+        self.assertEqual(buff.data, {'x': np.array([1, 2])})
+
+    def test_buffer_chunk_length_accumulates_throttled_sends(self):
+        subscriber = TestSubscriber()
+        try:
+            import asyncio
+        except ImportError:
+            raise SkipTest('Deferred triggers require asyncio')
+        buff = Buffer({'x': np.array([0])}, subscribers=[subscriber], throttle=0.05)
+        chunk_lengths = []
+        def events():
+            buff.send({'x': np.array([1])})
+            buff.send({'x': np.array([2, 3])})
+            buff.send({'x': np.array([4])})
+            chunk_lengths.append(buff._chunk_length)
+        loop = asyncio.new_event_loop()
+        try:
+            loop.call_soon(events)
+            loop.run_until_complete(asyncio.sleep(0.2))
+        finally:
+            loop.close()
+        self.assertEqual(chunk_lengths, [3])
+        self.assertEqual(subscriber.call_count, 2)
+        self.assertEqual(subscriber.kwargs['data'], {'x': np.array([0, 1, 2, 3, 4])})